@@ -0,0 +1,229 @@
+
+################################################################################
+# File documentation:
+"""
+This file measures the memory used by the PISA data model. A synthetic GSM
+output containing PISA tables for every particle type is written, parsed, and
+the memory retained per histogram is reported.
+
+As a baseline, the parsed data is also copied into a reference model of the
+list-backed layout the PISA classes used before (instances with a __dict__,
+with each histogram holding its own lists of bins and values), which is
+measured in the same way. Both layouts are reported side by side.
+
+USAGE:
+   python bin/benchmarkMemory.py [numBins] [numAngles]
+
+   -numBins   (200): Number of energy bins in each double differential table
+   -numAngles  (10): Number of angles in each double differential table
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import os
+import gc
+import types
+import tempfile
+import tracemalloc
+import numpy as np
+
+
+# Modules:
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from printClass import Print
+from outputClass import GSMOutput, particleTypes
+from gsmDataClasses import angleToKey, angleIntKey
+
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+def writeSyntheticOutput(fileName, numBins = 200, numAngles = 10):
+    """Writes a GSM output file with PISA tables (double differential and energy integrated) for all particle types"""
+    __binWidth = 2.0
+    __numThetaBins = 18
+    random = np.random.default_rng(1)
+    theAngles = np.linspace(10.0, 170.0, numAngles)
+
+    outLines = [" Synthetic GSM output (PISA tables only)", ""]
+
+    # Double differential tables (one column per angle, then angle integrated):
+    for thisParticle in particleTypes:
+        outLines.append(" Double differential cross-section d2S/dTdO (mb/MeV/sr) of %s" % (thisParticle))
+        outLines.append("")
+        outLines.append(" T(MeV)/angle:  " + "  ".join("%6.1f" % (theAngle) for theAngle in theAngles) + "   ang.int.")
+        theValues = random.random( (numBins, numAngles+1) )
+        for binIndx in range(0, numBins, 1):
+            binValues = "  ".join("%.4e" % (theValue) for theValue in theValues[binIndx])
+            outLines.append("  %7.2f- %7.2f  %s" % (binIndx*__binWidth, (binIndx+1)*__binWidth, binValues))
+        outLines.append(" Energ. int.  " + "  ".join("%.4e" % (theValue) for theValue in theValues.sum(axis=0)))
+        outLines.append("")
+
+    # Energy integrated table (one column per particle):
+    outLines.append(" Angular distribution of produced fragments dS/dOm [mb/sr] for energy range(MeV)")
+    outLines.append("")
+    outLines.append(" theta   " + "  ".join(particleTypes))
+    theValues = random.random( (__numThetaBins, len(particleTypes)) )
+    for binIndx in range(0, __numThetaBins, 1):
+        binValues = "  ".join("%.4e" % (theValue) for theValue in theValues[binIndx])
+        outLines.append("  %6.2f- %6.2f  %s" % (binIndx*10.0, (binIndx+1)*10.0, binValues))
+    outLines.append(" Int. x sec  " + "  ".join("%.4e" % (theValue) for theValue in theValues.sum(axis=0)))
+    outLines.append("")
+    outLines.append(" End of run")
+
+    with open(fileName, "w") as outFile:
+        outFile.write( "\n".join(outLines) + "\n" )
+
+    return
+
+def objectSize(theObject, seenObjects = None):
+    """
+    Returns the size [B] of an object and of everything it references
+    (containers, instance members, slots, and the data of NumPy arrays). Each
+    object is counted once; Print objects, classes, and modules are skipped.
+    """
+    if ( seenObjects is None ):
+        seenObjects = set()
+    if ( id(theObject) in seenObjects ):
+        return 0
+    if ( isinstance(theObject, (Print, type, types.ModuleType, types.FunctionType)) ):
+        return 0
+    seenObjects.add( id(theObject) )
+
+    theSize = sys.getsizeof( theObject )
+    if ( isinstance(theObject, np.ndarray) ):
+        # (Views hold only a header; count the data of the array they view)
+        if ( theObject.base is not None ):
+            theSize += objectSize( theObject.base, seenObjects )
+        return theSize
+    if ( isinstance(theObject, dict) ):
+        for theKey, theValue in theObject.items():
+            theSize += objectSize( theKey, seenObjects ) + objectSize( theValue, seenObjects )
+    elif ( isinstance(theObject, (list, tuple, set, frozenset)) ):
+        for theValue in theObject:
+            theSize += objectSize( theValue, seenObjects )
+    if ( hasattr(theObject, "__dict__") ):
+        theSize += objectSize( vars(theObject), seenObjects )
+    for theClass in type(theObject).__mro__:
+        for theMember in vars(theClass).values():
+            if ( isinstance(theMember, types.MemberDescriptorType) ):
+                try:
+                    theSize += objectSize( theMember.__get__(theObject), seenObjects )
+                except AttributeError:
+                    pass
+
+    return theSize
+
+class ListHistogram:
+    """Reference model of the list-backed PISA histogram (see gsmDataClasses.Histogram)"""
+
+    def __init__(self, theHistogram, newPrint):
+        """Copies a histogram into lists of floats (each histogram holds its own bins)"""
+        self.__write = newPrint
+        self.__angle = theHistogram.getAngle()
+        self.__type = theHistogram.getType()
+        self.__dataPoints = [ float(theValue) for theValue in theHistogram.getDataPoints() ]
+        self.__numDataPoints = len( self.__dataPoints )
+        self.__binValues = [ float(theBin) for theBin in theHistogram.getBinValues() ]
+        self.__numBins = len( self.__binValues )
+
+        return
+
+
+class ListParticlePISAData:
+    """Reference model of the list-backed PISA data of a particle (see gsmDataClasses.ParticlePISAData)"""
+
+    def __init__(self, particleData, newPrint):
+        """Copies the histograms of a particle, indexed by angle"""
+        self.__write = newPrint
+        self.__particleName = particleData.getParticleName()
+        self.__histData = {}
+        self.__sortedAngles = list( particleData.queryAngles() )
+        self.__sortedKeys = []
+        for theHistogram in particleData.getHistograms():
+            angleKey = angleToKey( theHistogram.getAngle() )
+            self.__histData[ angleKey ] = ListHistogram( theHistogram, newPrint )
+            if ( angleKey < angleIntKey ):
+                self.__sortedKeys.append( angleKey )
+
+        return
+
+
+class ListDoubleDiffPISA:
+    """Reference model of the list-backed PISA data (see gsmDataClasses.DoubleDiffPISA)"""
+
+    def __init__(self, pisaData, newPrint):
+        """Copies the PISA data of every particle"""
+        self.__write = newPrint
+        self.__particleData = []
+        self.__particleIndex = {}
+        self.__numParticles = 0
+        for particleIndx in range(0, pisaData.getNumParticles(), 1):
+            particleData = pisaData.getParticle(particleIndx)
+            self.__particleIndex.setdefault( particleData.getParticleName(), self.__numParticles )
+            self.__particleData.append( ListParticlePISAData(particleData, newPrint) )
+            self.__numParticles += 1
+
+        return
+
+
+def countHistograms(pisaData):
+    """Returns the number of histograms stored in the PISA data"""
+    numHistograms = 0
+    for particleIndx in range(0, pisaData.getNumParticles(), 1):
+        numHistograms += len( pisaData.getParticle(particleIndx).getHistograms() )
+    return numHistograms
+
+def measureMemory(fileName):
+    """
+    Parses the output file; returns the number of histograms, and the memory [B]
+    retained and held by the PISA data for the list-backed reference model
+    (baseline) and for the current classes
+    """
+    # Current (array-backed) classes:
+    gc.collect()
+    tracemalloc.start()
+    startMemory = tracemalloc.get_traced_memory()[0]
+    theOutput = GSMOutput(fileName, Print(0), leanMemory=True)
+    pisaData = theOutput.getPISAData()
+    gc.collect()
+    retainedMemory = tracemalloc.get_traced_memory()[0] - startMemory
+    tracemalloc.stop()
+
+    # List-backed reference model (built from the same parsed data):
+    gc.collect()
+    tracemalloc.start()
+    startMemory = tracemalloc.get_traced_memory()[0]
+    listData = ListDoubleDiffPISA( pisaData, Print(0) )
+    gc.collect()
+    listMemory = tracemalloc.get_traced_memory()[0] - startMemory
+    tracemalloc.stop()
+
+    return countHistograms(pisaData), (listMemory, retainedMemory), (objectSize(listData), objectSize(pisaData))
+
+
+if __name__ == "__main__":
+    numBins = 200
+    numAngles = 10
+    if ( len(sys.argv) > 1 ):
+        numBins = int(sys.argv[1])
+    if ( len(sys.argv) > 2 ):
+        numAngles = int(sys.argv[2])
+
+    with tempfile.TemporaryDirectory() as tempDir:
+        fileName = os.path.join(tempDir, "syntheticPISA.out")
+        writeSyntheticOutput(fileName, numBins, numAngles)
+        numHistograms, retainedMemory, dataSize = measureMemory(fileName)
+
+    numHistograms = max(numHistograms, 1)
+    print("Synthetic PISA output: %d particles, %d angles, %d energy bins (%d histograms)" % (len(particleTypes), numAngles, numBins, numHistograms))
+    print("   Per histogram [B]:          %20s %20s" % ("before (list-backed)", "after (array-backed)"))
+    print("   Retained after parsing:     %20.1f %20.1f" % (retainedMemory[0] / numHistograms, retainedMemory[1] / numHistograms))
+    print("   PISA data size:             %20.1f %20.1f" % (dataSize[0] / numHistograms, dataSize[1] / numHistograms))
@@ -0,0 +1,49 @@
+
+################################################################################
+# File documentation:
+"""
+This file exports the parsed data of a simulation output file to a columnar
+directory of NumPy arrays (see src/exportModule.py). The export directory can
+be given in place of the output file (e.g. as a \"sim\" file of an input file),
+in which case the arrays are memory-mapped and no parsing is done.
+
+USAGE:
+   python bin/exportOutput.py outputFile exportDirectory
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import os
+
+
+# Modules:
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from printClass import Print
+from outputClass import GSMOutput
+from fileModule import fileExists
+
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+if __name__ == "__main__":
+    if ( len(sys.argv) < 3 ):
+        print(__doc__)
+        sys.exit(1)
+
+    thePrint = Print()
+    if ( not fileExists(sys.argv[1]) ):
+        thePrint.message = "File \"%s\" does not exist. Cannot export its data." % (sys.argv[1])
+        thePrint.print(0, 1)
+        sys.exit(1)
+
+    theOutput = GSMOutput( sys.argv[1], thePrint, leanMemory = True )
+    if ( not theOutput.exportData(sys.argv[2]) ):
+        sys.exit(1)
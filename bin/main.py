@@ -16,6 +16,7 @@ import sys
 import os
 import datetime
 from math import floor
+from functools import partial
 from multiprocessing import Pool
 
 
@@ -23,6 +24,7 @@ from multiprocessing import Pool
 sys.path.insert(0, './src')   # Add personal python scripts to path:
 from gsmPlotClass import PlotGSMInputFile
 from printClass import Print
+from parseServiceClass import ParseServiceManager, parseSimulation
 
 # For testing ideas:
 import testingModule
@@ -62,6 +64,30 @@ def determineNumProcessors():
         numProcessors = 1
     return numProcessors
 
+def plotInputFile(inputName, parseService = None):
+    """Creates the plots of an input file (for a worker process)"""
+    PlotGSMInputFile( inputName, Print(), parseService )
+    return
+
+def prefetchSimFiles(parseService, inputNames, numProcessors):
+    """Parses (in parallel) each distinct simulation file used by the input files, storing them in the parse service"""
+    # Obtain distinct simulation files:
+    simArgs = []
+    for inputName in inputNames:
+        for thisArg in PlotGSMInputFile.querySimFiles( inputName ):
+            if ( thisArg not in simArgs and os.path.isfile( thisArg[0] ) ):
+                simArgs.append( thisArg )
+    if ( len(simArgs) <= 0 ):
+        return
+
+    eprint("Parsing {} distinct simulation file(s) for all input files...".format(len(simArgs)) )
+    with Pool(processes=min(numProcessors, len(simArgs))) as pool:
+        packedOutputs = pool.map(parseSimulation, simArgs)
+    for i in range(0, len(simArgs), 1):
+        parseService.storeOutput( simArgs[i][0], simArgs[i][1], packedOutputs[i] )
+
+    return
+
 
 ################################################################################
 # Script start:
@@ -99,10 +125,17 @@ if __name__ == "__main__":
 
     # Create input file class for each provided file:
     if(_numProcessors > 1):
-        with Pool(processes=_numProcessors) as pool:
-            pool.map(PlotGSMInputFile, cmdArgs)
-            pool.close()
-            pool.join()
+        # (Simulation files are parsed once by a shared service for all input files)
+        with ParseServiceManager() as manager:
+            parseService = manager.ParseService()
+            prefetchSimFiles(parseService, cmdArgs, determineNumProcessors())
+            with Pool(processes=_numProcessors) as pool:
+                pool.map(partial(plotInputFile, parseService=parseService), cmdArgs)
+                pool.close()
+                pool.join()
+            eprint("")
+            eprint("Parse service: {} hit(s) and {} miss(es) for {} simulation file(s).".format(
+                parseService.queryNumHits(), parseService.queryNumMisses(), parseService.queryNumFiles()) )
     else:
         messageControlloer = Print(2)
         PlotGSMInputFile( cmdArgs[0], messageControlloer )
@@ -0,0 +1,47 @@
+
+################################################################################
+# File documentation:
+"""
+This file merges the output files of many independent GSM (CEM, LAQGSM) runs
+into a single output file (see src/mergeModule.py), which can then be plotted
+as any other simulation output file.
+
+USAGE:
+   python bin/mergeOutputs.py [-w weight1,weight2,...] mergedFile file1 file2 ...
+
+   -w (1 for each file): Weight (e.g. number of events) of each output file
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import os
+
+
+# Modules:
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from printClass import Print
+from mergeModule import mergeOutputs
+
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+if __name__ == "__main__":
+    theArgs = sys.argv[1 : ]
+    theWeights = None
+    if ( len(theArgs) > 1 and theArgs[0] == "-w" ):
+        theWeights = [ float(theWeight) for theWeight in theArgs[1].split(",") ]
+        theArgs = theArgs[2 : ]
+    if ( len(theArgs) < 2 ):
+        print(__doc__)
+        sys.exit(1)
+
+    if ( not mergeOutputs(theArgs[1 : ], theArgs[0], theWeights, Print()) ):
+        sys.exit(1)
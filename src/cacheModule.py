@@ -0,0 +1,177 @@
+
+################################################################################
+# File documentation:
+"""
+This module contains various procedures to store and retrieve parsed simulation
+output data from a cache directory.
+
+Each cached entry is keyed by the output file's path. The entry records the
+size, modification time, and content hash of the output file when it was
+parsed; the entry is only used when all of these still match the file.
+The parsed data is stored as a compressed binary pickle. Any Print objects
+contained by the data are not stored, rather the Print object of the client
+is attached to the data when it is loaded.
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import os
+import os.path as path
+import io
+import hashlib
+import pickle
+import zlib
+
+# Modules:
+from printClass import Print
+from fileModule import fileExists
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+# Module defaults:
+cacheVersion = 6   # Increment whenever the layout of the cached data classes changes
+cacheExtension = ".gsmcache"
+__hashBlockSize = 1048576
+__compressLevel = 1
+
+
+class _CachePickler(pickle.Pickler):
+    """Pickler that stores references to Print objects instead of the objects"""
+
+    def persistent_id(self, obj):
+        """Flags Print objects so that they are not stored"""
+        if ( isinstance(obj, Print) ):
+            return "print"
+        return None
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """Unpickler that attaches the client's Print object to the loaded data"""
+
+    def __init__(self, file, newPrint = Print() ):
+        """Constructor for the unpickler"""
+        super(_CacheUnpickler, self).__init__(file)
+        self.__write = newPrint
+
+    def persistent_load(self, pid):
+        """Returns the client's Print object for all stored Print references"""
+        if ( pid == "print" ):
+            return self.__write
+        raise pickle.UnpicklingError("Unsupported persistent object (%s) found in cache." % (pid))
+
+
+def packData(theData):
+    """Returns the (uncompressed) binary pickle of the data, excluding any Print objects"""
+    payload = io.BytesIO()
+    _CachePickler( payload, pickle.HIGHEST_PROTOCOL ).dump( theData )
+    return payload.getvalue()
+
+def unpackData(payload, newPrint = Print() ):
+    """Returns the data stored in a binary pickle, attaching the client's Print object to it"""
+    return _CacheUnpickler( io.BytesIO(payload), newPrint ).load()
+
+def fileHash(fileName):
+    """Returns the content hash of a file"""
+    theHash = hashlib.sha1()
+    with open(fileName, 'rb') as theFile:
+        while ( True ):
+            dataBlock = theFile.read( __hashBlockSize )
+            if ( not dataBlock ):
+                break
+            theHash.update( dataBlock )
+
+    return theHash.hexdigest()
+
+def fileSignature(fileName, includeHash = True):
+    """Returns the path, size, modification time, and (optionally) content hash of a file"""
+    fileStats = os.stat( fileName )
+    signature = {
+        "path": path.abspath( fileName ),
+        "size": fileStats.st_size,
+        "mtime": fileStats.st_mtime_ns,
+        "hash": None
+    }
+    if ( includeHash ):
+        signature["hash"] = fileHash( fileName )
+
+    return signature
+
+def cacheFileName(cacheDir, fileName):
+    """Returns the name of the cache entry for a file"""
+    pathKey = hashlib.sha1( path.abspath(fileName).encode("utf-8") ).hexdigest()
+    return path.join( cacheDir, pathKey + cacheExtension )
+
+def loadCachedData(cacheDir, fileName, newPrint = Print() ):
+    """Returns the cached data of a file (None if no valid entry exists)"""
+    theData = None
+
+    entryName = cacheFileName( cacheDir, fileName )
+    if ( not fileExists(entryName) or not fileExists(fileName) ):
+        return theData
+
+    try:
+        with open(entryName, 'rb') as theEntry:
+            header = pickle.load( theEntry )
+
+            # Validate the entry against the file:
+            signature = fileSignature( fileName, False )
+            validEntry = ( header.get("version") == cacheVersion )
+            for key in ("path", "size", "mtime"):
+                validEntry = validEntry and ( header.get(key) == signature[key] )
+            if ( validEntry ):
+                validEntry = ( header.get("hash") == fileHash(fileName) )
+            if ( not validEntry ):
+                newPrint.message = "Cached data for \"%s\" is out of date." % (fileName)
+                newPrint.print(2, 3)
+                return theData
+
+            # Entry is valid; load the data:
+            theData = unpackData( zlib.decompress(theEntry.read()), newPrint )
+    except Exception as theError:
+        newPrint.message = "Unable to read cached data for \"%s\" (%s)." % (fileName, str(theError))
+        newPrint.print(1, 2)
+        theData = None
+
+    if ( theData is not None ):
+        newPrint.message = "Using cached data for \"%s\"." % (fileName)
+        newPrint.print(2, 3)
+
+    return theData
+
+def saveCachedData(cacheDir, fileName, theData, newPrint = Print() ):
+    """Stores the parsed data of a file in the cache; returns if the data was stored"""
+    entryName = cacheFileName( cacheDir, fileName )
+    tempName = "%s.%d.tmp" % (entryName, os.getpid())
+
+    try:
+        os.makedirs( cacheDir, exist_ok = True )
+
+        # Create the entry's header and data:
+        header = fileSignature( fileName )
+        header["version"] = cacheVersion
+        payload = packData( theData )
+
+        # Write to a temporary file first so that other processes never read a partial entry:
+        with open(tempName, 'wb') as theEntry:
+            pickle.dump( header, theEntry, pickle.HIGHEST_PROTOCOL )
+            theEntry.write( zlib.compress(payload, __compressLevel) )
+        os.replace( tempName, entryName )
+    except Exception as theError:
+        newPrint.message = "Unable to cache data for \"%s\" (%s)." % (fileName, str(theError))
+        newPrint.print(1, 2)
+        if ( fileExists(tempName) ):
+            os.remove( tempName )
+        return False
+
+    newPrint.message = "Cached data for \"%s\" in \"%s\"." % (fileName, entryName)
+    newPrint.print(2, 3)
+
+    return True
@@ -0,0 +1,386 @@
+
+################################################################################
+# File documentation:
+"""
+This module contains the \"ComparisonEngine\" object, used to compare the
+predictions of many simulations against many sets of experimental data at once
+(e.g. for parameter scans).
+
+Each experimental data set (a Scatter, see Scatter.importData) is paired with
+the matching histogram of each simulation. The histograms are mapped onto the
+data set's X-points by a matrix (one matrix product per set of bins), either
+by integrating the histogram over each point's X-error range (or taking the
+bin containing the point when it has no X-error) or by interpolating linearly
+between bin centers. The metrics of all (simulation, data set) pairs are then
+computed together as matrix operations:
+-chi-square: Sum of ((C - E) / sigma)^2, with sigma^2 = dE^2 (+ dC^2 if
+\tsimulation errors are given). Points with sigma = 0 are skipped.
+-mean C/E: Mean ratio of the calculated to experimental values (E > 0).
+-deviation factor: F = 10^sqrt( <(log10(C/E))^2> ) (C > 0 and E > 0).
+A histogram predicts 0 outside of its bins (the Histogram object trims the
+zero-valued bins at the end of its data), so points beyond a histogram's bins
+are compared against 0. A point's X-error range is averaged over the part of
+the range covered by the bins. Only points outside of the X-range given for a
+data set (if any) are not compared.
+
+USAGE (example):
+   theEngine = ComparisonEngine( ["Run 1", "Run 2", "Run 3"], newPrint )
+   theEngine.addDataSet( Scatter.importData("n30deg.dat"), [run1N30, run2N30, run3N30], label="n (30 deg)" )
+   theEngine.addDataSet( Scatter.importData("n60deg.dat"), [run1N60, run2N60, run3N60], label="n (60 deg)" )
+   theEngine.compute()
+   theEngine.printSummary()
+   theChiSquares = theEngine.queryChiSquare()   # (simulations x data sets) array
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import numpy as np
+
+# MODULES:
+from histAlgebraModule import intervalMatrix
+from printClass import Print
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+# Module defaults:
+validMethods = ("integrate", "interpolate")
+
+
+def _histogramArrays(theHistogram):
+    """Returns the bin bounds and values (one per bin) of a general or PISA histogram"""
+    if ( hasattr(theHistogram, "queryBinBounds") ):
+        theBins = np.asarray( theHistogram.queryBinBounds(), dtype=float )
+        theValues = np.asarray( theHistogram.queryYValues(), dtype=float )
+    else:
+        theBins = np.asarray( theHistogram.getBinValues(), dtype=float )
+        theValues = np.asarray( theHistogram.getDataPoints(), dtype=float )
+    numBins = max( len(theBins) - 1, 0 )
+
+    return theBins, np.pad( theValues[ : numBins], (0, numBins - min(len(theValues), numBins)) )
+
+def _mappingMatrix(bins, xVals, xErrs, method):
+    """
+    Returns the (bins x points) matrix that maps histogram values onto the
+    points. Points beyond the bins are mapped to 0.
+    """
+    numBins = len(bins) - 1
+    inRange = (xVals >= bins[0]) & (xVals <= bins[-1])
+
+    if ( method == validMethods[0] ):
+        # Average over the part of each point's X-error range covered by the bins:
+        theOverlap = intervalMatrix( bins, xVals - xErrs, xVals + xErrs, density=False ) * np.diff( bins )[ : , None]
+        coveredWidths = theOverlap.sum( axis=0 )
+        theMatrix = np.divide( theOverlap, coveredWidths[None, : ], out=np.zeros(theOverlap.shape), where=(coveredWidths[None, : ] > 0) )
+        inRange = (inRange & (xErrs <= 0)) | (coveredWidths > 0)
+        # (Use the bin containing the point when it has no X-error)
+        pointBins = np.flatnonzero( inRange & (xErrs <= 0) )
+        binIndx = np.clip( np.searchsorted(bins, xVals[pointBins], side="right") - 1, 0, numBins-1 )
+        theMatrix[ : , pointBins] = 0.00
+        theMatrix[binIndx, pointBins] = 1.00
+    else:
+        # Interpolate linearly between bin centers (constant from the outer centers to the outer bounds):
+        binCenters = 0.5 * (bins[1 : ] + bins[ : -1])
+        upperIndx = np.clip( np.searchsorted(binCenters, xVals), 1, max(numBins-1, 1) )
+        lowerIndx = upperIndx - 1
+        if ( numBins == 1 ):
+            upperIndx = lowerIndx
+        centerWidths = binCenters[upperIndx] - binCenters[lowerIndx]
+        upperWeight = np.divide( xVals - binCenters[lowerIndx], centerWidths, out=np.zeros(len(xVals)), where=(centerWidths > 0) )
+        upperWeight = np.clip( upperWeight, 0.00, 1.00 )
+        theMatrix = np.zeros( (numBins, len(xVals)) )
+        pointIndx = np.arange( len(xVals) )
+        np.add.at( theMatrix, (lowerIndx, pointIndx), 1.00 - upperWeight )
+        np.add.at( theMatrix, (upperIndx, pointIndx), upperWeight )
+
+    theMatrix[ : , ~inRange] = 0.00
+    return theMatrix
+
+
+class ComparisonEngine:
+    """
+    The \"ComparisonEngine\" object computes goodness-of-fit metrics (chi-square,
+    mean C/E, and deviation factor) between each of a set of simulations and
+    each of many experimental data sets. All metrics are stored as
+    (simulations x data sets) arrays.
+    """
+    __summaryColumns = ("Simulation", "Data set", "Points", "Chi^2", "Chi^2/N", "<C/E>", "F")
+
+    def __init__(self, simLabels, newPrint = Print(), method = "integrate"):
+        """Constructor (labels of the simulations, and how histograms are mapped onto the data points)"""
+        self.__write = newPrint
+        self.__simLabels = [ str(simLabel) for simLabel in simLabels ]
+        self.__numSims = len( self.__simLabels )
+
+        method = method.lower().strip()
+        if ( method not in validMethods ):
+            self.__write.message = "Invalid comparison method (%s). Using \"%s\" instead." % (method, validMethods[0])
+            self.__write.print(1, 2)
+            method = validMethods[0]
+        self.__method = method
+
+        self.__resetMembers()
+
+        return
+
+    def __resetMembers(self):
+        """Resets the data sets and the computed metrics"""
+        # Data sets (with each simulation's predictions on their points):
+        self.__dataLabels = []
+        self.__expValues = []
+        self.__expErrors = []
+        self.__predictions = []
+        self.__predictionErrors = []
+        self.__validPoints = []
+        self.__numDataSets = 0
+
+        # Metrics:
+        self.__numPoints = None
+        self.__chiSquare = None
+        self.__meanRatio = None
+        self.__deviationFactor = None
+
+        return
+
+    def queryNumSimulations(self):
+        """Returns the number of simulations compared"""
+        return self.__numSims
+
+    def queryNumDataSets(self):
+        """Returns the number of data sets compared"""
+        return self.__numDataSets
+
+    def querySimLabels(self):
+        """Returns the labels of the simulations"""
+        return tuple( self.__simLabels )
+
+    def queryDataLabels(self):
+        """Returns the labels of the data sets"""
+        return tuple( self.__dataLabels )
+
+    def addDataSet(self, dataScatter, simHistograms, simErrors = None, label = None, xRange = None):
+        """
+        Adds an experimental data set (Scatter object) and the matching histogram
+        of each simulation (None where a simulation has no prediction). Error
+        histograms of the simulations may be given as well. When an X-range
+        (lower, upper) is given, only the points within it are compared.
+        """
+        if ( dataScatter is None or dataScatter.getNumDataPoints() == 0 ):
+            self.__write.message = "No experimental data was given for comparison (%s). The data set will not be compared." % (str(label))
+            self.__write.print(1, 2)
+            return
+        if ( not len(simHistograms) == self.__numSims ):
+            self.__write.message = "%d histograms were given for comparing %d simulations (%s). The data set will not be compared." % (len(simHistograms), self.__numSims, str(label))
+            self.__write.print(1, 2)
+            return
+        if ( simErrors is None ):
+            simErrors = [None] * self.__numSims
+        if ( label is None ):
+            label = "Data set %d" % (self.__numDataSets + 1)
+
+        # Obtain the experimental points:
+        xVals = np.asarray( dataScatter.getXValues(), dtype=float )
+        yVals = np.asarray( dataScatter.getYValues(), dtype=float )
+        numPoints = len(xVals)
+        xErrs = np.zeros( numPoints )
+        if ( dataScatter.getXError() is not None ):
+            xErrs = np.abs( np.asarray(dataScatter.getXError(), dtype=float) )
+        yErrs = np.zeros( numPoints )
+        if ( dataScatter.getYError() is not None ):
+            yErrs = np.abs( np.asarray(dataScatter.getYError(), dtype=float) )
+        comparedPoints = np.ones( numPoints, dtype=bool )
+        if ( xRange is not None ):
+            comparedPoints = (xVals >= xRange[0]) & (xVals <= xRange[1])
+
+        # Group the simulations by their bins (one mapping for each set of bins):
+        binGroups = {}
+        for simIndx in range(0, self.__numSims, 1):
+            if ( simHistograms[simIndx] is None ):
+                continue
+            theBins, theValues = _histogramArrays( simHistograms[simIndx] )
+            if ( len(theValues) == 0 ):
+                continue
+            theErrors = None
+            if ( simErrors[simIndx] is not None ):
+                errorBins, theErrors = _histogramArrays( simErrors[simIndx] )
+                theErrors = np.pad( theErrors[ : len(theValues)], (0, max(len(theValues) - len(theErrors), 0)) )
+            binGroups.setdefault( theBins.tobytes(), (theBins, []) )[1].append( (simIndx, theValues, theErrors) )
+
+        # Map each group's histograms onto the points:
+        thePredictions = np.zeros( (self.__numSims, numPoints) )
+        theErrors = np.zeros( (self.__numSims, numPoints) )
+        validPoints = np.zeros( (self.__numSims, numPoints), dtype=bool )
+        for theBins, theGroup in binGroups.values():
+            theMatrix = _mappingMatrix( theBins, xVals, xErrs, self.__method )
+            simIndices = [ theSim[0] for theSim in theGroup ]
+            thePredictions[simIndices] = np.vstack( [theSim[1] for theSim in theGroup] ) @ theMatrix
+            groupErrors = np.vstack( [np.zeros(len(theSim[1])) if theSim[2] is None else theSim[2] for theSim in theGroup] )
+            theErrors[simIndices] = np.sqrt( np.square(groupErrors) @ np.square(theMatrix) )
+            validPoints[simIndices] = comparedPoints
+
+        # Store the data set:
+        self.__dataLabels.append( str(label) )
+        self.__expValues.append( yVals )
+        self.__expErrors.append( yErrs )
+        self.__predictions.append( thePredictions )
+        self.__predictionErrors.append( theErrors )
+        self.__validPoints.append( validPoints )
+        self.__numDataSets += 1
+        self.__chiSquare = None
+
+        return
+
+    def compute(self):
+        """Computes the metrics of all (simulation, data set) pairs"""
+        if ( self.__numDataSets == 0 ):
+            self.__write.message = "No data sets exist to compare the simulations against."
+            self.__write.print(1, 2)
+            return
+
+        # Stack the points of all data sets (each point is flagged by its data set):
+        expValues = np.concatenate( self.__expValues )
+        expErrors = np.concatenate( self.__expErrors )
+        thePredictions = np.hstack( self.__predictions )
+        predictionErrors = np.hstack( self.__predictionErrors )
+        validPoints = np.hstack( self.__validPoints )
+        setSizes = [ len(theValues) for theValues in self.__expValues ]
+        setIndicator = np.zeros( (len(expValues), self.__numDataSets) )
+        setIndicator[ np.arange(len(expValues)), np.repeat(np.arange(self.__numDataSets), setSizes) ] = 1.00
+
+        # Chi-square:
+        theVariance = np.square(expErrors)[None, : ] + np.square(predictionErrors)
+        chiPoints = validPoints & (theVariance > 0)
+        theResiduals = np.divide( np.square(thePredictions - expValues[None, : ]), theVariance, out=np.zeros(theVariance.shape), where=chiPoints )
+        self.__chiSquare = theResiduals @ setIndicator
+        self.__numPoints = chiPoints.astype(float) @ setIndicator
+
+        # Mean C/E:
+        ratioPoints = validPoints & (expValues[None, : ] > 0)
+        theRatios = np.divide( thePredictions, expValues[None, : ], out=np.zeros(thePredictions.shape), where=ratioPoints )
+        numRatios = ratioPoints.astype(float) @ setIndicator
+        self.__meanRatio = np.divide( theRatios @ setIndicator, numRatios, out=np.full(numRatios.shape, np.nan), where=(numRatios > 0) )
+
+        # Deviation factor:
+        logPoints = ratioPoints & (thePredictions > 0)
+        logRatios = np.square( np.log10(theRatios, out=np.zeros(theRatios.shape), where=logPoints) )
+        numLogs = logPoints.astype(float) @ setIndicator
+        meanLog = np.divide( logRatios @ setIndicator, numLogs, out=np.full(numLogs.shape, np.nan), where=(numLogs > 0) )
+        self.__deviationFactor = np.power( 10.0, np.sqrt(meanLog) )
+
+        self.__write.message = "Compared %d simulations against %d data sets (%d points)." % (self.__numSims, self.__numDataSets, len(expValues))
+        self.__write.print(2, 2)
+
+        return
+
+    def __verifyComputed(self):
+        """Computes the metrics if they are not up to date"""
+        if ( self.__chiSquare is None ):
+            self.compute()
+        return ( self.__chiSquare is not None )
+
+    def queryNumPoints(self):
+        """Returns the number of points compared by chi-square (simulations x data sets)"""
+        if ( not self.__verifyComputed() ):
+            return None
+        return self.__numPoints
+
+    def queryChiSquare(self):
+        """Returns the chi-square of each simulation and data set (simulations x data sets)"""
+        if ( not self.__verifyComputed() ):
+            return None
+        return self.__chiSquare
+
+    def queryReducedChiSquare(self):
+        """Returns the chi-square per point of each simulation and data set (simulations x data sets)"""
+        if ( not self.__verifyComputed() ):
+            return None
+        return np.divide( self.__chiSquare, self.__numPoints, out=np.full(self.__chiSquare.shape, np.nan), where=(self.__numPoints > 0) )
+
+    def queryMeanRatio(self):
+        """Returns the mean C/E of each simulation and data set (simulations x data sets)"""
+        if ( not self.__verifyComputed() ):
+            return None
+        return self.__meanRatio
+
+    def queryDeviationFactor(self):
+        """Returns the deviation factor of each simulation and data set (simulations x data sets)"""
+        if ( not self.__verifyComputed() ):
+            return None
+        return self.__deviationFactor
+
+    def queryTotalReducedChiSquare(self):
+        """Returns the chi-square per point of each simulation over all data sets"""
+        if ( not self.__verifyComputed() ):
+            return None
+        totalPoints = self.__numPoints.sum(axis=1)
+        return np.divide( self.__chiSquare.sum(axis=1), totalPoints, out=np.full(totalPoints.shape, np.nan), where=(totalPoints > 0) )
+
+    def queryBestSimulation(self):
+        """Returns the index of the simulation with the lowest chi-square per point over all data sets"""
+        totalChiSquare = self.queryTotalReducedChiSquare()
+        if ( totalChiSquare is None or np.all(np.isnan(totalChiSquare)) ):
+            return None
+        return int( np.nanargmin(totalChiSquare) )
+
+    def querySummary(self):
+        """Returns the summary table (a row for each simulation and data set) as a list of lines"""
+        if ( not self.__verifyComputed() ):
+            return []
+
+        simWidth = max( [len(self.__summaryColumns[0])] + [len(simLabel) for simLabel in self.__simLabels] )
+        dataWidth = max( [len(self.__summaryColumns[1]), len("All")] + [len(dataLabel) for dataLabel in self.__dataLabels] )
+        rowFormat = "%-" + str(simWidth) + "s  %-" + str(dataWidth) + "s  %6s  %12s  %10s  %10s  %10s"
+        summaryLines = [ rowFormat % self.__summaryColumns ]
+        summaryLines.append( "-" * len(summaryLines[0]) )
+
+        reducedChiSquare = self.queryReducedChiSquare()
+        totalChiSquare = self.queryTotalReducedChiSquare()
+        for simIndx in range(0, self.__numSims, 1):
+            for dataIndx in range(0, self.__numDataSets, 1):
+                summaryLines.append( rowFormat % (self.__simLabels[simIndx], self.__dataLabels[dataIndx],
+                "%d" % (self.__numPoints[simIndx, dataIndx]),
+                "%.4e" % (self.__chiSquare[simIndx, dataIndx]),
+                "%.4f" % (reducedChiSquare[simIndx, dataIndx]),
+                "%.4f" % (self.__meanRatio[simIndx, dataIndx]),
+                "%.4f" % (self.__deviationFactor[simIndx, dataIndx])) )
+            summaryLines.append( rowFormat % (self.__simLabels[simIndx], "All",
+            "%d" % (self.__numPoints[simIndx].sum()),
+            "%.4e" % (self.__chiSquare[simIndx].sum()),
+            "%.4f" % (totalChiSquare[simIndx]), "", "") )
+
+        bestSim = self.queryBestSimulation()
+        if ( bestSim is not None ):
+            summaryLines.append( "Lowest chi-square per point: %s (%.4f)" % (self.__simLabels[bestSim], totalChiSquare[bestSim]) )
+
+        return summaryLines
+
+    def printSummary(self):
+        """Prints the summary table"""
+        for summaryLine in self.querySummary():
+            self.__write.message = summaryLine
+            self.__write.print(2, 1)
+
+        return
+
+    def writeSummary(self, fileName):
+        """Writes the summary table to a file"""
+        summaryLines = self.querySummary()
+        try:
+            with open(fileName, "w") as summaryFile:
+                summaryFile.write( "\n".join(summaryLines) + "\n" )
+        except OSError as theError:
+            self.__write.message = "Unable to write the comparison summary to \"%s\" (%s)." % (fileName, str(theError))
+            self.__write.print(1, 2)
+            return
+
+        self.__write.message = "Comparison summary written to \"%s\"." % (fileName)
+        self.__write.print(2, 2)
+
+        return
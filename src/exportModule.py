@@ -0,0 +1,319 @@
+
+################################################################################
+# File documentation:
+"""
+This module contains procedures to export parsed simulation output data to a
+columnar, binary directory, and to load the exported data again without any
+parsing.
+
+An export is a directory containing a manifest (\"manifest.json\") and one
+NumPy array file (.npy) per column. The manifest records the format version,
+the output file that was exported, the names (particles, histogram types and
+notes, ejectiles, and residuals) referenced by index in the arrays, and the
+file, type, and shape of every array. The columns are:
+-PISA histograms: \"pisaBins\" and \"pisaValues\" (the bin bounds and values of
+\tall histograms, concatenated; histograms of a table share their bins),
+\t\"pisaAngles\", and \"pisaIndex\" (per histogram: particle, histogram type,
+\tfirst bin, number of bin bounds, first value, and number of values).
+-Energy spectra: \"spectraBins\", \"spectraValues\", and \"spectraIndex\" (as for
+\tthe PISA histograms, with the histogram's note in place of its type). The
+\terror histograms (e.g. \"dtotal\") are stored as any other histogram.
+-Yields: \"massYields\" and \"chargeYields\" (per row: A (or Z), yield, yield
+\terror, mean kinetic energy, and kinetic energy error), \"nuclideZ\",
+\t\"nuclideA\", \"nuclideValues\" (yield and error), \"channelCounts\", and
+\t\"channelYields\".
+Columns of data that doesn't exist in the output are not written.
+
+Loaded exports memory-map every array (read-only); the data objects are
+created on views of the mapped arrays, so only the data that is used is read
+from the disk.
+
+USAGE (example):
+   theOutput = GSMOutput( "run.out", newPrint )
+   theOutput.exportData( "run.export" )
+
+   # Later (or on another machine); no parsing is done:
+   theOutput = GSMOutput( "run.export", newPrint )
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import os
+import os.path as path
+import json
+import numpy as np
+
+# Modules:
+from printClass import Print
+from fileModule import fileExists
+import generalPlotTypeClasses as genPlotCls
+import gsmDataClasses as gsmData
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+# Module defaults:
+exportVersion = 1   # Increment whenever the layout of the exported columns changes
+exportFormat = "gsm columnar export"
+manifestName = "manifest.json"
+
+
+def _manifestFile(exportName):
+    """Returns the manifest of an export (given the export directory or its manifest)"""
+    if ( path.isdir(exportName) ):
+        return path.join( exportName, manifestName )
+    return exportName
+
+def isExport(exportName):
+    """Determines if the name is an export (the export directory or its manifest)"""
+    if ( exportName is None ):
+        return False
+    manifestFile = _manifestFile( exportName )
+    return ( path.basename(manifestFile) == manifestName and fileExists(manifestFile) )
+
+
+class _HistogramColumns:
+    """Collects the bins and values of many histograms into concatenated columns"""
+
+    def __init__(self):
+        """Constructor for the columns"""
+        self.__bins = []
+        self.__values = []
+        self.__index = []
+        self.__angles = []
+        self.__binOffsets = {}   # (Offset of the bins already stored, by their contents)
+        self.__numBins = 0
+        self.__numValues = 0
+
+        return
+
+    def add(self, particleIndx, labelIndx, bins, values, angle = 0.00):
+        """Adds a histogram's bins and values (bins identical to those of a previous histogram are stored once)"""
+        bins = np.asarray( bins, dtype=float )
+        values = np.asarray( values, dtype=float )
+
+        binKey = bins.tobytes()
+        binStart = self.__binOffsets.get( binKey, None )
+        if ( binStart is None ):
+            binStart = self.__numBins
+            self.__binOffsets[ binKey ] = binStart
+            self.__bins.append( bins )
+            self.__numBins += len(bins)
+
+        self.__index.append( (particleIndx, labelIndx, binStart, len(bins), self.__numValues, len(values)) )
+        self.__values.append( values )
+        self.__numValues += len(values)
+        self.__angles.append( angle )
+
+        return
+
+    def queryNumHistograms(self):
+        """Returns the number of histograms in the columns"""
+        return len(self.__index)
+
+    def queryColumns(self):
+        """Returns the bins, values, index, and angles columns"""
+        return ( np.concatenate(self.__bins), np.concatenate(self.__values),
+            np.array(self.__index, dtype=np.int64).reshape( (-1, 6) ), np.array(self.__angles, dtype=float) )
+
+
+def _histogramViews(theArrays, prefix):
+    """Yields (particle, label, bins, values, angle) of each histogram stored in the columns with the prefix"""
+    theIndex = theArrays.get( prefix + "Index", None )
+    if ( theIndex is None ):
+        return
+    theBins = theArrays[ prefix + "Bins" ]
+    theValues = theArrays[ prefix + "Values" ]
+    theAngles = theArrays.get( prefix + "Angles", None )
+
+    for histIndx in range(0, theIndex.shape[0], 1):
+        particleIndx, labelIndx, binStart, numBins, valueStart, numValues = theIndex[ histIndx ].tolist()
+        theAngle = 0.00
+        if ( theAngles is not None ):
+            theAngle = float( theAngles[ histIndx ] )
+        yield particleIndx, labelIndx, theBins[binStart : binStart+numBins], theValues[valueStart : valueStart+numValues], theAngle
+
+    return
+
+def _yieldTable(theYields, theKEDist):
+    """Returns the (rows x 5) table of a mass or charge yield: A (or Z), yield, yield error, KE, and KE error"""
+    xVals = theYields.getXValues()
+    if ( xVals is None ):
+        return None
+    numRows = len(xVals)
+
+    theTable = np.zeros( (numRows, 5) )
+    theTable[:, 0] = xVals
+    theTable[:, 1] = theYields.getYValues()
+    if ( theYields.getYError() is not None ):
+        theTable[:, 2] = theYields.getYError()
+    if ( theKEDist is not None and theKEDist.getYValues() is not None ):
+        theTable[:, 3] = theKEDist.getYValues()
+        if ( theKEDist.getYError() is not None ):
+            theTable[:, 4] = theKEDist.getYError()
+
+    return theTable
+
+def _yieldScatters(theTable, newPrint):
+    """Returns the yield and kinetic energy scatter objects of a mass or charge yield table"""
+    dxVals = np.zeros( theTable.shape[0] )
+    theYields = genPlotCls.Scatter( theTable[:, 0], theTable[:, 1], dxVals, theTable[:, 2], newPrint )
+    theKEDist = genPlotCls.Scatter( theTable[:, 0], theTable[:, 3], dxVals, theTable[:, 4], newPrint )
+
+    return theYields, theKEDist
+
+
+def exportData(exportDir, fileName, parsedData, newPrint = Print() ):
+    """
+    Exports the parsed data of an output file (a dictionary of the PISA data
+    (\"pisa\"), particle data (\"particleData\"), and yields (\"yields\"), as
+    stored in the cache) to the export directory; returns if the data was exported
+    """
+    manifest = {
+        "format": exportFormat,
+        "version": exportVersion,
+        "source": path.abspath( fileName ),
+        "histogramTypes": list( gsmData.histType ),
+        "pisaParticles": [],
+        "spectraParticles": [],
+        "spectraNotes": [],
+        "ejectiles": [],
+        "residuals": [],
+        "arrays": {}
+    }
+    theArrays = {}
+
+    # PISA histograms:
+    pisaColumns = _HistogramColumns()
+    pisaData = parsedData["pisa"]
+    for particleIndx in range(0, pisaData.getNumParticles(), 1):
+        theParticle = pisaData.getParticle( particleIndx )
+        manifest["pisaParticles"].append( theParticle.getParticleName() )
+        for theHistogram in theParticle.getHistograms():
+            typeIndx = gsmData.histType.index( theHistogram.getType() )
+            pisaColumns.add( particleIndx, typeIndx, theHistogram.getBinValues(), theHistogram.getDataPoints(), theHistogram.getAngle() )
+    if ( pisaColumns.queryNumHistograms() > 0 ):
+        theArrays["pisaBins"], theArrays["pisaValues"], theArrays["pisaIndex"], theArrays["pisaAngles"] = pisaColumns.queryColumns()
+
+    # Energy spectra (with their error histograms):
+    spectraColumns = _HistogramColumns()
+    for theParticleData in parsedData["particleData"]:
+        particleIndx = len( manifest["spectraParticles"] )
+        particleID = theParticleData.queryParticleID()
+        manifest["spectraParticles"].append( particleID )
+        theSpectra = theParticleData.queryEnergySpectra()
+        for theOrigin in gsmData.spectrumOrigins( particleID ):
+            for theNote in (theOrigin, "d" + theOrigin):
+                if ( not theSpectra.histExists(theNote) ):
+                    continue
+                if ( not theNote in manifest["spectraNotes"] ):
+                    manifest["spectraNotes"].append( theNote )
+                theHistogram = theSpectra.queryHistogram( theNote )
+                spectraColumns.add( particleIndx, manifest["spectraNotes"].index(theNote), theHistogram.queryBinBounds(), theHistogram.queryYValues() )
+    if ( spectraColumns.queryNumHistograms() > 0 ):
+        theArrays["spectraBins"], theArrays["spectraValues"], theArrays["spectraIndex"] = spectraColumns.queryColumns()[ : 3]
+
+    # Yields (only those created when parsing; the yield queries warn of missing yields):
+    yieldData = parsedData["yields"]
+    if ( yieldData is not None ):
+        yieldObjects = yieldData.queryYieldObjects()
+        channelYields = yieldObjects["channelYields"]
+        if ( channelYields is not None ):
+            manifest["ejectiles"] = list( channelYields.queryEjectiles() )
+            manifest["residuals"] = list( channelYields.queryResiduals() )
+            theArrays["channelCounts"] = np.asarray( channelYields.queryCounts(), dtype=np.int64 )
+            theArrays["channelYields"] = np.asarray( channelYields.queryYields(), dtype=float )
+        nuclideYields = yieldObjects["nuclideYields"]
+        if ( nuclideYields is not None ):
+            theArrays["nuclideZ"] = np.asarray( nuclideYields.queryZ(), dtype=np.int64 )
+            theArrays["nuclideA"] = np.asarray( nuclideYields.queryA(), dtype=np.int64 )
+            theArrays["nuclideValues"] = np.column_stack( (nuclideYields.queryYields(), nuclideYields.queryErrors()) )
+        for theName in ("mass", "charge"):
+            theYields = yieldObjects[ theName + "Yields" ]
+            if ( theYields is not None ):
+                theTable = _yieldTable( theYields, yieldObjects[ theName + "KEDist" ] )
+                if ( theTable is not None ):
+                    theArrays[ theName + "Yields" ] = theTable
+
+    try:
+        os.makedirs( exportDir, exist_ok = True )
+
+        # Write the columns, then the manifest (the export is only valid once the manifest exists):
+        for theName, theArray in theArrays.items():
+            arrayFile = theName + ".npy"
+            np.save( path.join(exportDir, arrayFile), np.ascontiguousarray(theArray) )
+            manifest["arrays"][ theName ] = { "file": arrayFile, "dtype": theArray.dtype.str, "shape": list(theArray.shape) }
+        manifestFile = path.join( exportDir, manifestName )
+        tempName = "%s.%d.tmp" % (manifestFile, os.getpid())
+        with open(tempName, 'w') as theManifest:
+            json.dump( manifest, theManifest, indent = 1 )
+        os.replace( tempName, manifestFile )
+    except Exception as theError:
+        newPrint.message = "Unable to export data for \"%s\" (%s)." % (fileName, str(theError))
+        newPrint.print(1, 2)
+        return False
+
+    newPrint.message = "Exported data for \"%s\" to \"%s\"." % (fileName, exportDir)
+    newPrint.print(2, 3)
+
+    return True
+
+def loadExportedData(exportName, newPrint = Print() ):
+    """
+    Returns the data of an export (the export directory or its manifest) as a
+    dictionary of the PISA data, particle data, and yields (None if the export
+    can't be read). The arrays are memory-mapped.
+    """
+    manifestFile = _manifestFile( exportName )
+    exportDir = path.dirname( manifestFile )
+    try:
+        with open(manifestFile, 'r') as theManifest:
+            manifest = json.load( theManifest )
+        if ( not manifest.get("format") == exportFormat or not manifest.get("version") == exportVersion ):
+            newPrint.message = "The export \"%s\" has an unsupported format (%s, version %s)." % (exportName, manifest.get("format"), manifest.get("version"))
+            newPrint.print(1, 2)
+            return None
+
+        theArrays = {}
+        for theName, theEntry in manifest["arrays"].items():
+            theArrays[ theName ] = np.load( path.join(exportDir, theEntry["file"]), mmap_mode = "r" )
+    except Exception as theError:
+        newPrint.message = "Unable to read the export \"%s\" (%s)." % (exportName, str(theError))
+        newPrint.print(1, 2)
+        return None
+
+    # PISA histograms:
+    pisaData = gsmData.DoubleDiffPISA( newPrint )
+    for particleIndx, typeIndx, theBins, theValues, theAngle in _histogramViews( theArrays, "pisa" ):
+        theHistogram = gsmData.Histogram( manifest["histogramTypes"][typeIndx], theAngle, theBins, theValues, newPrint )
+        pisaData.addParticleHistogram( manifest["pisaParticles"][particleIndx], theHistogram )
+
+    # Energy spectra:
+    particleData = [ gsmData.ParticleData(particleID, newPrint) for particleID in manifest["spectraParticles"] ]
+    for particleIndx, noteIndx, theBins, theValues, theAngle in _histogramViews( theArrays, "spectra" ):
+        theHistogram = genPlotCls.Histogram( theBins, theValues, manifest["spectraNotes"][noteIndx], newPrint )
+        particleData[ particleIndx ].queryEnergySpectra().addHistogram( theHistogram )
+
+    # Yields:
+    yieldObjects = {}
+    if ( "channelYields" in theArrays ):
+        yieldObjects["channelYields"] = gsmData.ChannelYields( manifest["ejectiles"], theArrays["channelCounts"], manifest["residuals"], theArrays["channelYields"], newPrint )
+    if ( "nuclideValues" in theArrays ):
+        yieldObjects["nuclideYields"] = gsmData.NuclideYields( theArrays["nuclideZ"], theArrays["nuclideA"], theArrays["nuclideValues"][:, 0], theArrays["nuclideValues"][:, 1], newPrint )
+    for theName in ("mass", "charge"):
+        if ( theName + "Yields" in theArrays ):
+            yieldObjects[ theName + "Yields" ], yieldObjects[ theName + "KEDist" ] = _yieldScatters( theArrays[ theName + "Yields" ], newPrint )
+    yieldData = gsmData.ParticleYields( newPrint )
+    yieldData.setYieldObjects( **yieldObjects )
+
+    newPrint.message = "Using exported data for \"%s\" (%d arrays)." % (manifest["source"], len(theArrays))
+    newPrint.print(2, 3)
+
+    return { "pisa": pisaData, "particleData": particleData, "yields": yieldData }
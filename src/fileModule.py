@@ -3,6 +3,17 @@
 # File documentation:
 """
 This module contains various procedures to identify "facts" relating to files
+
+Files compressed with gzip, xz, or bzip2 are identified by their leading bytes
+and are decompressed as they are read.
+
+The markers (section headers and end flags) of simulation output files are
+identified by the shared \"outputMarkers\" and \"particleMarkers\" objects,
+which match the markers of a line regardless of its case.
+
+Tables of numbers are converted in bulk (see "parseTable"). Fortran number
+forms written by the simulations (e.g. "1.234-105", or numbers without
+separating spaces) are repaired during the conversion.
 """
 ################################################################################
 # EDIT LOG
@@ -15,6 +26,13 @@ This module contains various procedures to identify "facts" relating to files
 import sys
 import os
 import os.path as path
+import mmap
+import itertools
+import gzip
+import lzma
+import bz2
+import re
+import numpy as np
 
 
 # Modules:
@@ -29,6 +47,15 @@ fileAppends = ( "a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k", "l",
 "m", "n", "o", "p", "q", "r", "s", "t", "u", "v", "w", "x", "y", "z")
 numFileAppends = len(fileAppends)
 __filePrint    = Print()
+# (Compressed file formats, identified by their leading "magic" bytes)
+compressionTypes = ("gzip", "xz", "bz2")
+__compressionMagic = (b"\x1f\x8b", b"\xfd7zXZ\x00", b"BZh")
+__compressionOpen = (gzip.open, lzma.open, bz2.open)
+# (Fortran number forms: exponents written without an "E" ("1.234-105") or
+# with a "D" ("1.234D+05"), and numbers written without separating spaces)
+__fortranExponent = re.compile( r"(?<=[\d.])(?:[dD](?=[+-]?\d)|(?=[+-]\d{3}(?![\d.])))" )
+__missingToken = ""   # Padding of rows with missing values (never a number)
+__fortranNumber = re.compile( r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eEdD][+-]?\d+|[+-]\d{3}(?![\d.]))?" )
 
 
 
@@ -149,8 +176,33 @@ def fileLength( fileName ):
         __filePrint.print(1, 2)
         return 0
 
+def compressionType( fileName ):
+    """Returns the compression format of a file, determined from its leading bytes (None if not compressed)"""
+    theType = None
+
+    if ( fileExists( fileName ) ):
+        with open(fileName, 'rb') as thisFile:
+            leadingBytes = thisFile.read( 6 )
+        for typeIndx in range(0, len(compressionTypes), 1):
+            if ( leadingBytes.startswith( __compressionMagic[typeIndx] ) ):
+                theType = compressionTypes[typeIndx]
+                break
+
+    return theType
+
+def openFile( fileName ):
+    """Opens a (possibly compressed) file for reading text; compressed files are decompressed as they are read"""
+    theType = compressionType( fileName )
+    if ( theType is None ):
+        return open(fileName, 'r', encoding='ascii', errors='ignore')
+
+    __filePrint.message = "Decompressing %s data from \"%s\"." % (theType, fileName)
+    __filePrint.print(2, 3)
+    openCompressed = __compressionOpen[ compressionTypes.index(theType) ]
+    return openCompressed(fileName, 'rt', encoding='ascii', errors='ignore')
+
 def readFile( fileName, printData = False ):
-    """Reads data from a file, then returns the read data"""
+    """Reads data from a file (in a single read), then returns the read data as a list of lines"""
 
     # Initialize returned object:
     fileData = []
@@ -159,25 +211,24 @@ def readFile( fileName, printData = False ):
     doesFileExist = fileExists( fileName )
     if ( doesFileExist ):
         # File exists, get data:
-        numLines = fileLength( fileName )
-
-        # Open file for reading:
-        thisFile = open(fileName, 'r', encoding='ascii', errors='ignore')
         __filePrint.print(3, 3)
         __filePrint.message = "Reading data from \"%s\"." % (fileName)
         __filePrint.print(2, 3)
-        for i in range(0, numLines, 1):
-            lineData = thisFile.readline().strip()
-            fileData.append( lineData )
+        with openFile( fileName ) as thisFile:
+            fileText = thisFile.read()
+
+        # Split into lines (a trailing newline doesn't begin a new line):
+        fileData = fileText.split("\n")
+        if ( fileText.endswith("\n") ):
+            del fileData[-1]
+        for i in range(0, len(fileData), 1):
+            fileData[i] = fileData[i].strip()
 
             # Print line if desired:
             if ( printData ):
-                __filePrint.message = lineData
+                __filePrint.message = fileData[i]
                 __filePrint.print(2, 0)
 
-        # Close file now:
-        thisFile.close()
-
     else:
         # File doesn't exist, no data to return
         __filePrint.message = "File \"%s\" doesn't exist." % (fileName)
@@ -186,6 +237,67 @@ def readFile( fileName, printData = False ):
     # Return object:
     return fileData
 
+def iterateFile( fileName, printData = False ):
+    """Reads data from a file (buffered), yielding each line of the file as it is read"""
+
+    # Obtain data
+    doesFileExist = fileExists( fileName )
+    if ( doesFileExist ):
+        # File exists, get data:
+        __filePrint.print(3, 3)
+        __filePrint.message = "Reading data from \"%s\"." % (fileName)
+        __filePrint.print(2, 3)
+        with openFile( fileName ) as thisFile:
+            for lineData in thisFile:
+                lineData = lineData.strip()
+
+                # Print line if desired:
+                if ( printData ):
+                    __filePrint.message = lineData
+                    __filePrint.print(2, 0)
+
+                yield lineData
+
+    else:
+        # File doesn't exist, no data to return
+        __filePrint.message = "File \"%s\" doesn't exist." % (fileName)
+        __filePrint.print(1, 2)
+
+    return
+
+def mapFile( fileName ):
+    """Memory-maps a file for reading, then returns the map (None if the file can't be mapped)"""
+
+    # Ensure file exists and has data (empty files can't be mapped):
+    if ( not fileExists( fileName ) ):
+        __filePrint.message = "File \"%s\" doesn't exist. Cannot map file." % (fileName)
+        __filePrint.print(1, 2)
+        return None
+    if ( path.getsize( fileName ) <= 0 ):
+        __filePrint.message = "File \"%s\" is empty. Cannot map file." % (fileName)
+        __filePrint.print(1, 2)
+        return None
+    if ( compressionType( fileName ) is not None ):
+        __filePrint.message = "File \"%s\" is compressed. Cannot map file." % (fileName)
+        __filePrint.print(1, 2)
+        return None
+
+    # Map the file (the map remains valid after the file is closed):
+    __filePrint.message = "Mapping data from \"%s\"." % (fileName)
+    __filePrint.print(2, 3)
+    with open(fileName, 'rb') as thisFile:
+        mappedData = mmap.mmap( thisFile.fileno(), 0, access=mmap.ACCESS_READ )
+
+    return mappedData
+
+def textSize( dataLines ):
+    """Returns the memory (in bytes) used by a list of lines, including the list itself"""
+    theSize = sys.getsizeof( dataLines )
+    for dataLine in dataLines:
+        theSize += sys.getsizeof( dataLine )
+
+    return theSize
+
 def __removeEmpty( data ):
     """Removes empty elements in an array"""
     data = list( filter(None, data) )
@@ -203,3 +315,221 @@ def parseLine( dataLine, separator = " ", maxSplits = None ):
         parseData[i] = parseData[i].strip()
 
     return __removeEmpty( parseData )
+
+def convertNumbers( dataValues, defaultValue = 0.00 ):
+    """
+    Converts a sequence of values (numbers or strings) in bulk to a 1-D array of
+    floats. Fortran number forms (\"1.234-105\", \"1.234D+05\") are repaired.
+    Values that still can't be converted are set to the default value (which
+    may be NaN). Returns the array and a mask flagging these values.
+    """
+    numValues = len( dataValues )
+
+    # Convert all values at once (nearly always successful):
+    try:
+        return np.array( dataValues, dtype=float ).reshape( numValues ), np.zeros( numValues, dtype=bool )
+    except ValueError:
+        pass
+
+    # Repair all Fortran forms at once, then convert values individually:
+    repairedValues = __fortranExponent.sub( "e", "\n".join( [str(theValue) for theValue in dataValues] ) ).split( "\n" )
+    theValues = np.full( numValues, defaultValue, dtype=float )
+    badMask = np.zeros( numValues, dtype=bool )
+    for valIndx in range(0, numValues, 1):
+        try:
+            theValues[valIndx] = float( repairedValues[valIndx] )
+        except ValueError:
+            badMask[valIndx] = True
+
+    return theValues, badMask
+
+def conversionMessage( badValues, tableName, defaultValue = 0.00 ):
+    """Returns a single message summarizing the values of a table that could not be converted"""
+    return "Failed to convert %d element(s) of the %s to float (e.g. \"%s\"). Using %s for these elements." % (len(badValues), tableName, badValues[0], defaultValue)
+
+def _splitFortranRow( dataLine ):
+    """
+    Returns the numbers of a line whose Fortran numbers may run together (e.g.
+    \"1.0-2.0\"), or None if the line can't be split unambiguously. Numbers that
+    run together must be separated by the sign of the second number, and the
+    numbers must account for every character of the line (besides whitespace).
+    """
+    theTokens = []
+    lastEnd = 0
+    for theMatch in __fortranNumber.finditer( dataLine ):
+        theGap = dataLine[ lastEnd : theMatch.start() ]
+        if ( not theGap.strip() == "" ):
+            return None
+        if ( theGap == "" and len(theTokens) > 0 and not theMatch.group(0)[:1] in "+-" ):
+            return None
+        theTokens.append( theMatch.group(0) )
+        lastEnd = theMatch.end()
+    if ( not dataLine[ lastEnd : ].strip() == "" ):
+        return None
+
+    return theTokens
+
+def parseTable( dataLines, numColumns, defaultValue = 0.00 ):
+    """
+    Converts the whitespace separated values of many lines in bulk to a 2-D
+    array of floats (one row per line, 'numColumns' columns). Rows with too few
+    values are checked for Fortran numbers written without separating spaces.
+    Values that can't be converted (or are missing) are set to the default value.
+    Returns the array and a list of the values that could not be converted.
+    """
+    numRows = len( dataLines )
+    badValues = []
+
+    # Obtain each row's values, separating numbers that run together:
+    rowTokens = [ dataLine.split() for dataLine in dataLines ]
+    completeRows = True
+    for rowIndx in range(0, numRows, 1):
+        if ( len(rowTokens[rowIndx]) < numColumns ):
+            theTokens = _splitFortranRow( dataLines[rowIndx] )
+            if ( theTokens is not None and len(theTokens) == numColumns ):
+                rowTokens[rowIndx] = theTokens
+        if ( not len(rowTokens[rowIndx]) == numColumns ):
+            completeRows = False
+
+    # Pad incomplete rows (noting any missing values; the padding can't be
+    # converted, so missing values are set to the default value):
+    if ( not completeRows ):
+        for rowIndx in range(0, numRows, 1):
+            numMissing = numColumns - len(rowTokens[rowIndx])
+            if ( numMissing > 0 ):
+                badValues.append( "(%d missing on row %d: \"%s\")" % (numMissing, rowIndx+1, dataLines[rowIndx].strip()) )
+                rowTokens[rowIndx] = rowTokens[rowIndx] + numMissing*[__missingToken]
+            else:
+                rowTokens[rowIndx] = rowTokens[rowIndx][ : numColumns]
+
+    # Convert all values at once:
+    allTokens = list( itertools.chain.from_iterable(rowTokens) )
+    tableData, badMask = convertNumbers( allTokens, defaultValue )
+    for valIndx in np.flatnonzero( badMask ):
+        if ( not allTokens[valIndx] == __missingToken ):
+            badValues.append( allTokens[valIndx] )
+
+    return tableData.reshape( numRows, numColumns ), badValues
+
+
+def parseBinnedTable( dataLines, numValues, defaultValue = 0.00 ):
+    """
+    Converts the rows of a binned table (\"lower-upper value value ...\") in
+    bulk to bin bounds and a 2-D array of bin values ('numValues' columns).
+    Error flags (\"+/-\") between values are ignored, and an empty bin is
+    inserted wherever a row's lower bound doesn't match the previous row's
+    upper bound. Returns the bin bounds, the values, and a list of the values
+    that could not be converted.
+    """
+    # Separate each row's bin bounds ("lo-hi" or "lo- hi") and drop error flags:
+    tableRows = [ dataLine.replace("-", " ", 1).replace("+/-", " ") for dataLine in dataLines ]
+
+    # Convert the whole table at once:
+    tableData, badValues = parseTable( tableRows, numValues+2, defaultValue )
+
+    # Obtain bins, inserting an empty bin at each gap:
+    lowerBins = tableData[:, 0]
+    upperBins = tableData[:, 1]
+    gapIndx = np.flatnonzero( lowerBins[1:] != upperBins[:-1] ) + 1
+    theBins = np.concatenate( (lowerBins[:1], np.insert(upperBins, gapIndx, lowerBins[gapIndx])) )
+    theValues = np.insert( tableData[:, 2:], gapIndx, 0.00, axis=0 )
+
+    return theBins, theValues, badValues
+
+
+class MarkerMatcher:
+    """
+    The \"MarkerMatcher\" object determines which of several markers a line
+    contains. All markers are compiled into a single case-insensitive regular
+    expression, so each line is checked against every marker at once and no
+    lines need to be converted to lower case. Any run of whitespace within a
+    marker matches any run of whitespace in the line.
+    -startMarkers: Markers found at the start of a (stripped) line, as
+    \t(name, text) pairs.
+    -containedMarkers: Markers found anywhere in a line, as (name, text) pairs.
+    Several markers may share a name.
+    """
+
+    def __init__(self, startMarkers = (), containedMarkers = () ):
+        """Constructor for the matcher"""
+        self.__startNames, self.__startPattern = self.__compile( startMarkers, r"(?:%s)" )
+        # (Lines can't start with a marker unless they start with one of its first characters)
+        self.__startChars = set()
+        for (theName, theText) in startMarkers:
+            self.__startChars.update( (theText[0].lower(), theText[0].upper()) )
+        self.__containedNames, self.__containedPattern = self.__compile( containedMarkers, r"(?:%s)" )
+
+        return
+
+    def __compile(self, theMarkers, patternFormat):
+        """Returns the marker names (by group number) and the compiled pattern of the markers"""
+        theNames = [None]
+        theGroups = []
+        for (theName, theText) in theMarkers:
+            theNames.append( theName )
+            theGroups.append( "(%s)" % (r"\s+".join( [re.escape(word) for word in theText.split()] )) )
+        if ( len(theGroups) == 0 ):
+            return tuple(theNames), None
+
+        return tuple(theNames), re.compile( patternFormat % ("|".join(theGroups)), re.IGNORECASE )
+
+    def match(self, dataLine):
+        """Returns the name of the marker starting the line and the (stripped) remainder of the line ((None, "") if not found)"""
+        if ( self.__startPattern is not None and dataLine[:1] in self.__startChars ):
+            theMatch = self.__startPattern.match( dataLine )
+            if ( theMatch is not None ):
+                return self.__startNames[ theMatch.lastindex ], dataLine[ theMatch.end() : ].strip()
+
+        return None, ""
+
+    def queryStartChars(self):
+        """Returns the characters that may start a line starting with a marker"""
+        return frozenset( self.__startChars )
+
+    def find(self, dataLine):
+        """Returns the name of the first marker contained in the line (None if not found)"""
+        if ( self.__containedPattern is not None ):
+            theMatch = self.__containedPattern.search( dataLine )
+            if ( theMatch is not None ):
+                return self.__containedNames[ theMatch.lastindex ]
+
+        return None
+
+
+# Markers of simulation (CEM, GSM, LAQGSM) output files:
+outputMarkers = MarkerMatcher(
+    (
+        # (Particle data headers; also the end of particle data and yields)
+        ("stars", "**********************************"),
+        # (Yield headers)
+        ("channelYields", "yields of different channels (with > 1 mb):"),
+        ("nuclideYields", "*************** nuclide yields [mb]  (zero values suppressed) *****************"),
+        ("massYields", "mass yield [mb] and the mean and variance of the kinetic energy [mev]"),
+        ("chargeYields", "charge yield [mb] and the mean and variance of the  kinetic energy [mev]"),
+        # (PISA headers and end flags)
+        ("doubleDiff", "double differential cross-section d2s/dtdo (mb/mev/sr) of"),
+        ("doubleDiffEnd", "energ."),
+        ("energyInt", "angular distribution of produced fragments ds/dom [mb/sr] for energy range(mev)"),
+        ("energyIntEnd", "int. x sec"),
+        ("energyIntEnd", "int. xsec")
+    ),
+    (
+        # (Particle data energy spectra)
+        ("energySpectrum", "energy spectrum [mb/mev]"),
+        ("integrated", "integrated:")
+    )
+)
+yieldMarkers = ("channelYields", "nuclideYields", "massYields", "chargeYields")
+
+# Particles whose data is printed in simulation output files:
+particleMarkers = MarkerMatcher( (), (
+    ("neutrons", "neutrons"),
+    ("protons", "protons"),
+    ("deuterons", "deuterons"),
+    ("tritons", "tritons"),
+    ("helium-3", "helium-3"),
+    ("alphas", "alphas"),
+    ("neg. pions", "neg. pions"),
+    ("neut pions", "neut pions"),
+    ("pos. pions", "pos. pions")
+) )
@@ -18,6 +18,7 @@ The module contains class objects named:
 ################################################################################
 # IMPORTS:
 import sys
+import numpy as np
 
 # MODULES:
 import fileModule
@@ -30,7 +31,8 @@ __version__ = "1.0.0"
 class Histogram:
     """
     The \"Histogram\" object stores information for bin bounds and all
-    associated values. The histogram object has some options that can be used:
+    associated values (as arrays). The histogram object has some options that
+    can be used:
     -enforceMinValues (True): Forces all Y-values and bin bounds to be larger
     \tthan some pre-specified value. Minimum values exist for both bins bounds
     \tand the associated values.
@@ -38,7 +40,11 @@ class Histogram:
     -removeLastZeroValuedBinValues (True): Removes all zero-valued Y-values
     \tthat exist at the end of the passed in histogram data.
     \tIn essence, this option truncates the data to only the data that is useful.
+    The bins and values may be given as lists, tuples, or arrays; arrays of
+    floats are used without being copied (and are never modified). The bin
+    bounds and values are returned to clients as read-only arrays.
     """
+    __slots__ = ("__write", "__note", "__yValues", "__numYValues", "__binBounds", "__numBins")
     # Options:
     __enforceMinValues = True
     __minBinValAllowed = 0.00
@@ -67,83 +73,82 @@ class Histogram:
     def __resetMembers(self):
         """Resets all members"""
         self.__note = "No information given"
-        self.__yValues = []
+        self.__yValues = np.zeros( 0 )
         self.__numYValues = 0
-        self.__binBounds = []
+        self.__binBounds = np.zeros( 0 )
         self.__numBins = 0
 
         return
 
+    def __readOnly(self, theArray):
+        """Returns a read-only view of an array"""
+        theView = theArray.view()
+        theView.flags.writeable = False
+        return theView
+
+    def __toArray(self, someValues, valueName):
+        """Returns the values as a 1-D array of floats (converting them in bulk when needed)"""
+        try:
+            return np.asarray( someValues, dtype=float ).reshape( -1 )
+        except (ValueError, TypeError):
+            pass
+
+        theValues, badMask = fileModule.convertNumbers( list(someValues) )
+        badValues = [ str(theValue) for (theValue, isBad) in zip(someValues, badMask) if isBad ]
+        self.__write.message = fileModule.conversionMessage( badValues, "histogram's " + valueName )
+        self.__write.print(1, 2)
+
+        return theValues
+
     def __findLastNonZeroEntryIndex(self, someValues):
-        """Finds the last non-zero valued entry in a list or tuple"""
+        """Finds the last non-zero valued entry in an array (the first entry is always kept)"""
         lastIndex = None
 
-        # Ensure the numbers are a list/tuple of floats or ints:
-        if ( not isinstance(someValues, (list, tuple)) ):
-            self.__write.message = "Cannot find the last non-zero valued entry in any type except lists or tuples."
-            self.__write.print(1, 2)
-            return lastIndex
-
         # Find last non-zero valued index:
-        lastValidIndex = len(someValues) - 1
-        for i in range(0, lastValidIndex, 1):
-            lastIndex = lastValidIndex-i
-            if ( someValues[lastIndex] > 0 ):
-                break
+        if ( len(someValues) > 1 ):
+            positiveIndx = np.flatnonzero( someValues[1 : ] > 0 )
+            if ( len(positiveIndx) > 0 ):
+                lastIndex = positiveIndx[-1] + 1
+            else:
+                lastIndex = 1
 
         return lastIndex
 
     def __setBinsAndValues(self, binBounds, yVals):
         """Sets bin bounds and values"""
 
-        # Verify that bins and values are lists:
-        validBins   = isinstance(binBounds,   list)
-        validValues = isinstance(yVals, list)
+        # Verify that bins and values are sequences:
+        validBins   = isinstance(binBounds, (list, tuple, np.ndarray))
+        validValues = isinstance(yVals, (list, tuple, np.ndarray))
         if ( (not validBins) or (not validValues) ):
-            self.__write.message = "Invalid bins or values passed were passed in to the general Histogram object. Parameters must be lists."
+            self.__write.message = "Invalid bins or values passed were passed in to the general Histogram object. Parameters must be lists, tuples, or arrays."
             self.__write.print(0, 1)
             return
 
-        # Convert to floats:
-        for i in range(0, len(binBounds), 1):
-            try:
-                binBounds[i] = float( binBounds[i] )
-            except:
-                self.__write.message = "Unable to convert bin bound %d (%s) to float. Assuming value is 0." % ( (i+1), str(binBounds[i]) )
-                self.__write.print(1, 2)
-                binBounds[i] = 0
-        for i in range(0, len(yVals), 1):
-            try:
-                yVals[i] = float( yVals[i] )
-            except:
-                self.__write.message = "Unable to convert bin value %i (%s) to float. Assuming value is 0." % ( (i+1), str(yVals[i]) )
-                self.__write.print(1, 2)
-                yVals[i] = 0
+        # Convert to floats (the client's data is not modified):
+        binBounds = self.__toArray( binBounds, "bin bounds" )
+        yVals = self.__toArray( yVals, "values" )
+        if ( len(binBounds) == 0 ):
+            self.__write.message = "No bin bounds were passed in to the general Histogram object."
+            self.__write.print(1, 2)
+            return
 
         # Ensure only positive values (for bins, values)
         if ( self.__enforceMinValues ):
             # (Shift all values up to ensure >=0)
-            shiftValue = 0
-            badBinBound = 0
-            for i in range(0, len(yVals), 1):
-                shiftValue = min(shiftValue, yVals[i])
-                badBinBound = min(badBinBound, yVals[i])
-            if ( shiftValue < self.__minYValueAllowed ):
-                shiftValue = abs(shiftValue)
-                self.__write.message = "Unallowed lowest bin value (%.3f). Shifting all values up by (%.3f)." % (badBinBound, shiftValue)
-                self.__write.print(0, 1)
-                for i in range(0, len(yVals), 1):
-                    yVals[i] += shiftValue
+            if ( len(yVals) > 0 ):
+                shiftValue = min( 0, yVals.min() )
+                if ( shiftValue < self.__minYValueAllowed ):
+                    self.__write.message = "Unallowed lowest bin value (%.3f). Shifting all values up by (%.3f)." % (shiftValue, abs(shiftValue))
+                    self.__write.print(0, 1)
+                    yVals = yVals + abs(shiftValue)
 
             # (Do same for bins)
             if ( binBounds[0] < self.__minBinValAllowed ):
                 shiftValue = -binBounds[0]
                 self.__write.message = "The lower bin boundary (%.3f) is below %.3f. Shifting all values up by (%.3f)." % (binBounds[0], self.__minBinValAllowed, shiftValue)
                 self.__write.print(0, 1)
-            else:
-                shiftValue = 0
-            for i in range(0, len(binBounds), 1):
-                binBounds[i] = shiftValue + binBounds[i]
+                binBounds = binBounds + shiftValue
 
         if ( self.__removeLastZeroValuedBinValues ):
             lastNonZeroIndx = self.__findLastNonZeroEntryIndex(yVals)
@@ -156,24 +161,22 @@ class Histogram:
 
         # Determine how many values to use (only accept minimum of what given data allows)
         numValues = min( lastNonZeroIndx, (len(binBounds)-1) )
+        binBounds = binBounds[ : numValues+1]
 
-        # Set bin values:
-        self.__binBounds.append( binBounds[0] )
-        for i in range(1, (numValues+1), 1):
-            # Ensure bin value is larger than last:
-            if ( binBounds[i] < binBounds[i-1] ):
-                self.__write.message = "The bin has smaller value than previous (range [%.2f, %.2f))." % (binBounds[i-1], binBounds[i])
-                self.__write.print(1, 3)
-                self.__write.message = "   Setting bin width to %.3f." % (self.__defaultBinWidth)
-                self.__write.print(1, 3)
-                binBounds[i] = binBounds[i-1]
-            self.__binBounds.append( binBounds[i] )
-        self.__numBins = len( self.__binBounds ) - 1
-
+        # Ensure each bin bound is no smaller than the last:
+        decreasingBins = np.flatnonzero( binBounds[1 : ] < binBounds[ : -1] )
+        if ( len(decreasingBins) > 0 ):
+            theIndx = decreasingBins[0]
+            self.__write.message = "%d bin(s) have a smaller value than the previous bin (e.g. range [%.2f, %.2f))." % (len(decreasingBins), binBounds[theIndx], binBounds[theIndx+1])
+            self.__write.print(1, 3)
+            self.__write.message = "   Setting these bin widths to 0."
+            self.__write.print(1, 3)
+            binBounds = np.maximum.accumulate( binBounds )
 
-        # Valid particle was found, now set data:
-        for i in range(0, numValues, 1):
-            self.__yValues.append( yVals[i] )
+        # Set bins and data:
+        self.__binBounds = binBounds
+        self.__numBins = len( self.__binBounds ) - 1
+        self.__yValues = yVals[ : numValues]
         self.__numYValues = len( self.__yValues )
 
         return
@@ -203,37 +206,37 @@ class Histogram:
     def appendDataPoint(self, upperBinBound, yValue):
         """Appends a data point to the end of the histogram"""
         # Check for errors:
-        if ( self.__forcePositiveValues ):
-            if ( yValue < 0 ):
-                self.__write.message = "Cannot append bin value (%.3f) below 0. Setting to 0..." % (yValue)
+        if ( self.__enforceMinValues ):
+            if ( yValue < self.__minYValueAllowed ):
+                self.__write.message = "Cannot append bin value (%.3f) below %.3f. Setting to %.3f..." % (yValue, self.__minYValueAllowed, self.__minYValueAllowed)
                 self.__write.print(1, 3)
-                yValue = 0
-        # Ensure new upper bin bound exceeds the last largest bin:
-        if ( upperBinBound < self.__binBounds[ self.__numBins ] ):
-            self.__write.message = "Invalid end-bin value (%f) given. Setting to 5 more than last bin..." % (upperBinBound)
-            self.__write.print(1, 3)
-            upperBinBound = self.__binBounds[ self.__numBins ] + 5
+                yValue = self.__minYValueAllowed
         if ( len(self.__binBounds) == 0 ):
             # No bins have been set; start at 0 for user:
-            self.__binBounds.append( 0.00 )
+            self.__binBounds = np.zeros( 1 )
             self.__write.message = "No starting bin value was established. Assuming starting bin value is %.3f." % (self.__binBounds[0])
             self.__write.print(1, 3)
+        # Ensure new upper bin bound exceeds the last largest bin:
+        if ( upperBinBound < self.__binBounds[ self.__numBins ] ):
+            self.__write.message = "Invalid end-bin value (%f) given. Setting to %.3f more than last bin..." % (upperBinBound, self.__defaultBinWidth)
+            self.__write.print(1, 3)
+            upperBinBound = self.__binBounds[ self.__numBins ] + self.__defaultBinWidth
 
         # Append data point:
-        self.__binBounds.append( upperBinBound )
+        self.__binBounds = np.append( self.__binBounds, float(upperBinBound) )
         self.__numBins += 1
-        self.__yValues.append( yValue )
+        self.__yValues = np.append( self.__yValues, float(yValue) )
         self.__numYValues += 1
 
         return
 
     def queryYValues(self):
-        """Returns the Y-vaules of the histogram object"""
-        return self.__yValues
+        """Returns the Y-vaules of the histogram object (as a read-only array)"""
+        return self.__readOnly( self.__yValues )
 
     def queryBinBounds(self):
-        """Returns the bin bounds for the histogram object"""
-        return self.__binBounds
+        """Returns the bin bounds for the histogram object (as a read-only array)"""
+        return self.__readOnly( self.__binBounds )
 
     def queryNumYValues(self):
         """Returns the number of data points that exist in the particle"""
@@ -245,7 +248,7 @@ class Histogram:
 
     def queryBoundsAndValues(self):
         """Returns the bin bounds and associated values to client"""
-        return (self.getBinBounds(), self.getYValues())
+        return (self.queryBinBounds(), self.queryYValues())
 
     def queryNote(self):
         """Returns the note stored in the histogram object"""
@@ -253,22 +256,21 @@ class Histogram:
 
     def queryLargestValue(self):
         """Returns the largest value in the histogram"""
-        maxVal = -float("inf")
-        for indx in range(0, self.__numYValues, 1):
-            maxVal = max(maxVal, self.__yValues[indx])
-
-        return maxVal
+        if ( self.__numYValues == 0 ):
+            return -float("inf")
+        return float( self.__yValues.max() )
 
 
 class Scatter:
     """
     The \"Scatter\" object stores X/Y data for a histogram. In addition, the
     relative error for each point can be stored in the scatter object as well
-    for plotting error plots.
+    for plotting error plots. The points are stored in arrays of floats.
     \tNOTE: The object does NOT support assymetric errors, only single-valued
     \t      errors for both the X and Y points. Error values are assumed in
     \t      the case of mismatched list/tuple sizes.
     """
+    __slots__ = ("__write", "__xVals", "__yVals", "__xError", "__yError", "__numDataPoints")
     __defaultXValue = 0.00
     __defaultYValue = 0.00
     __defaultXError = 0.00
@@ -303,30 +305,24 @@ class Scatter:
             newPrint.print(1, 2)
             return newScatter
 
-        # Read data:
-        theFilesData = fileModule.readFile( fileName )
-
-        # Manipulate data read:
-        for i in range(0, len(theFilesData), 1):
+        # Read data (streamed; each line is reduced as it is read):
+        fileData = []
+        for lineData in fileModule.iterateFile( fileName ):
             # Remove all comments:
             for j in range(0, __numCommentFlags, 1):
-                if ( __commentFlags[j] in theFilesData[i] ):
-                    lineData = theFilesData[i]
+                if ( __commentFlags[j] in lineData ):
                     lineData = lineData[ : len(__commentFlags[j])-1 ]
-                    theFilesData[i] = lineData.rstrip()
+                    lineData = lineData.rstrip()
 
             # Remove tabs:
-            theFilesData[i] = theFilesData[i].replace("\t", " ")
+            lineData = lineData.replace("\t", " ")
 
-        # Store fileData:
-        fileData = []
-        for i in range(0, len(theFilesData), 1):
             # Ignore blank lines:
-            if ( theFilesData[i] == "" ):
+            if ( lineData == "" ):
                 continue
             else:
                 # Store information:
-                fileData.append( theFilesData[i].strip().lower() )
+                fileData.append( lineData.strip().lower() )
 
         # Obtain headers line, remove from data set, and determine how data is parsed:
         headerLine = fileData[0]
@@ -470,16 +466,24 @@ class Scatter:
 
     def __resetMembers(self):
         """Resets all members in the Scatter object"""
-        self.__xVals = []
-        self.__yVals = []
-        self.__xError = []
-        self.__yError = []
+        self.__xVals = np.zeros( 0 )
+        self.__yVals = np.zeros( 0 )
+        self.__xError = np.zeros( 0 )
+        self.__yError = np.zeros( 0 )
         self.__numDataPoints = 0
 
         return
 
+    def __readOnly(self, theArray):
+        """Returns a read-only view of an array (None if the array is empty)"""
+        if ( len(theArray) == 0 ):
+            return None
+        theView = theArray.view()
+        theView.flags.writeable = False
+        return theView
+
     def __validateXYInputs(self, someVals, type):
-        """Validates the values passed in and returns the list"""
+        """Validates the values passed in and returns them as an array of floats"""
         newValues = None
 
         # Check type (for printing and default values)
@@ -498,35 +502,24 @@ class Scatter:
             defaultValue = self.__defaultXValue
 
         # Validate arguments:
-        validVals = isinstance(someVals, (list, tuple))
+        validVals = isinstance(someVals, (list, tuple, np.ndarray))
         if ( not validVals ):
-            self.__write.message = "A list or tuple of %s values must be used for establishing Scatter object's values." % (type)
+            self.__write.message = "A list, tuple, or array of %s values must be used for establishing Scatter object's values." % (type)
             self.__write.print(1, 2)
             return newValues
 
-        # Create a list of float values:
-        if ( len(someVals) > 0 ):
-            newValues = []
-            for i in range(0, len(someVals), 1):
-                # Convert value to float if not a float/int:
-                theValue = someVals[i]
-                if ( not isinstance(theValue, (float, int)) ):
-                    try:
-                        theValue = float(theValue)
-                    except:
-                        self.__write.message = "Unable to convert %s-value in Scatter object to float: " %( type ), theValue
-                        self.__write.print(1, 2)
-                        someVal = defaultValue
-                        self.__write.message = "   Using a value of %.3f." % (theValue)
-                        self.__write.print(1, 2)
-
-                # Now append the value to the list:
-                newValues.append( theValue )
+        # Create an array of float values (converted at once; one message for all failures):
+        theValues, badMask = fileModule.convertNumbers( someVals, defaultValue )
+        if ( badMask.any() ):
+            badValues = [ str(theValue) for (theValue, isBad) in zip(someVals, badMask) if isBad ]
+            self.__write.message = fileModule.conversionMessage( badValues, "Scatter object's %s-values" % (type), defaultValue )
+            self.__write.print(1, 2)
+        newValues = theValues
 
         return newValues
 
-    def __validateXYErrorInput(self, errorVals, flag):
-        """Returns a list of values for the error bars (X or Y)."""
+    def __validateXYErrorInput(self, errorVals, flag, numPoints):
+        """Returns an array of values for the error bars (X or Y) of 'numPoints' points."""
         newErrorVals = None
 
         flag = flag.strip().lower()
@@ -538,36 +531,34 @@ class Scatter:
             flag = "?"
             defaultValue = self.__defaultXError
 
-        # Create valid list of numbers:
-        errorVals = self.__validateXYInputs(errorVals, "x-error")
-        if ( errorVals == None ):
+        # Create valid array of numbers:
+        errorVals = self.__validateXYInputs(errorVals, flag)
+        if ( errorVals is None ):
             return newErrorVals
 
         # Append the default value if the length doesn't match the X/Y sets:
-        if ( len(errorVals) < self.__numDataPoints ):
+        if ( len(errorVals) < numPoints ):
             self.__write.message = "The %s length doesn't match the X or Y value length." % (flag)
             self.__write.print(1, 2)
             self.__write.message = "   Using a default value of %.3f for all other %s values." % (defaultValue, flag)
-            for i in range(len(errorVals), self.__numDataPoints, 1):
-                errorVals.append( defaultValue )
+            self.__write.print(1, 2)
+            errorVals = np.concatenate( (errorVals, np.full(numPoints - len(errorVals), defaultValue)) )
 
-        # Add to list of X-error bars:
+        # Use an error bar for each point:
         if ( len(errorVals) > 0 ):
-            newErrorVals = []
-            for i in range(0, len(errorVals), 1):
-                newErrorVals.append( errorVals[i] )
+            newErrorVals = errorVals[ : numPoints]
 
         return newErrorVals
 
     def __setXY(self, xVals, yVals):
         """Sets the X and Y coordinates and error values (if present)"""
 
-        # Obtain lists of valid numbers:
+        # Obtain arrays of valid numbers:
         xVals = self.__validateXYInputs(xVals, "x")
         yVals = self.__validateXYInputs(yVals, "y")
 
-        # Append valid arguments if /= None:
-        if ( (not xVals == None) and (not yVals == None) ):
+        # Set valid arguments if /= None:
+        if ( (xVals is not None) and (yVals is not None) ):
             numCompletePairs = min( len(xVals), len(yVals) )
             # Warn user if numbers are being dropped:
             if ( not len(xVals) == len(yVals) ):
@@ -575,95 +566,86 @@ class Scatter:
                 self.__write.print(1, 2)
                 self.__write.message = "   Using data up to the number of complete pairs (%d)." % (numCompletePairs)
                 self.__write.print(1, 2)
-            # Append values:
-            for i in range(0, numCompletePairs, 1):
-                self.__xVals.append( xVals[i] )
-                self.__yVals.append( yVals[i] )
-                self.__numDataPoints += 1
+            # Set values:
+            self.__xVals = xVals[ : numCompletePairs]
+            self.__yVals = yVals[ : numCompletePairs]
+            self.__numDataPoints = numCompletePairs
 
         return
 
     def __setXYError(self, xError=None, yError=None):
         """Sets the X/Y error values if given."""
-        if( not xError == None ):
+        if( xError is not None ):
             self.__setXError(xError)
-        if( not yError == None ):
+        if( yError is not None ):
             self.__setYError(yError)
         return
 
     def __setXError(self, xError):
         """Sets the X-error values."""
-        xError = self.__validateXYErrorInput(xError, "x-error")
-        if ( not xError == None ):
-            for i in range(0, len(xError), 1):
-                self.__xError.append( xError[i] )
+        xError = self.__validateXYErrorInput(xError, "x-error", self.__numDataPoints)
+        if ( xError is not None ):
+            self.__xError = xError
 
         return
 
     def __setYError(self, yError):
         """Sets the Y-error values."""
-        yError = self.__validateXYErrorInput(yError, "y-error")
-        if ( not yError == None ):
-            for i in range(0, len(yError), 1):
-                self.__yError.append( yError[i] )
+        yError = self.__validateXYErrorInput(yError, "y-error", self.__numDataPoints)
+        if ( yError is not None ):
+            self.__yError = yError
 
         return
 
-    def addPoint(self, xVal, yVal, xErr=None, yErr=None):
-        """Adds a point (and any potential data) to the Scatter object"""
-
-        # Ensure X/Y variable is float/int and append:
-        if ( not isinstance(xVal, (float, int)) ):
-            try:
-                xVal = float(xVal)
-            except:
-                self.__write.message = "Unable to convert the X-value to float: ", xVal
-                self.__write.print(1, 2)
-                xVal = self.__defaultXValue
-                self.__write.message = "   Using value of %.3f for the X-value." % (xVal)
-                self.__write.print(1, 2)
-        self.__xVals.append( xVal )
-        if ( not isinstance(yVal, (float, int)) ):
-            try:
-                yVal = float(yVal)
-            except:
-                self.__write.message = "Unable to convert the Y-value to float: ", yVal
-                self.__write.print(1, 2)
-                yVal = self.__defaultYValue
-                self.__write.message = "   Using value of %.3f for the Y-value." % (yVal)
-                self.__write.print(1, 2)
-        self.__yVals.append( yVal )
-        self.__numDataPoints += 1
+    def __appendErrors(self, theErrors, newErrors, flag, defaultValue, numPoints):
+        """Returns the existing error values with those of new points appended (defaults are used when not given)"""
+        if ( newErrors is None ):
+            newErrors = np.full( numPoints, defaultValue )
+        else:
+            newErrors = self.__validateXYErrorInput(newErrors, flag, numPoints)
+            if ( newErrors is None ):
+                newErrors = np.full( numPoints, defaultValue )
+
+        return np.concatenate( (theErrors, newErrors) )
+
+    def addPoints(self, xVals, yVals, xErr=None, yErr=None):
+        """
+        Adds many points (and any potential error values) to the Scatter object
+        at once. Error values are only stored if the object has error values;
+        default error values are used for the new points when none are given.
+        """
+        # Obtain arrays of valid numbers:
+        xVals = self.__validateXYInputs(xVals, "x")
+        yVals = self.__validateXYInputs(yVals, "y")
+        if ( xVals is None or yVals is None ):
+            return
+        numNewPoints = min( len(xVals), len(yVals) )
+        if ( not len(xVals) == len(yVals) ):
+            self.__write.message = "Size of X/Y pairs added to the Scatter object do not match."
+            self.__write.print(1, 2)
+            self.__write.message = "   Using data up to the number of complete pairs (%d)." % (numNewPoints)
+            self.__write.print(1, 2)
 
         # Add x/y error points if present:
         if ( len(self.__xError) > 0 ):
-            if ( xErr == None ):
-                self.__xError.append( self.__defaultXError )
-            else:
-                if ( not isinstance(xErr, (float, int)) ):
-                    try:
-                        xErr = float(xErr)
-                    except:
-                        self.__write.message = "Unable to convert the X-error value to float: ", xErr
-                        self.__write.print(1, 2)
-                        xErr = self.__defaultXError
-                        self.__write.message = "   Using value of %.3f for the X-error value." % (xErr)
-                        self.__write.print(1, 2)
-                self.__xError.append( xErr )
+            self.__xError = self.__appendErrors(self.__xError, xErr, "x-error", self.__defaultXError, numNewPoints)
         if ( len(self.__yError) > 0 ):
-            if ( yErr == None ):
-                self.__yError.append( self.__defaultYError )
-            else:
-                if ( not isinstance(yErr, (float, int)) ):
-                    try:
-                        yErr = float(yErr)
-                    except:
-                        self.__write.message = "Unable to convert the Y-error value to float: ", yErr
-                        self.__write.print(1, 2)
-                        yErr = self.__defaultYError
-                        self.__write.message = "   Using value of %.3f for the Y-error value." % (yErr)
-                        self.__write.print(1, 2)
-                self.__yError.append( yErr )
+            self.__yError = self.__appendErrors(self.__yError, yErr, "y-error", self.__defaultYError, numNewPoints)
+
+        # Append points:
+        self.__xVals = np.concatenate( (self.__xVals, xVals[ : numNewPoints]) )
+        self.__yVals = np.concatenate( (self.__yVals, yVals[ : numNewPoints]) )
+        self.__numDataPoints += numNewPoints
+
+        return
+
+    def addPoint(self, xVal, yVal, xErr=None, yErr=None):
+        """Adds a point (and any potential data) to the Scatter object"""
+        if ( xErr is not None ):
+            xErr = [xErr]
+        if ( yErr is not None ):
+            yErr = [yErr]
+        self.addPoints( [xVal], [yVal], xErr, yErr )
 
         return
 
@@ -672,48 +654,26 @@ class Scatter:
         return self.__numDataPoints
 
     def getXValues(self):
-        """Returns the X values of the points as a tuple"""
-        xVals = None
-        if ( len(self.__xVals) > 0 ):
-            xVals = []
-            for i in range(0, len(self.__xVals), 1):
-                xVals.append(self.__xVals[i])
-        return xVals
+        """Returns the X values of the points as a read-only array (None if no points exist)"""
+        return self.__readOnly( self.__xVals )
 
     def getYValues(self):
-        """Returns the Y values of the points as a tuple"""
-        yVals = None
-        if ( len(self.__yVals) > 0 ):
-            yVals = []
-            for i in range(0, len(self.__yVals), 1):
-                yVals.append(self.__yVals[i])
-        return yVals
+        """Returns the Y values of the points as a read-only array (None if no points exist)"""
+        return self.__readOnly( self.__yVals )
 
     def getXError(self):
-        """Returns the X-error values of the points as a tuple"""
-        xError = None
-        if ( len(self.__xError) > 0 ):
-            xError = []
-            for i in range(0, len(self.__xError), 1):
-                xError.append(self.__xError[i])
-        return xError
+        """Returns the X-error values of the points as a read-only array (None if not present)"""
+        return self.__readOnly( self.__xError )
 
     def getYError(self):
-        """Returns the Y-error values of the points as a tuple"""
-        yError = None
-        if ( len(self.__yError) > 0 ):
-            yError = []
-            for i in range(0, len(self.__yError), 1):
-                yError.append(self.__yError[i])
-        return yError
+        """Returns the Y-error values of the points as a read-only array (None if not present)"""
+        return self.__readOnly( self.__yError )
 
     def getMaxXError(self):
         """Finds the max X error value"""
         maxErr = None
         if ( len(self.__xError) > 0 ):
-            maxErr = 0.00
-            for i in range(0, len(self.__xError), 1):
-                maxErr = max(maxErr, self.__xError[i])
+            maxErr = max( 0.00, float(self.__xError.max()) )
 
         return maxErr
 
@@ -721,9 +681,7 @@ class Scatter:
         """Finds the max Y error value"""
         maxErr = None
         if ( len(self.__yError) > 0 ):
-            maxErr = 0.00
-            for i in range(0, len(self.__yError), 1):
-                maxErr = max(maxErr, self.__yError[i])
+            maxErr = max( 0.00, float(self.__yError.max()) )
 
         return maxErr
 
@@ -24,7 +24,8 @@ USAGE (example):
 
    # Obtain the appropriate histogram data now (from within the layers)
    plottedParticle = totalPISAData.getParticle( someParticleName ) # Returns a class that contains all that particle's PISA data
-   theDesiredHistogram = plottedParticle.getHistogram( queryByLabel )
+   theDesiredHistogram = plottedParticle.getHistogram( queryByAngle )   # Indexed by angle (361/362 for angle/energy integrated)
+   allHistograms = plottedParticle.getHistograms()   # All of the particle's histograms, ordered by angle
 
 
 
@@ -43,10 +44,13 @@ USAGE (example):
 ################################################################################
 # IMPORTS:
 import sys
+import re
+import bisect
+import numpy as np
 
 # MODULES:
 import generalPlotTypeClasses as genPlotCls
-from fileModule import parseLine
+from fileModule import parseLine, parseTable, parseBinnedTable, convertNumbers, conversionMessage, textSize, outputMarkers, yieldMarkers
 from printClass import Print
 
 # VERSION Number:
@@ -59,13 +63,56 @@ particleTypes = ("n", "p", "d", "t", "he3", "he4", "he6", "li6", "li7", "li8",
 "li9", "be7", "be9", "be10", "b9", "b10", "b11", "b12", "c11", "c12", "c13",
 "c14", "z=7", "z=8", "z=9", "z=10", "z=11", "z=12", "z=13", "z=14")
 numParticleTypes = len( particleTypes )
+_particleTypeSet = frozenset( particleTypes )
 
 histType = ("double differential", "energy integrated", "angle integrated")
 numHistTypes = len(histType)
 
+# (Energy spectra origins, in the order of the columns of each particle's table)
+nucleonOrigins = ("total", "cascade", "precompound", "evaporation")
+lightIonOrigins = ("total", "coalescence", "precompound", "evaporation")
+pionOrigins = ("total", "cascade")
+
+
+def spectrumOrigins(particleID):
+    """Returns the origins (columns) of a particle's energy spectrum table"""
+    if ( "pion" in particleID ):
+        return pionOrigins
+    elif ( particleID in ("neutrons", "protons") ):
+        return nucleonOrigins
+    return lightIonOrigins
+
+# (PISA indexing)
+angleIntFlag = 361        # Angle given to angle integrated histograms
+energyIntFlag = 362       # Angle given to energy integrated histograms
+angleResolution = 0.01    # Angles are indexed to the nearest 0.01 degrees
+angleTolerance = 0.01     # Largest difference [deg] accepted when matching angles
+__anglesPerCircle = int(round(360 / angleResolution))
+
+
+def angleToKey(someAngle):
+    """
+    Returns the index key of an angle: the angle (in [0, 360)) in units of the
+    angle resolution. The angle and energy integrated flags (361 and 362) keep
+    their own keys, which lie beyond those of any angle.
+    """
+    angleKey = int(round(someAngle / angleResolution))
+    if ( (not someAngle == angleIntFlag) and (not someAngle == energyIntFlag) ):
+        angleKey %= __anglesPerCircle
+    return angleKey
+
+angleIntKey = angleToKey(angleIntFlag)
+energyIntKey = angleToKey(energyIntFlag)
+
 
 class Histogram:
-    """Stores particle data in histogram form"""
+    """
+    Stores particle data in histogram form. The bin bounds and values are kept
+    in arrays of floats; arrays of floats passed in are used without being
+    copied (and are never modified), so histograms read from the same table
+    share its bins.
+    """
+    __slots__ = ("__write", "__angle", "__type", "__binValues", "__dataPoints")
 
     def __init__(self, type, angle, bins, values, newPrint = Print() ):
         """Constructor for class"""
@@ -74,10 +121,8 @@ class Histogram:
         # Reset Histogram values:
         self.__angle = 0
         self.__type = None
-        self.__dataPoints = []
-        self.__numDataPoints = 0
-        self.__binValues = []
-        self.__numBins = 0
+        self.__dataPoints = np.zeros( 0 )
+        self.__binValues = np.zeros( 0 )
 
         # Set type of histogram data (double differential, energy integrated, angle integrated)
         validType = False
@@ -101,83 +146,86 @@ class Histogram:
             # Data is either invalid; assume angle = 0
             self.__write.message = "Unable to convert angle parameter (%s) to a float. Assuming angle integrated." % ( str(angle) )
             self.__write.print(1, 2)
-            self.__angle = 361
+            self.__angle = angleIntFlag
 
         # Ensure valid angle value (in range [0, 360) )
-        if ( (not self.__angle == 361) and (not self.__angle == 362) ):
+        if ( (not self.__angle == angleIntFlag) and (not self.__angle == energyIntFlag) ):
             if ( self.__angle < 0 ):
                 self.__angle += 360
             elif ( self.__angle >= 360 ):
                 self.__angle -= 360
 
-        # Verify that bins and values are lists:
-        validBins   = isinstance(bins,   list)
-        validValues = isinstance(values, list)
+        # Verify that bins and values are sequences:
+        validBins   = isinstance(bins,   (list, tuple, np.ndarray))
+        validValues = isinstance(values, (list, tuple, np.ndarray))
         if ( (not validBins) or (not validValues) ):
-            self.__write.message = "Invalid bins or values passed in to Histogram object. Parameters must be lists."
+            self.__write.message = "Invalid bins or values passed in to Histogram object. Parameters must be lists, tuples, or arrays."
             self.__write.print(0, 1)
             return
 
         # Convert to floats:
-        for i in range(0, len(bins), 1):
-            try:
-                bins[i] = float( bins[i] )
-            except:
-                self.__write.message = "Unable to convert bin boundary (%s) to float. Assuming value is 0." % ( str(bins[i]) )
-                self.__write.print(1, 2)
-                bins[i] = 0
-        for i in range(0, len(values), 1):
-            try:
-                values[i] = float( values[i] )
-            except:
-                self.__write.message = "Unable to convert bin boundary (%s) to float. Assuming value is 0." % ( str(values[i]) )
-                self.__write.print(1, 2)
-                values[i] = 0
+        bins = self.__toArray( bins, "bin boundary" )
+        values = self.__toArray( values, "bin value" )
+        if ( len(bins) == 0 ):
+            self.__write.message = "No bin boundaries were passed in to the Histogram object."
+            self.__write.print(1, 2)
+            return
 
         # Ensure only positive values (for bins, values)
         # (Check for bins, shift all values up for non-physical values)
-        shiftValue = 0
-        badBinBound = 0
-        for i in range(0, len(values), 1):
-            shiftValue = min(shiftValue, values[i])
-            badBinBound = min(badBinBound, values[i])
-        shiftValue = abs(shiftValue)
-        if ( shiftValue > 0 ):
-            self.__write.message = "Unphysical lowest bin boundary (%f). Shifting all values up by (%f)." % (badBinBound, shiftValue)
-            self.__write.print(0, 1)
-        for i in range(0, len(values), 1):
-            values[i] += shiftValue
+        if ( len(values) > 0 ):
+            badBinBound = values.min()
+            if ( badBinBound < 0 ):
+                self.__write.message = "Unphysical lowest bin boundary (%f). Shifting all values up by (%f)." % (badBinBound, abs(badBinBound))
+                self.__write.print(0, 1)
+                values = values - badBinBound
         # (Do same for bins)
         if ( bins[0] < 0 ):
             shiftValue = -bins[0]
             self.__write.message = "Unphysical lower bin boundary (%f). Shifting all values up by (%f)." % (bins[0], shiftValue)
             self.__write.print(0, 1)
-        else:
-            shiftValue = 0
-        for i in range(0, len(bins), 1):
-            bins[i] = shiftValue + bins[i]
+            bins = bins + shiftValue
 
         # Determine how many values to use (only accept minimum of what given data allows)
         numValues = min( len(values), (len(bins)-1) )
+        if ( len(bins) > numValues+1 ):
+            bins = bins[ : numValues+1]
+        if ( len(values) > numValues ):
+            values = values[ : numValues]
+
+        # Ensure each bin value is larger than the last:
+        decreasingBins = np.flatnonzero( bins[1 : ] < bins[ : -1] )
+        if ( len(decreasingBins) > 0 ):
+            theIndx = decreasingBins[0]
+            self.__write.message = "%d bin(s) have a smaller value than the previous (e.g. range [%.2f, %.2f)). Setting these bin widths to 0..." % (len(decreasingBins), bins[theIndx], bins[theIndx+1])
+            self.__write.print(1, 3)
+            bins = np.maximum.accumulate( bins )
+
+        # Set bin values and data:
+        self.__binValues = bins
+        self.__dataPoints = values
 
-        # Set bin values:
-        self.__binValues.append( bins[0] )   # Append bin start:
-        for i in range(1, (numValues+1), 1):
-            # Ensure bin value is larger than last:
-            if ( bins[i] < bins[i-1] ):
-                self.__write.message = "The bin has smaller value than previous (range [%.2f, %.2f)). Setting bin width to 0..." % (bins[i-1], bins[i])
-                self.__write.print(1, 3)
-                bins[i] = bins[i-1]
-            self.__binValues.append( bins[i] )
-        self.__numBins = len( self.__binValues )
+        return
 
+    def __toArray(self, someValues, valueName):
+        """Returns the values as a 1-D array of floats (unconvertible values are set to 0)"""
+        try:
+            return np.asarray( someValues, dtype=float ).reshape( -1 )
+        except (ValueError, TypeError):
+            pass
 
-        # Valid particle was found, now set data:
-        for i in range(0, numValues, 1):
-            self.__dataPoints.append( values[i] )
-        self.__numDataPoints = len( self.__dataPoints )
+        theValues, badMask = convertNumbers( list(someValues) )
+        badValues = [ str(theValue) for (theValue, isBad) in zip(someValues, badMask) if isBad ]
+        self.__write.message = conversionMessage( badValues, "PISA histogram's " + valueName + "s" )
+        self.__write.print(1, 2)
 
-        return
+        return theValues
+
+    def __readOnly(self, theArray):
+        """Returns a read-only view of an array"""
+        theView = theArray.view()
+        theView.flags.writeable = False
+        return theView
 
     def appendDataPoint(self, newDataPoint, binValue):
         """Appends a data point to the end of the histogram"""
@@ -186,39 +234,37 @@ class Histogram:
             self.__write.message = "Invalid data point (%f) given. Setting to 0..." % (newDataPoint)
             self.__write.print(1, 3)
             newDataPoint = 0
-        if ( binValue < self.__binValues[ self.__numBins ] ):
-            self.__write.message = "Invalid end-bin value (%f) given. Setting to 5 more than last bin..." % (binValue)
-            self.__write.print(1, 3)
-            binValue = self.__binValues[ self.__numBins ] + 5
         if ( len(self.__binValues) == 0 ):
             # No bins have been set; start at 0 for user:
             self.__write.message = "No starting bin value was established. Assuming 0..."
             self.__write.print(1, 3)
-            self.__binValues.append( 0 )
+            self.__binValues = np.zeros( 1 )
+        if ( binValue < self.__binValues[-1] ):
+            self.__write.message = "Invalid end-bin value (%f) given. Setting to 5 more than last bin..." % (binValue)
+            self.__write.print(1, 3)
+            binValue = self.__binValues[-1] + 5
 
         # Set values:
-        self.__dataPoints.append( newDataPoint )
-        self.__numDataPoints += 1
-        self.__binValues.append( binValue )
-        self.__numBins += 1
+        self.__dataPoints = np.append( self.__dataPoints, float(newDataPoint) )
+        self.__binValues = np.append( self.__binValues, float(binValue) )
 
         return
 
     def getDataPoints(self):
-        """Returns the data points for the histogram object"""
-        return self.__dataPoints
+        """Returns the data points for the histogram object (as a read-only array)"""
+        return self.__readOnly( self.__dataPoints )
 
     def getBinValues(self):
-        """Returns the bin values for the histogram object"""
-        return self.__binValues
+        """Returns the bin values for the histogram object (as a read-only array)"""
+        return self.__readOnly( self.__binValues )
 
     def getNumDataPoints(self):
         """Returns the number of data points that exist in the particle"""
-        return self.__numDataPoints
+        return len( self.__dataPoints )
 
     def getNumBins(self):
         """Returns the number of bins that exist in the particle"""
-        return self.__numBins
+        return len( self.__binValues )
 
     def getAngle(self):
         """Returns the angle (<360, or 361 for angle int. and 362 for energy int.) of the histogram data"""
@@ -233,23 +279,23 @@ class ParticlePISAData:
     """Class that stores PISA data for each particle (many histogram data points)"""
     # Data contained here includes all double differential cross sections,
     # angle integrated cross sections, and energy integrated cross sections.
+    #
+    # Histograms are indexed by the key of their angle (see angleToKey), with the
+    # angle and energy integrated histograms stored under their own keys. The
+    # angles are also kept sorted for matching angles within a tolerance.
+
+    __slots__ = ("__write", "__particleName", "__histData", "__sortedAngles", "__sortedKeys")
 
     def __init__(self, particleName, newPrint = Print() ):
         """Constructor for particle PISA data"""
         self.__write = newPrint
         self.__particleName = None
-        self.__histData = []
-        self.__numHistograms = 0
-
-        # Verify particle name:
-        validParticle = False
-        for i in range(0, numParticleTypes, 1):
-            if ( particleName == particleTypes[ i ] ):
-                validParticle = True
-                break
+        self.__histData = {}
+        self.__sortedAngles = []
+        self.__sortedKeys = []
 
         # If validparticle found, then store, else print warning:
-        if ( validParticle ):
+        if ( particleName in _particleTypeSet ):
             self.__particleName = particleName
         else:
             self.__write.message = "Invalid particle ID (%s) used for ParticlePISAData construction." % (particleName)
@@ -257,34 +303,58 @@ class ParticlePISAData:
 
         return
 
-    def __validateHistogramIndex(self, i):
-        """Checks for valid index in histogram array"""
-        if ( i < 0 ):
-            return False
-        elif( i >= self.__numHistograms ):
-            return False
-        else:
-            return True
-
     def getParticleName(self):
         """Returns the particle name to the user/client"""
         return self.__particleName
 
     def addHistogram(self, newHistogram ):
         """Add a histogram to the particle type"""
-        if ( isinstance(newHistogram, Histogram) ):
-            self.__histData.append( newHistogram )
-            self.__numHistograms += 1
-        else:
+        if ( not isinstance(newHistogram, Histogram) ):
             self.__write.message = "Incorrect parameter instance cannot be added (should be histogram)"
             self.__write.print(1, 2)
+            return
+
+        # Index the histogram (the first histogram at an angle is kept):
+        theAngle = newHistogram.getAngle()
+        angleKey = angleToKey( theAngle )
+        if ( angleKey in self.__histData ):
+            self.__write.message = "A histogram for particle \"%s\" already exists at angle %.2f. The new histogram will not be used." % (self.__particleName, theAngle)
+            self.__write.print(2, 4)
+        else:
+            self.__histData[ angleKey ] = newHistogram
+            if ( angleKey < angleIntKey ):
+                sortIndx = bisect.bisect_left( self.__sortedKeys, angleKey )
+                self.__sortedKeys.insert( sortIndx, angleKey )
+                self.__sortedAngles.insert( sortIndx, angleKey * angleResolution )
 
         return
 
-    def getHistogram(self, someAngle):
-        """Returns a histogram to the user with the corresponding label"""
+    def __matchAngle(self, someAngle, tolerance):
+        """Returns the key of the indexed angle nearest to the angle given (None if none are within the tolerance)"""
+        angleKey = angleToKey( someAngle )
+        if ( angleKey in self.__histData ):
+            return angleKey
+        if ( angleKey >= angleIntKey or len(self.__sortedAngles) == 0 ):
+            return None
+
+        # Check the neighbouring angles in the sorted index (angles wrap at 360 degrees):
+        someAngle = angleKey * angleResolution
+        sortIndx = bisect.bisect_left( self.__sortedAngles, someAngle )
+        matchedKey = None
+        smallestDiff = tolerance
+        for neighborIndx in (sortIndx - 1, sortIndx % len(self.__sortedAngles)):
+            angleDiff = abs( self.__sortedAngles[neighborIndx] - someAngle )
+            angleDiff = min( angleDiff, 360 - angleDiff )
+            if ( angleDiff <= smallestDiff ):
+                smallestDiff = angleDiff
+                matchedKey = self.__sortedKeys[neighborIndx]
+
+        return matchedKey
+
+    def getHistogram(self, someAngle, tolerance = angleTolerance):
+        """Returns a histogram to the user with the corresponding angle (within the tolerance [deg] given)"""
         # Check if any histograms exist:
-        if ( self.__numHistograms <= 0 ):
+        if ( len(self.__histData) == 0 ):
             self.__write.message = "No PISA-type histograms exist for \"%s\" particles in general." % (self.__particleName)
             self.__write.print(1, 2)
             return None
@@ -298,43 +368,32 @@ class ParticlePISAData:
                 self.__write.print(1, 2)
                 someAngle = 0.0
 
-        # Return histogram (for string, int)
-        if ( isinstance(someAngle, (float, int)) ):
-            # Look for histogram matching the passed in label:
-            foundLabel = False
-            associatedHist = 0
-            # Reduce angle within range [0, 360)
-            if ( someAngle < 0 ):
-                someAngle += 360
-            elif ( someAngle >= 360 ):
-                if ( (not someAngle == 361) and (not someAngle == 362) ):
-                    someAngle -= 360
-
-            for i in range(0, self.__numHistograms, 1):
-                if ( self.__histData[i].getAngle() == someAngle ):
-                    foundLabel = True
-                    associatedHist = i
-                    break
-
-            # If matching histogram found, return it:
-            if ( foundLabel ):
-                self.__write.message = "Histogram for particle \"%s\" found at angle \"%.2f\"" % (self.__particleName, someAngle)
-                self.__write.print(2, 4)
-                self.__write.message = "   Contains %d data points." % (self.__histData[associatedHist].getNumDataPoints() )
-                self.__write.print(2, 4)
-                someVals = self.__histData[ associatedHist ].getBinValues()
-                return self.__histData[ associatedHist ]
-            else:
-                self.__write.message = "No histogram for particle \"%s\" with matching angle (%.2f) found." % (self.__particleName, someAngle)
-                self.__write.print(2, 4)
-                return None
-        else:
-            # Invalid label, warn user
-            self.__write.message = "Invalid label type passed in (" + str(someAngle) + "), should be 'float'. Cannot return PISA histogram object."
-            self.__write.print(1, 2)
+        # Look for histogram matching the passed in angle:
+        angleKey = self.__matchAngle( someAngle, tolerance )
+        if ( angleKey is None ):
+            self.__write.message = "No histogram for particle \"%s\" with matching angle (%.2f) found." % (self.__particleName, someAngle)
+            self.__write.print(2, 4)
             return None
 
-        return None
+        # Matching histogram found, return it:
+        theHistogram = self.__histData[ angleKey ]
+        self.__write.message = "Histogram for particle \"%s\" found at angle \"%.2f\"" % (self.__particleName, theHistogram.getAngle())
+        self.__write.print(2, 4)
+        self.__write.message = "   Contains %d data points." % (theHistogram.getNumDataPoints() )
+        self.__write.print(2, 4)
+        return theHistogram
+
+    def getHistograms(self):
+        """Returns all histograms of the particle, ordered by angle (then the angle and energy integrated histograms)"""
+        return tuple( self.__histData[angleKey] for angleKey in sorted(self.__histData) )
+
+    def queryAngles(self):
+        """Returns the angles (excluding the angle and energy integrated flags) with histograms in ascending order"""
+        return tuple( self.__sortedAngles )
+
+    def queryNumHistograms(self):
+        """Returns the number of histograms stored for the particle"""
+        return len( self.__histData )
 
 
 class DoubleDiffPISA:
@@ -349,11 +408,16 @@ class DoubleDiffPISA:
     # ---Up to 10 angles can be used
     # ---Energy bins [histogram]
     # For this, the values are needed (n values) in addition to the bins (n+1 values).
+    #
+    # Particles are indexed by their ID (and by the order they were added in).
+
+    __slots__ = ("__write", "__particleData", "__particleIndex", "__numParticles")
 
     def __init__(self, newPrint = Print() ):
         """Class constructor"""
         self.__write = newPrint
         self.__particleData = []
+        self.__particleIndex = {}
         self.__numParticles = 0
 
         return
@@ -361,40 +425,24 @@ class DoubleDiffPISA:
     def addParticleHistogram(self, particleID, newHistogram):
         """Adds a new histogram to the specified particle ID"""
         # Verify valid particleID was specified:
-        validParticleID = False
-        for i in range(0, numParticleTypes, 1):
-            if ( particleID == particleTypes[i] ):
-                validParticleID = True
-                break
-        if ( not validParticleID ):
+        if ( particleID not in _particleTypeSet ):
             self.__write.message = "An invalid particle ID (%s) was specified when adding a histogram." % particleID
             self.__write.print(1, 2)
             self.__write.message = "   The histogram will not be added."
             self.__write.print(1, 2)
             return
 
-        # See if particle exists in current set of particles:
-        particleDataExists = False
-        particleIndx = -1
-        if ( self.__numParticles > 0 ):
-            for i in range(0, self.__numParticles, 1):
-                if ( particleID == self.__particleData[i].getParticleName() ):
-                    particleDataExists = True
-                    particleIndx = i
-                    break
-
         # Add the histogram to the particle (or create new particle and add histogram)
-        if ( particleDataExists ):
-            self.__particleData[particleIndx].addHistogram( newHistogram )
-        else:
+        if ( particleID not in self.__particleIndex ):
             self.addParticle( ParticlePISAData(particleID, self.__write) )
-            self.addParticleHistogram( particleID, newHistogram )
+        self.__particleData[ self.__particleIndex[particleID] ].addHistogram( newHistogram )
 
         return
 
     def addParticle(self, newParticleHist):
         """Adds a particle's histogram data to the class"""
         if ( isinstance(newParticleHist, ParticlePISAData) ):
+            self.__particleIndex.setdefault( newParticleHist.getParticleName(), self.__numParticles )
             self.__particleData.append ( newParticleHist )
             self.__numParticles += 1
         else:
@@ -417,9 +465,7 @@ class DoubleDiffPISA:
             return True
 
     def getParticle(self, particleID):
-        """Returns a particle with the particle ID given"""
-        # Reduced particleID:
-        particleID = particleID.lower().strip()
+        """Returns a particle with the particle ID (or index) given"""
         # Determine if any particles exist in array:
         if ( self.__numParticles <= 0 ):
             # No particles exist, warn and return
@@ -430,35 +476,20 @@ class DoubleDiffPISA:
         # Handle for strings:
         if ( isinstance(particleID, str) ):
             # Validate particle ID:
-            validParticle = False
-            for i in range(0, numParticleTypes, 1):
-                if ( particleID == particleTypes[i] ):
-                    validParticle = True
-                    break
-
-            # If valid particle found, check for particle histogram in data set:
-            if ( not validParticle ):
+            particleID = particleID.lower().strip()
+            if ( particleID not in _particleTypeSet ):
                 # Requested particle isn't valid; warn user
                 self.__write.message = "An invalid particle ID was requested (%s). Cannot return a particle." % (particleID)
                 self.__write.print(1, 2)
                 return None
 
-            # Now find if particle exists in data set:
-            foundParticle = False
-            particleIndx = -1
-            for i in range(0, self.__numParticles, 1):
-                if ( self.__particleData[ i ].getParticleName() == particleID ):
-                    foundParticle = True
-                    particleIndx = i
-                    break
-
             # Return particle:
-            if ( foundParticle ):
-                return self.__particleData[ particleIndx ]
-            else:
-                self.__write.message = "Particle \"%s\" has no data."
+            particleIndx = self.__particleIndex.get( particleID )
+            if ( particleIndx is None ):
+                self.__write.message = "Particle \"%s\" has no data." % (particleID)
                 self.__write.print(1, 1)
                 return None
+            return self.__particleData[ particleIndx ]
 
         elif ( isinstance(particleID, int) ):
             # Handle for integers:
@@ -475,15 +506,22 @@ class DoubleDiffPISA:
 
         return None
 
-    def getParticleHistogram(self, particleID, someAngle):
+    def getParticleHistogram(self, particleID, someAngle, tolerance = angleTolerance):
         """Returns a histogram matching the particle ID and the angle specified"""
         theParticleObj = self.getParticle( particleID )
         if ( theParticleObj == None ):
             theHistogram = None
         else:
-            theHistogram = theParticleObj.getHistogram( someAngle )
+            theHistogram = theParticleObj.getHistogram( someAngle, tolerance )
         return theHistogram
 
+    def getParticleHistograms(self, particleID):
+        """Returns all histograms (ordered by angle) of the particle ID specified"""
+        theParticleObj = self.getParticle( particleID )
+        if ( theParticleObj == None ):
+            return ()
+        return theParticleObj.getHistograms()
+
     def getNumParticles(self):
         """Returns the number of particles that exist in the object"""
         return self.__numParticles
@@ -499,6 +537,8 @@ class ParticleEnergySpectra:
     __numParticleIDs = len(__particleIDs)
     __histogramFlags = ("total", "cascade", "coalescence", "precompound", "evaporation")
     __numHistoFlags = len(__histogramFlags)
+    __errorFlagPrefix = "d"   # Prefix of the flags of error histograms (e.g. "dtotal")
+    __slots__ = ("__write", "__constructed", "__particleID", "__partHistograms", "__numHistograms")
 
     def __init__(self, particleID, newPrint=Print() ):
         """Constructor for the class"""
@@ -540,9 +580,11 @@ class ParticleEnergySpectra:
         return
 
     def isValidHistFlag(self, histFlag):
-        """Checks if the histogram flag is valid"""
+        """Checks if the histogram flag is valid (flags of the error histograms are prefixed by \"d\")"""
         isValid = False
         histFlag = histFlag.lower().strip()
+        if ( histFlag.startswith(self.__errorFlagPrefix) and histFlag[len(self.__errorFlagPrefix) : ] in self.__histogramFlags ):
+            histFlag = histFlag[len(self.__errorFlagPrefix) : ]
         for flgIndx in range(0, self.__numHistoFlags, 1):
             if ( histFlag == self.__histogramFlags[flgIndx] ):
                 isValid = True
@@ -662,6 +704,13 @@ class ParticleData:
 
         return
 
+    def __getstate__(self):
+        """Returns the object's state for pickling (the raw file lines are not kept)"""
+        theState = self.__dict__.copy()
+        theState["_ParticleData__fileData"] = []
+        theState["_ParticleData__dataLen"] = 0
+        return theState
+
     def __setParticleID(self, particleID):
         """Sets the object's particle ID"""
         # Validate input:
@@ -682,7 +731,7 @@ class ParticleData:
 
     def __parseData(self, start, end):
         """Parses out file data from the start and end indices"""
-        __energySpecFlag = ("energy spectrum [mb/mev]", "integrated:")
+        __energySpecFlag = ("energySpectrum", "integrated")   # (see fileModule.outputMarkers)
 
         if ( start < 0 ):
             start = 0
@@ -693,7 +742,7 @@ class ParticleData:
         for lineIndx in range(start, end, 1):
             theline = self.__fileData[lineIndx]
 
-            if ( __energySpecFlag[0] in theline ):
+            if ( outputMarkers.find( theline ) == __energySpecFlag[0] ):
                 # Add energy data:
                 lineIndx += 2
                 while( True ):
@@ -702,7 +751,7 @@ class ParticleData:
 
                     # Determine if at end of data:
                     stopFlag = False
-                    if ( __energySpecFlag[1] in theline ):
+                    if ( outputMarkers.find( theline ) == __energySpecFlag[1] ):
                         stopFlag = True
 
                     if ( stopFlag ):
@@ -717,109 +766,47 @@ class ParticleData:
 
     def __parseEnergySpectraData(self, data):
         """Parses out data for energy spectra"""
-        __nucleonHeaders = ("total", "cascade", "precompound", "evaporation")
-        __lightIonHeaders = ("total", "coalescence", "precompound", "evaporation")
-        __pionHeaders = ("total", "cascade")
         __pmFlag = "+/-"
-        __particleFlag = (0, 1, 2)   # For nucleons, light ions, and pions
 
         # Determine what the headers are (based on particle type)
-        if ( "pion" in self.__particleID ):
-            numHeaders = len(__pionHeaders)
-            headerFlags = __pionHeaders
-            particleFlag = __particleFlag[0]
-        elif ( "neutrons" == self.__particleID or "protons" == self.__particleID ):
-            numHeaders = len(__nucleonHeaders)
-            headerFlags = __nucleonHeaders
-            particleFlag = __particleFlag[1]
-        else:
-            numHeaders = len(__lightIonHeaders)
-            headerFlags = __lightIonHeaders
-            particleFlag = __particleFlag[2]
+        headerFlags = spectrumOrigins( self.__particleID )
+        numHeaders = len(headerFlags)
+        isPion = ( headerFlags == pionOrigins )
 
-        # Remove header line from the list:
+        # Remove header line from the list; the table ends at the first empty line:
         del data[0]
         dataLen = len(data)
-
-        myBins = []
-        numBins = 0
-        numHistograms = 2 * numHeaders
-        myVals = [[] for i in range(0, numHeaders, 1)]
-        myErrs = [[] for i in range(0, numHeaders, 1)]
         for lineIndx in range(0, dataLen, 1):
-            theline = data[lineIndx]
-
-            if ( theline == "" ):
+            if ( data[lineIndx] == "" ):
+                dataLen = lineIndx
                 break
+        if ( dataLen == 0 ):
+            self.__write.message = "No energy spectrum data exists for particle \"%s\"." % (self.__particleID)
+            self.__write.print(1, 2)
+            return
 
-            # Get lower and upper bin bounds:
-            lowerBin = theline[ : theline.find("-") ]
-            theline = theline[ theline.find("-") + 1 : ]
-            theline = parseLine( theline )
-            upperBin = theline[0]
-            del theline[0]
-            # Remove all +/- flags:
-            lineData = []
-            for datIndx in range(0, len(theline), 1):
-                if ( not theline[datIndx] == __pmFlag ):
-                    lineData.append( theline[datIndx] )
-
-            # Convert all values to floats:
-            try:
-                lowerBin = float(lowerBin)
-            except:
-                self.__write.message = "Could not convert lower bin to float: %s" % lowerBin
-                self.__write.print(1, 2)
-                lowerBin = 0.00
-            try:
-                upperBin = float(upperBin)
-            except:
-                self.__write.message = "Could not convert lower bin to float: %s" % upperBin
-                self.__write.print(1, 2)
-                upperBin = 0.00
-            for i in range(0, len(lineData), 1):
-                try:
-                    lineData[i] = float(lineData[i])
-                except:
-                    self.__write.message = "Could not convert lower bin to float: %s" % lineData[i]
-                    self.__write.print(1, 2)
-                    lineData[i] = 0.00
-
-            # Set bin values:
-            if ( numBins == 0 ):
-                myBins.append( lowerBin )
-            else:
-                if ( not lowerBin == myBins[numBins] ):
-                    # Gap in histogram; add bin and values:
-                    myBins.append( lowerBin )
-                    numBins += 1
-
-                    for valIndx in range(0, numHeaders, 1):
-                        myVals[valIndx].append( 0.00 )
-                        myErrs[valIndx].append( 0.00 )
-            myBins.append( upperBin )
-            numBins += 1
-
-            # Set histogram values:
-            if ( not particleFlag == __particleFlag[0] ):
-                for histIndx in range(0, numHeaders, 1):
-                    myVals[histIndx].append( lineData[2*histIndx] )
-                    myErrs[histIndx].append( lineData[2*histIndx+1] )
-            else:
-                # For pions, total = cascade
-                # (total)
-                myVals[0].append( lineData[0] )
-                myErrs[0].append( lineData[1] )
-                # (cascade)
-                myVals[1].append( lineData[0] )
-                myErrs[1].append( lineData[1] )
-
-
-        # Now set histograms (bins and values exist)
+        # Convert the table (a value and error for each header) at once:
+        numValues = 2 * numHeaders
+        if ( isPion ):
+            # (Pion rows may contain the total only)
+            rowValues = len( data[0].replace("-", " ", 1).replace(__pmFlag, " ").split() ) - 2
+            numValues = min( numValues, max(2, rowValues) )
+        myBins, tableData, badValues = parseBinnedTable( data[ : dataLen], numValues )
+        if ( len(badValues) > 0 ):
+            self.__write.message = conversionMessage( badValues, "%s energy spectrum" % (self.__particleID) )
+            self.__write.print(1, 2)
+        myVals = tableData[:, 0::2]
+        myErrs = tableData[:, 1::2]
+        if ( isPion ):
+            # For pions, total = cascade
+            myVals = np.repeat( myVals[:, 0:1], numHeaders, axis=1 )
+            myErrs = np.repeat( myErrs[:, 0:1], numHeaders, axis=1 )
+
+        # Now set histograms (bins and values exist; each histogram uses views of the table's columns)
         for histIndx in range(0, numHeaders, 1):
             # Create histogram object with desired label:
-            parHist = genPlotCls.Histogram(myBins, myVals[histIndx], headerFlags[histIndx], self.__write)
-            errHist = genPlotCls.Histogram(myBins, myErrs[histIndx], "d" + headerFlags[histIndx], self.__write)
+            parHist = genPlotCls.Histogram(myBins, myVals[:, histIndx], headerFlags[histIndx], self.__write)
+            errHist = genPlotCls.Histogram(myBins, myErrs[:, histIndx], "d" + headerFlags[histIndx], self.__write)
             self.__energySpectra.addHistogram( parHist )
             self.__energySpectra.addHistogram( errHist )
 
@@ -832,10 +819,10 @@ class ParticleData:
             self.__write.print(1, 2)
             return
 
-        # Reduce file data:
+        # Reduce file data (markers are matched regardless of case):
         startingIndx = self.__dataLen
         for lineIndx in range(0, len(fileData), 1):
-            fileData[lineIndx] = fileData[lineIndx].lower().strip()
+            fileData[lineIndx] = fileData[lineIndx].strip()
             self.__fileData.append( fileData[lineIndx] )
             self.__dataLen += 1
         endingIndx = self.__dataLen
@@ -844,6 +831,14 @@ class ParticleData:
 
         return
 
+    def releaseFileData(self):
+        """Discards the (already parsed) file lines; returns the number of bytes released"""
+        releasedBytes = textSize( self.__fileData )
+        self.__fileData = []
+        self.__dataLen = 0
+
+        return releasedBytes
+
     def queryParticleID(self):
         """Returns the particle ID to client"""
         return self.__particleID
@@ -885,6 +880,161 @@ class ParticleData:
         return
 
 
+class ChannelYields:
+    """
+    The \"ChannelYields\" object stores the yield of each reaction channel in
+    columns (arrays): the number of each ejectile type emitted in the channel,
+    the channel's residual (if listed), and the channel's yield [mb].
+    Channels are indexed by their ejectile numbers for direct lookup.
+    """
+
+    __slots__ = ("__write", "__ejectiles", "__counts", "__residuals", "__yields", "__index")
+
+    def __init__(self, ejectiles, counts, residuals, yields, newPrint = Print() ):
+        """Constructor (ejectile names; channel by ejectile counts, residuals, and yields)"""
+
+        self.__write = newPrint
+        self.__ejectiles = tuple(ejectiles)
+        self.__counts = np.asarray(counts, dtype=int).reshape( (len(yields), len(self.__ejectiles)) )
+        self.__residuals = tuple(residuals)
+        self.__yields = np.asarray(yields, dtype=float)
+
+        # Index channels by their ejectile counts (first occurrence is used):
+        self.__index = {}
+        for rowIndx in range(0, self.__counts.shape[0], 1):
+            self.__index.setdefault( tuple(self.__counts[rowIndx].tolist()), rowIndx )
+
+        return
+
+    def queryNumChannels(self):
+        """Returns the number of channels"""
+        return self.__yields.size
+
+    def queryEjectiles(self):
+        """Returns the names of the ejectiles counted for each channel"""
+        return self.__ejectiles
+
+    def queryCounts(self):
+        """Returns the (read-only) ejectile counts of each channel (one row per channel)"""
+        theView = self.__counts.view()
+        theView.flags.writeable = False
+        return theView
+
+    def queryResiduals(self):
+        """Returns the residual of each channel"""
+        return self.__residuals
+
+    def queryYields(self):
+        """Returns the (read-only) yield of each channel"""
+        theView = self.__yields.view()
+        theView.flags.writeable = False
+        return theView
+
+    def queryChannelYield(self, counts):
+        """Returns the yield of the channel emitting the given number of each ejectile (None if not found)"""
+        rowIndx = self.__index.get( tuple(counts), None )
+        if ( rowIndx is None ):
+            self.__write.message = "No yield exists for the channel %s." % (str(tuple(counts)))
+            self.__write.print(1, 2)
+            return None
+        return self.__yields[ rowIndx ]
+
+    def queryScatter(self):
+        """Returns a scatter object of the channel yields (X: channel number)"""
+        xVals = np.arange(1, self.__yields.size+1, dtype=float)
+        return genPlotCls.Scatter(xVals, self.__yields, None, None, self.__write)
+
+
+class NuclideYields:
+    """
+    The \"NuclideYields\" object stores the yield [mb] (and its error) of each
+    nuclide in columns (arrays) of Z, A, yield, and error. Nuclides are indexed
+    by (Z, A) for direct lookup, and isotopes, isobars, and isotones are
+    selected from the columns in bulk.
+    """
+    __slots__ = ("__write", "__z", "__a", "__yields", "__errors", "__index")
+
+    def __init__(self, zVals, aVals, yields, errors, newPrint = Print() ):
+        """Constructor (columns of Z, A, yield, and error)"""
+
+        self.__write = newPrint
+        self.__z = np.asarray(zVals, dtype=int)
+        self.__a = np.asarray(aVals, dtype=int)
+        self.__yields = np.asarray(yields, dtype=float)
+        self.__errors = np.asarray(errors, dtype=float)
+
+        # Index nuclides by (Z, A) (first occurrence is used):
+        self.__index = {}
+        zList = self.__z.tolist()
+        aList = self.__a.tolist()
+        for rowIndx in range(0, len(zList), 1):
+            self.__index.setdefault( (zList[rowIndx], aList[rowIndx]), rowIndx )
+
+        return
+
+    def __readOnly(self, theArray):
+        """Returns a read-only view of an array"""
+        theView = theArray.view()
+        theView.flags.writeable = False
+        return theView
+
+    def __selectScatter(self, theMask, xVals):
+        """Returns a scatter object of the selected nuclides, ordered by the X-values"""
+        rowIndices = np.flatnonzero( theMask )
+        rowIndices = rowIndices[ np.argsort(xVals[rowIndices], kind="stable") ]
+        return genPlotCls.Scatter(xVals[rowIndices].astype(float),
+        self.__yields[rowIndices], None, self.__errors[rowIndices], self.__write)
+
+    def queryNumNuclides(self):
+        """Returns the number of nuclides"""
+        return self.__yields.size
+
+    def queryZ(self):
+        """Returns the (read-only) charge of each nuclide"""
+        return self.__readOnly( self.__z )
+
+    def queryA(self):
+        """Returns the (read-only) mass number of each nuclide"""
+        return self.__readOnly( self.__a )
+
+    def queryYields(self):
+        """Returns the (read-only) yield of each nuclide"""
+        return self.__readOnly( self.__yields )
+
+    def queryErrors(self):
+        """Returns the (read-only) yield error of each nuclide"""
+        return self.__readOnly( self.__errors )
+
+    def hasNuclide(self, z, a):
+        """Returns if a yield exists for the nuclide"""
+        return ( (z, a) in self.__index )
+
+    def queryNuclideYield(self, z, a):
+        """Returns the yield and its error for the nuclide (None if not found)"""
+        rowIndx = self.__index.get( (z, a), None )
+        if ( rowIndx is None ):
+            self.__write.message = "No yield exists for the nuclide (Z=%s, A=%s)." % (str(z), str(a))
+            self.__write.print(1, 2)
+            return None
+        return self.__yields[ rowIndx ], self.__errors[ rowIndx ]
+
+    def queryIsotopes(self, z):
+        """Returns a scatter object of the yields of all isotopes of Z (X: A)"""
+        return self.__selectScatter( self.__z == z, self.__a )
+
+    def queryIsobars(self, a):
+        """Returns a scatter object of the yields of all isobars of A (X: Z)"""
+        return self.__selectScatter( self.__a == a, self.__z )
+
+    def queryIsotones(self, n):
+        """Returns a scatter object of the yields of all isotones of N (X: Z)"""
+        return self.__selectScatter( (self.__a - self.__z) == n, self.__z )
+
+    def queryScatter(self):
+        """Returns a scatter object of all nuclide yields (X: ZAID = 1000*Z + A)"""
+        return self.__selectScatter( np.ones(self.__yields.size, dtype=bool), 1000*self.__z + self.__a )
+
+
 class ParticleYields:
     """
     The \"ParticleYields\" object contains scatter plots (with associated error bars)
@@ -918,28 +1068,20 @@ class ParticleYields:
 
         return
 
+    def __getstate__(self):
+        """Returns the object's state for pickling (the raw file lines are not kept)"""
+        theState = self.__dict__.copy()
+        theState["_ParticleYields__fileData"] = []
+        theState["_ParticleYields__dataLen"] = 0
+        return theState
+
     def __containsFlag(self, dataLine = ""):
         """Determines if the line contains a yield data flag"""
-        __yieldFlags = ("yields of different channels (with > 1 mb):",
-        "*************** nuclide yields [mb]  (zero values suppressed) *****************",
-        "mass yield [mb] and the mean and variance of the kinetic energy [mev]",
-        "charge yield [mb] and the mean and variance of the  kinetic energy [mev]")
-        __numYieldFlags = len(__yieldFlags)
-
-        containsFlag = False
-        for flagIndx in range(0, __numYieldFlags, 1):
-            if ( dataLine == __yieldFlags[flagIndx] ):
-                containsFlag = True
-                break
-
-        return containsFlag
+        return ( outputMarkers.match( dataLine )[0] in yieldMarkers )
 
     def __parseData(self, start, end):
         """Parses the file data based on the given start and end indices"""
-        __yieldFlags = ("yields of different channels (with > 1 mb):",
-        "*************** nuclide yields [mb]  (zero values suppressed) *****************",
-        "mass yield [mb] and the mean and variance of the kinetic energy [mev]",
-        "charge yield [mb] and the mean and variance of the  kinetic energy [mev]")
+        __yieldFlags = yieldMarkers   # (see fileModule.outputMarkers)
         __yieldFlagNum = (1, 2, 3, 4)
         __numYieldFlags = len(__yieldFlags)
         if ( start < 0 ):
@@ -950,15 +1092,11 @@ class ParticleYields:
         for lineIndx in range(start, end, 1):
             theline = self.__fileData[lineIndx]
 
-            if ( not self.__containsFlag( theline ) ):
-                continue
-
             # Obtain flag number for ease:
-            flagNum = -1
-            for flagIndx in range(0, __numYieldFlags, 1):
-                if ( theline == __yieldFlags[flagIndx] ):
-                    flagNum = __yieldFlagNum[flagIndx]
-                    break
+            theMarker = outputMarkers.match( theline )[0]
+            if ( not theMarker in __yieldFlags ):
+                continue
+            flagNum = __yieldFlagNum[ __yieldFlags.index(theMarker) ]
 
             # Now obtain data based on flagged data:
             if ( flagNum == __yieldFlagNum[0] ):
@@ -1040,111 +1178,141 @@ class ParticleYields:
 
     def __parseChannelYields(self, data):
         """Parses out channel yields"""
+        __endHeaderFlags = ("resid", "yield")
+
+        # Obtain the ejectiles from the table header (the columns before the residual/yield):
+        ejectiles = []
+        for lineIndx in range(0, len(data), 1):
+            parsedLine = parseLine( data[lineIndx] )
+            if ( len(parsedLine) > 0 and not parsedLine[0].isdigit() ):
+                for token in parsedLine:
+                    token = token.lower()
+                    if ( token.startswith(__endHeaderFlags) ):
+                        break
+                    ejectiles.append( token )
+                break
+        numEjectiles = len(ejectiles)
+        if ( numEjectiles == 0 ):
+            self.__write.message = "Unable to determine the ejectiles of the channel yields."
+            self.__write.print(1, 2)
+            return
+
+        # Each channel is \"counts... [residual] yield\":
+        numericRows = []
+        residuals = []
+        for lineIndx in range(0, len(data), 1):
+            parsedLine = parseLine( data[lineIndx] )
+            if ( len(parsedLine) < numEjectiles+1 or not parsedLine[0].isdigit() ):
+                continue
+            numericRows.append( " ".join( parsedLine[ : numEjectiles] + parsedLine[-1 : ] ) )
+            residuals.append( " ".join( parsedLine[numEjectiles : -1] ) )
+        if ( len(numericRows) == 0 ):
+            self.__write.message = "No channel yields were found."
+            self.__write.print(1, 2)
+            return
+
+        tableData, badValues = parseTable( numericRows, numEjectiles+1 )
+        if ( len(badValues) > 0 ):
+            self.__write.message = conversionMessage( badValues, "channel yields" )
+            self.__write.print(1, 2)
+
+        self.__channelYields = ChannelYields(ejectiles, tableData[:, :numEjectiles], residuals, tableData[:, numEjectiles], self.__write)
 
         return
 
     def __parseNuclideYields(self, data):
         """Parses out nuclide yields"""
+        # Entries are \"a = A yield [+/- error]\", each following (on the same line or
+        # a previous line) the \"z = Z\" of the nuclide
+        __entryPattern = re.compile( r"\bz\s*=\s*(\d+)|\ba\s*=\s*(\d+)\s+(\S+)(?:\s+\+/-\s+(\S+))?", re.IGNORECASE )
+
+        zVals = []
+        aVals = []
+        valueRows = []
+        theZ = None
+        for theMatch in __entryPattern.finditer( "\n".join(data) ):
+            if ( theMatch.group(1) is not None ):
+                theZ = int( theMatch.group(1) )
+                continue
+            if ( theZ is None ):
+                continue
+            zVals.append( theZ )
+            aVals.append( int(theMatch.group(2)) )
+            theError = theMatch.group(4)
+            if ( theError is None ):
+                theError = "0"
+            valueRows.append( "%s %s" % (theMatch.group(3), theError) )
+        if ( len(valueRows) == 0 ):
+            self.__write.message = "No nuclide yields were found."
+            self.__write.print(1, 2)
+            return
+
+        tableData, badValues = parseTable( valueRows, 2 )
+        if ( len(badValues) > 0 ):
+            self.__write.message = conversionMessage( badValues, "nuclide yields" )
+            self.__write.print(1, 2)
+
+        self.__nuclideYields = NuclideYields(zVals, aVals, tableData[:, 0], tableData[:, 1], self.__write)
 
         return
 
-    def __parseMassYields(self, data):
-        """Parses out mass yields"""
-        __strStart = "a = "
-        __lenStrStart = len(__strStart)
-        __pmFlag = "+/-"
-        __defaultValue = 0.00
-
-        # Remove the starting flag and the summation line at the end:
-        xVals = []
-        dxVals = []
-        yVals = []
-        dyVals = []
-        yKEVals = []
-        dyKEVals = []
-        for lineIndx in range(0, len(data)-2, 1):
-            newLine = data[lineIndx]
-            newLine = newLine[ __lenStrStart : ].strip()   # Remove start of line
-            if (newLine == ""):
+    def __parseYieldTable(self, data, yieldName):
+        """
+        Converts the rows of a mass or charge yield table (\"A = x  yield +/- dyield
+        KE +/- dKE\") in bulk to 5 columns: A (or Z), yield, yield error, mean KE,
+        and KE error. The table ends at the first line without an \"=\" (i.e.
+        the empty line before the summation line).
+        """
+        __numColumns = 5
+
+        # Remove the starting flag ("A =" or "Z =") and all "+/-" flags:
+        tableRows = []
+        for lineIndx in range(0, len(data), 1):
+            newLine = data[lineIndx].split("=", 1)
+            if ( len(newLine) < 2 ):
                 break
+            tableRows.append( newLine[1].replace("+/-", " ") )
+        if ( len(tableRows) == 0 ):
+            self.__write.message = "No %s were found." % (yieldName)
+            self.__write.print(1, 2)
+            return None
 
-            # Parse the line and remove all "+/-" flags
-            parsedLine = parseLine( newLine )
-            lineData = []
-            for parseIndx in range(0, len(parsedLine), 1):
-                if ( not __pmFlag == parsedLine[parseIndx] ):
-                    lineData.append( parsedLine[parseIndx] )
-
-            # Convert all elements to floats:
-            for dataIndx in range(0, len(lineData), 1):
-                try:
-                    lineData[dataIndx] = float(lineData[dataIndx])
-                except:
-                    self.__write.message = "Failed to convert string (%s) to float for mass yields." % (lineData[dataIndx])
-                    self.__write.print(1, 2)
-                    lineData[dataIndx] = __defaultValue
-
-            # Obtain X/Y/dY values now for the scatter plot:
-            xVals.append( lineData[0] )
-            dxVals.append( 0.00 )
-            yVals.append( lineData[1] )
-            dyVals.append( lineData[2] )
-            yKEVals.append( lineData[3] )
-            dyKEVals.append( lineData[4] )
+        # Convert the whole table at once:
+        tableData, badValues = parseTable( tableRows, __numColumns )
+        if ( len(badValues) > 0 ):
+            self.__write.message = conversionMessage( badValues, yieldName )
+            self.__write.print(1, 2)
 
-        # Now construct a charge yield object:
-        self.__massYields = genPlotCls.Scatter(xVals, yVals, dxVals, dyVals, self.__write)
-        self.__massKEDist = genPlotCls.Scatter(xVals, yKEVals, dxVals, dyKEVals, self.__write)
+        return tableData
+
+    def __createYieldScatters(self, tableData):
+        """Returns the yield and KE distribution scatter objects of a mass or charge yield table"""
+        xVals = tableData[:, 0]
+        dxVals = np.zeros( len(xVals) )
+        theYields = genPlotCls.Scatter(xVals, tableData[:, 1], dxVals, tableData[:, 2], self.__write)
+        theKEDist = genPlotCls.Scatter(xVals, tableData[:, 3], dxVals, tableData[:, 4], self.__write)
+
+        return theYields, theKEDist
+
+    def __parseMassYields(self, data):
+        """Parses out mass yields"""
+        tableData = self.__parseYieldTable( data, "mass yields" )
+        if ( tableData is None ):
+            return
+
+        # Now construct a mass yield object:
+        self.__massYields, self.__massKEDist = self.__createYieldScatters( tableData )
 
         return
 
     def __parseChargeYields(self, data):
         """Parses out charge yields"""
-        __strStart = "z = "
-        __lenStrStart = len(__strStart)
-        __pmFlag = "+/-"
-        __defaultValue = 0.00
-
-        # Remove the starting flag and the summation line at the end:
-        xVals = []
-        dxVals = []
-        yVals = []
-        dyVals = []
-        yKEVals = []
-        dyKEVals = []
-        for lineIndx in range(0, len(data)-2, 1):
-            newLine = data[lineIndx]
-            newLine = newLine[ __lenStrStart : ].strip()   # Remove start of line
-            if (newLine == ""):
-                break
-
-            # Parse the line and remove all "+/-" flags
-            parsedLine = parseLine( newLine )
-            lineData = []
-            for parseIndx in range(0, len(parsedLine), 1):
-                if ( not __pmFlag == parsedLine[parseIndx] ):
-                    lineData.append( parsedLine[parseIndx] )
-
-            # Convert all elements to floats:
-            for dataIndx in range(0, len(lineData), 1):
-                try:
-                    lineData[dataIndx] = float(lineData[dataIndx])
-                except:
-                    self.__write.message = "Failed to convert string (%s) to float for charge yields." % (lineData[dataIndx])
-                    self.__write.print(1, 2)
-                    lineData[dataIndx] = __defaultValue
-
-            # Obtain X/Y/dY values now for the scatter plot:
-            xVals.append( lineData[0] )
-            dxVals.append( 0.00 )
-            yVals.append( lineData[1] )
-            dyVals.append( lineData[2] )
-            yKEVals.append( lineData[3] )
-            dyKEVals.append( lineData[4] )
+        tableData = self.__parseYieldTable( data, "charge yields" )
+        if ( tableData is None ):
+            return
 
         # Now construct a charge yield object:
-        self.__chargeYields = genPlotCls.Scatter(xVals, yVals, dxVals, dyVals, self.__write)
-        self.__chargeKEDist = genPlotCls.Scatter(xVals, yKEVals, dxVals, dyKEVals, self.__write)
+        self.__chargeYields, self.__chargeKEDist = self.__createYieldScatters( tableData )
 
         return
 
@@ -1155,10 +1323,10 @@ class ParticleYields:
             self.__write.print(1, 2)
             return
 
-        # Reduce file data:
+        # Reduce file data (markers are matched regardless of case):
         startingIndx = self.__dataLen
         for lineIndx in range(0, len(fileData), 1):
-            fileData[lineIndx] = fileData[lineIndx].lower().strip()
+            fileData[lineIndx] = fileData[lineIndx].strip()
             self.__fileData.append( fileData[lineIndx] )
             self.__dataLen += 1
         endingIndx = self.__dataLen
@@ -1167,6 +1335,36 @@ class ParticleYields:
 
         return
 
+    def releaseFileData(self):
+        """Discards the (already parsed) file lines; returns the number of bytes released"""
+        releasedBytes = textSize( self.__fileData )
+        self.__fileData = []
+        self.__dataLen = 0
+
+        return releasedBytes
+
+    def setYieldObjects(self, channelYields = None, nuclideYields = None, massYields = None, massKEDist = None, chargeYields = None, chargeKEDist = None):
+        """Sets the yield objects directly (e.g. for data that was not parsed from an output file)"""
+        self.__channelYields = channelYields
+        self.__nuclideYields = nuclideYields
+        self.__massYields = massYields
+        self.__massKEDist = massKEDist
+        self.__chargeYields = chargeYields
+        self.__chargeKEDist = chargeKEDist
+
+        return
+
+    def queryYieldObjects(self):
+        """Returns all yield objects (None for yields that were not created), by name"""
+        return {
+            "channelYields": self.__channelYields,
+            "nuclideYields": self.__nuclideYields,
+            "massYields": self.__massYields,
+            "massKEDist": self.__massKEDist,
+            "chargeYields": self.__chargeYields,
+            "chargeKEDist": self.__chargeKEDist
+        }
+
     def queryChannelYields(self):
         """Returns the channel yields to the user"""
         theObject = self.__channelYields
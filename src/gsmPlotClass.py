@@ -17,6 +17,9 @@ Plots have the following characteristics:
 #
 ################################################################################
 # IMPORTS:
+import os
+import time
+import multiprocessing
 
 
 # MODULES:
@@ -25,6 +28,9 @@ from plotClass import PlotClass
 from outputClass import GSMOutput
 from generalPlotTypeClasses import Scatter
 import fileModule
+import cacheModule
+import exportModule
+from parseServiceClass import parseSimulation
 
 
 # VERSION Number:
@@ -559,7 +565,7 @@ class PlotGSMInputFile:
     __dataArgs = ("data", "sim", "simlabel", "datalabel")
     __plotArgs = ("particle", "plot", "angle", "origin", "yield")
     __annotateArgs = ("annotate", "annotatepos", "otherannotate", "otherannotatepos", "otherannotatecolor", "legend")
-    __miscArgs = ("comment", "c", "save", "dpi", "show", "override", "scalesim", "scaledata")
+    __miscArgs = ("comment", "c", "save", "dpi", "show", "override", "scalesim", "scaledata", "cache", "parallel", "follow", "lean")
     __endArgs = ("end", "quit", "stop", "done", "new")
     __defaultAnnotatePos = 1.0E-2
     __defaultAnnotationColor = "blue"
@@ -567,14 +573,19 @@ class PlotGSMInputFile:
     __defaultXScaling = 1.00
     __defaultYScaling = 1.00
 
-    def __init__(self, inputName=None, newPrint = Print()):
-        """Constructor for the \"PlotInputFile\" class"""
+    def __init__(self, inputName=None, newPrint = Print(), parseService = None):
+        """
+        Constructor for the \"PlotInputFile\" class
+        -parseService (None): A (shared) \"ParseService\" object from which the
+        \tsimulation outputs are obtained instead of parsing them here.
+        """
 
         # Set default values:
         self.__write = newPrint
 
         # Reset all values:
         self.__resetMembers()
+        self.__parseService = parseService
 
         # Read input file and store data:
         if ( not isinstance(inputName, str) ):
@@ -595,8 +606,14 @@ class PlotGSMInputFile:
 
         # Parse out information in the file:
         self.__myPlot = PlotClass(True, self.__write)
+        self.__setupFollow()
+        self.__preloadSimulations()
         self.__parseInput()
 
+        # Update plots while the simulation files are being written:
+        if ( self.__followInterval is not None ):
+            self.__followSimulations()
+
         return
 
     def __del__(self):
@@ -608,6 +625,33 @@ class PlotGSMInputFile:
     def __resetMembers(self):
         """Resets all member-variables in the class"""
 
+        # Reset data files and objects:
+        self.__resetDataArgs()
+        # Simulation outputs parsed in parallel (by their declaration order):
+        self.__parallel = False
+        self.__preloadedSims = {}
+        # Following simulation outputs that are being written:
+        self.__followInterval = None
+        self.__followPolls = None
+        self.__followedSims = {}     # (by declaration order)
+        self.__plotSections = {}     # Sections used by each plot, as (sim. index, kind, key)
+        self.__plotIndx = 0
+        self.__replotIndices = None  # Plots to re-create (all when None)
+
+        # Data regarding the file:
+        self.__inputName = None
+        self.__fileData = []
+        self.__fileLen = 0
+        self.__fileWasRead = False
+
+        # Reset all others:
+        self.__resetPlotSpecifics()
+
+        return
+
+    def __resetDataArgs(self):
+        """Resets the data files, data objects, and their scaling"""
+
         # File names:
         self.__dataFiles = []
         self.__dataLabels = []
@@ -621,6 +665,10 @@ class PlotGSMInputFile:
         self.__numSimObjects = 0
         self.__expObjects = []
         self.__numExpObjects = 0
+        # Directory for caching parsed simulation data:
+        self.__cacheDir = None
+        # Whether or not simulation outputs keep only their parsed data:
+        self.__leanMemory = False
         # Whether or not to override:
         self.__override = False
         # Scaling of data:
@@ -631,15 +679,6 @@ class PlotGSMInputFile:
         self.__numSimScale = 0
         self.__numDataScale = 0
 
-        # Data regarding the file:
-        self.__inputName = None
-        self.__fileData = []
-        self.__fileLen = 0
-        self.__fileWasRead = False
-
-        # Reset all others:
-        self.__resetPlotSpecifics()
-
         return
 
     def __resetPlotSpecifics(self):
@@ -937,12 +976,19 @@ class PlotGSMInputFile:
                 theParticle = self.__pisa.queryParticles(parIndx)
                 theParticleLaTeX = self.__pisa.queryParticleLaTeX(parIndx)
 
+                # Obtain the particle's PISA data from each sim. object once (histograms are indexed by angle):
+                simParticles = []
+                for simIndx in range(0, self.__numSimObjects, 1):
+                    simParticles.append( self.__simObjects[simIndx].getPISAParticle(theParticle) )
+
                 for angIndx in range(0, numAngles, 1):
                     # Use special angles for angle/energy integrated spectra:
                     theAngle = theAngles[angIndx]
                     for simIndx in range(0, self.__numSimObjects, 1):
                         # Obtain histogram for each sim. object:
-                        theHistogram = self.__simObjects[simIndx].getPISAParticleHistogram(theParticle, theAngle)
+                        theHistogram = None
+                        if ( simParticles[simIndx] is not None ):
+                            theHistogram = simParticles[simIndx].getHistogram(theAngle)
 
                         if ( theHistogram is not None ):
                             self.__myPlot.addHistogram(theHistogram.getBinValues(), theHistogram.getDataPoints(), self.__simLabels[simIndx], self.__scaleSimX[simIndx], self.__scaleSimY[simIndx])
@@ -1095,8 +1141,12 @@ class PlotGSMInputFile:
             for simIndx in range(0, self.__numSimObjects, 1):
                 if ( yldNum == 0 ):
                     yldData = self.__simObjects[simIndx].queryChannelYields()
+                    if ( yldData is not None ):
+                        yldData = yldData.queryScatter()
                 elif ( yldNum == 1):
                     yldData = self.__simObjects[simIndx].queryNuclideYields()
+                    if ( yldData is not None ):
+                        yldData = yldData.queryScatter()
                 elif ( yldNum == 2):
                     yldData = self.__simObjects[simIndx].queryMassYields()
                 elif ( yldNum == 3):
@@ -1109,6 +1159,8 @@ class PlotGSMInputFile:
                     self.__write.message = "An unknown yield flag (%d) was found." % (yldNum)
                     self.__write.print(1, 2)
                     continue
+                if ( yldData is None ):
+                    continue
 
                 xVals = yldData.getXValues()
                 dxVals = yldData.getXError()
@@ -1200,32 +1252,203 @@ class PlotGSMInputFile:
 
         return
 
+    @classmethod
+    def __splitLine(cls, theline):
+        """Returns the line identifier and general flag (i.e. remainder of unparsed line) of an input line"""
+        theline = theline.strip()
+
+        # Remove any end-line comments:
+        if ( cls.__fileCommentFlag in theline ):
+            theline = theline[ : theline.find(cls.__fileCommentFlag) ].strip()
+
+        # Line is empty:
+        if ( theline == "" ):
+            return None, ""
+
+        # Parse line; obtain line identifier and obtain a general flag
+        parsedLine = fileModule.parseLine( theline )
+        lineFlag = theline[ len(parsedLine[0]) : ].strip()
+        lineID = parsedLine[0].lower().strip()
+
+        return lineID, lineFlag
+
+    @classmethod
+    def __scanSimLines(cls, fileData):
+        """Returns the simulation files (with the cache directory each uses) of an input file, and if they are to be parsed in parallel"""
+        simArgs = []
+        cacheDir = None
+        parallel = False
+        for lineIndx in range(0, len(fileData), 1):
+            lineID, lineFlag = cls.__splitLine( fileData[lineIndx] )
+            if ( lineID == cls.__dataArgs[1] ):
+                simArgs.append( (lineFlag.strip(), cacheDir) )
+            elif ( lineID == cls.__miscArgs[8] and len(lineFlag) > 0 ):
+                cacheDir = lineFlag.strip()
+            elif ( lineID == cls.__miscArgs[9] ):
+                parallel = ( lineFlag.strip().lower() == "true" )
+
+        return simArgs, parallel
+
+    @classmethod
+    def querySimFiles(cls, inputName):
+        """Returns the simulation files, as (fileName, cacheDir), used by an input file"""
+        if ( not fileModule.fileExists( inputName ) ):
+            return []
+        simArgs, parallel = cls.__scanSimLines( fileModule.readFile(inputName) )
+        return simArgs
+
+    def __setupFollow(self):
+        """Obtains the options for following simulation files (\"follow interval [number of polls]\")"""
+        followFlag = None
+        for lineIndx in range(0, self.__fileLen, 1):
+            lineID, lineFlag = self.__splitLine( self.__fileData[lineIndx] )
+            if ( lineID == self.__miscArgs[10] ):
+                followFlag = lineFlag
+        if ( followFlag is None ):
+            return
+
+        parsedLine = fileModule.parseLine( followFlag )
+        try:
+            self.__followInterval = float( parsedLine[0] )
+            if ( len(parsedLine) > 1 ):
+                self.__followPolls = int( parsedLine[1] )
+        except:
+            self.__write.message = "Invalid flag for following simulation files: %s" % (followFlag)
+            self.__write.print(1, 2)
+            self.__write.message = "   Simulation files will not be followed."
+            self.__write.print(1, 2)
+            self.__followInterval = None
+            self.__followPolls = None
+            return
+        if ( self.__followInterval <= 0 ):
+            self.__write.message = "The interval for following simulation files must be positive (%s). Simulation files will not be followed." % (followFlag)
+            self.__write.print(1, 2)
+            self.__followInterval = None
+            self.__followPolls = None
+
+        return
+
+    def __followSimulations(self):
+        """Re-creates the plots affected by new data as the simulation files are written"""
+        if ( len(self.__followedSims) == 0 ):
+            return
+
+        self.__write.message = "Following %d simulation file(s), checking every %.1f seconds (interrupt to stop)..." % (len(self.__followedSims), self.__followInterval)
+        self.__write.print(2, 1)
+        numPolls = 0
+        try:
+            while ( self.__followPolls is None or numPolls < self.__followPolls ):
+                time.sleep( self.__followInterval )
+                numPolls += 1
+                if ( not self.__updatePlots() ):
+                    break
+        except KeyboardInterrupt:
+            self.__write.message = "Stopped following simulation files."
+            self.__write.print(2, 1)
+
+        # Parse any sections left incomplete by the files:
+        self.__updatePlots( True )
+
+        return
+
+    def __updatePlots(self, endOfFile = False):
+        """Updates the followed simulation files and re-creates the affected plots; returns if any file is still followed"""
+
+        # Obtain all new sections:
+        changedSections = set()
+        stillFollowed = False
+        for simIndx in range(0, self.__numSimObjects, 1):
+            theSim = self.__simObjects[simIndx]
+            if ( not theSim.isFollowed() ):
+                continue
+            for (kind, key) in theSim.update( endOfFile ):
+                changedSections.add( (simIndx, kind, key) )
+            stillFollowed = stillFollowed or theSim.isFollowed()
+        if ( len(changedSections) == 0 ):
+            return stillFollowed
+
+        # Determine the plots using the new sections (a key of None includes all keys):
+        replotIndices = set()
+        for plotIndx in self.__plotSections:
+            for (simIndx, kind, key) in self.__plotSections[ plotIndx ]:
+                if ( (simIndx, kind, key) in changedSections ):
+                    replotIndices.add( plotIndx )
+                elif ( key is None ):
+                    for changedSection in changedSections:
+                        if ( changedSection[0] == simIndx and changedSection[1] == kind ):
+                            replotIndices.add( plotIndx )
+        if ( len(replotIndices) == 0 ):
+            return stillFollowed
+
+        # Read the input again, only re-creating the affected plots:
+        self.__write.message = "New simulation data was found; re-creating %d plot(s)..." % (len(replotIndices))
+        self.__write.print(2, 1)
+        self.__resetDataArgs()
+        self.__replotIndices = replotIndices
+        self.__parseInput()
+        self.__replotIndices = None
+
+        return stillFollowed
+
+    def __preloadSimulations(self):
+        """Parses all simulation files of the input file in parallel (if requested)"""
+
+        # Gather the simulation files (and the cache directory each uses):
+        simArgs, self.__parallel = self.__scanSimLines( self.__fileData )
+        if ( not self.__parallel or self.__parseService is not None or self.__followInterval is not None ):
+            return
+
+        # Only existing files are parsed:
+        simIndices = []
+        for simIndx in range(0, len(simArgs), 1):
+            if ( fileModule.fileExists( simArgs[simIndx][0] ) or exportModule.isExport( simArgs[simIndx][0] ) ):
+                simIndices.append( simIndx )
+        numProcesses = min( len(simIndices), os.cpu_count() )
+        if ( len(simIndices) == 0 or os.cpu_count() <= 1 ):
+            return
+
+        # Processes used to parse several input files can't create processes themselves:
+        if ( multiprocessing.current_process().daemon ):
+            self.__write.message = "Unable to parse simulation files in parallel from within a worker process. Parsing files serially..."
+            self.__write.print(1, 2)
+            return
+
+        # A single file is parsed by parsing its sections in parallel instead:
+        if ( numProcesses == 1 ):
+            simIndx = simIndices[0]
+            fileName, cacheDir = simArgs[simIndx]
+            self.__preloadedSims[ simIndx ] = GSMOutput( fileName, self.__write, False, cacheDir, False, False, os.cpu_count() )
+            return
+
+        self.__write.message = "Parsing %d simulation files using %d processes..." % (len(simIndices), numProcesses)
+        self.__write.print(2, 2)
+        with multiprocessing.Pool( processes=numProcesses ) as pool:
+            parsedSims = pool.map( parseSimulation, [simArgs[simIndx] for simIndx in simIndices] )
+
+        # Store outputs by their declaration order (attaching this object's Print object):
+        for i in range(0, len(simIndices), 1):
+            self.__preloadedSims[ simIndices[i] ] = cacheModule.unpackData( parsedSims[i], self.__write )
+
+        return
+
     def __parseInput(self):
         """Parses out the data in the input file"""
 
         # Create new plot object:
+        self.__plotIndx = 0
         self.__newPlot()
 
         for lineIndx in range(0, self.__fileLen, 1):
 
             # Get line information:
             lineNumber = lineIndx + 1
-            theline = self.__fileData[lineIndx].strip()
-
-            # Remove any end-line comments:
-            if ( self.__fileCommentFlag in theline ):
-                theline = theline[ : theline.find(self.__fileCommentFlag) ].strip()
+            lineID, lineFlag = self.__splitLine( self.__fileData[lineIndx] )
 
             # Skip empty lines:
-            if ( theline is "" ):
+            if ( lineID is None ):
                 # Line is empty, go to next:
                 continue
 
-            # Parse line; obtain line identifier and obtain a general flag (i.e. remainder of unparsed line)
-            parsedLine = fileModule.parseLine( theline )
-            lineFlag = theline[ len(parsedLine[0]) : ].strip()
-            lineID = parsedLine[0].lower().strip()
-
             # Check for valid line identifier:
             foundFlag = self.__applyAxisLims(lineID, lineFlag)
             if ( not foundFlag ):
@@ -1364,11 +1587,34 @@ class PlotGSMInputFile:
             # Load simulation data file:
             self.__simFiles.append( lineFlag.strip() )
             self.__numSimFiles += 1
-            if ( not fileModule.fileExists( self.__simFiles[ len(self.__simFiles)-1 ] ) ):
+            if ( not fileModule.fileExists( self.__simFiles[ len(self.__simFiles)-1 ] ) and not exportModule.isExport( self.__simFiles[ len(self.__simFiles)-1 ] ) ):
                 self.__write.message = "File \"%s\" does not exist for reading simulation data from." % (self.__simFiles[self.__numSimFiles-1])
                 self.__write.print(1, 2)
+            elif ( (self.__numSimFiles-1) in self.__followedSims ):
+                # (File is being followed; its data is updated in place)
+                self.__simObjects.append( self.__followedSims[ self.__numSimFiles-1 ] )
+                self.__numSimObjects += 1
+            elif ( self.__followInterval is not None ):
+                # (Only the complete sections of the file are parsed, then the file is followed)
+                self.__followedSims[ self.__numSimFiles-1 ] = GSMOutput(self.__simFiles[self.__numSimFiles-1], self.__write, False, None, False, True, 1, self.__leanMemory)
+                self.__simObjects.append( self.__followedSims[ self.__numSimFiles-1 ] )
+                self.__numSimObjects += 1
+            elif ( (self.__numSimFiles-1) in self.__preloadedSims ):
+                # (File was already parsed in parallel)
+                self.__simObjects.append( self.__preloadedSims.pop( self.__numSimFiles-1 ) )
+                self.__numSimObjects += 1
+            elif ( self.__parseService is not None ):
+                # (File is parsed once for all input files by the shared service)
+                packedOutput = self.__parseService.queryOutput( self.__simFiles[self.__numSimFiles-1], self.__cacheDir )
+                self.__simObjects.append( cacheModule.unpackData( packedOutput, self.__write ) )
+                self.__numSimObjects += 1
+            elif ( self.__leanMemory ):
+                # (File is parsed completely, then only its parsed data is kept)
+                self.__simObjects.append( GSMOutput(self.__simFiles[self.__numSimFiles-1], self.__write, False, self.__cacheDir, False, False, 1, True) )
+                self.__numSimObjects += 1
             else:
-                self.__simObjects.append( GSMOutput(self.__simFiles[self.__numSimFiles-1], self.__write) )
+                # (Sections are only located in the mapped file, then parsed once a plot requests them)
+                self.__simObjects.append( GSMOutput(self.__simFiles[self.__numSimFiles-1], self.__write, True, self.__cacheDir, True) )
                 self.__numSimObjects += 1
 
         elif ( lineID == self.__dataArgs[2] ):
@@ -1598,7 +1844,7 @@ class PlotGSMInputFile:
 
     def __applyMiscArgs(self, lineID, lineFlag):
         """Checks if the input has flag from the __miscArgs tuple"""
-        # __miscArgs = ("comment", "c", "save", "dpi", "show", "override", "scalesim", "scaledata")
+        # __miscArgs = ("comment", "c", "save", "dpi", "show", "override", "scalesim", "scaledata", "cache", "parallel", "follow", "lean")
 
         foundFlag = True
         if ( lineID == self.__miscArgs[0] ):
@@ -1752,6 +1998,37 @@ class PlotGSMInputFile:
             self.__scaleDataY.append ( yVal )
             self.__numDataScale += 1
 
+        elif ( lineID == self.__miscArgs[8] ):
+            # "cache": directory in which parsed simulation data is stored (applies to following "sim" lines)
+            if ( len(lineFlag) > 0 ):
+                self.__cacheDir = lineFlag.strip()
+                self.__write.message = "Parsed simulation data will be cached in \"%s\"." % (self.__cacheDir)
+                self.__write.print(2, 3)
+            else:
+                self.__write.message = "No cache directory given. Ignoring line..."
+                self.__write.print(1, 2)
+
+        elif ( lineID == self.__miscArgs[9] ):
+            # "parallel": simulation files were parsed in parallel before reading the input (see __preloadSimulations)
+            lineFlag = lineFlag.strip().lower()
+            if ( not lineFlag in ("true", "false") ):
+                self.__write.message = "Invalid flag for parsing simulation files in parallel: %s" % (lineFlag)
+                self.__write.print(1, 2)
+
+        elif ( lineID == self.__miscArgs[10] ):
+            # "follow": options were obtained before reading the input (see __setupFollow)
+            pass
+
+        elif ( lineID == self.__miscArgs[11] ):
+            # "lean": simulation outputs (of following "sim" lines) discard their raw text once parsed
+            # (outputs parsed in parallel or by a parse service never keep their raw text)
+            lineFlag = lineFlag.strip().lower()
+            if ( lineFlag in ("true", "false") ):
+                self.__leanMemory = ( lineFlag == "true" )
+            else:
+                self.__write.message = "Invalid flag for discarding the raw text of simulation outputs: %s" % (lineFlag)
+                self.__write.print(1, 2)
+
         else:
             foundFlag = False
 
@@ -1780,8 +2057,20 @@ class PlotGSMInputFile:
     def createPlot(self):
         """Creates the plot and shows/saves it accordingly"""
 
-        # Plot all lines requested:
-        self.__plotLines()
+        # Plot all lines requested (only plots with new data are re-created when following files):
+        plotIndx = self.__plotIndx
+        self.__plotIndx += 1
+        if ( self.__replotIndices is None or plotIndx in self.__replotIndices ):
+            for simIndx in range(0, self.__numSimObjects, 1):
+                self.__simObjects[simIndx].clearAccessedSections()
+
+            self.__plotLines()
+
+            # Record the sections used by the plot:
+            self.__plotSections[ plotIndx ] = set()
+            for simIndx in range(0, self.__numSimObjects, 1):
+                for (kind, key) in self.__simObjects[simIndx].queryAccessedSections():
+                    self.__plotSections[ plotIndx ].add( (simIndx, kind, key) )
 
         # Create new plot object:
         self.__newPlot()
@@ -0,0 +1,373 @@
+
+################################################################################
+# File documentation:
+"""
+This module contains vectorized algebra (sums, differences, scaling, ratios,
+and rebinning) for the general Histogram objects (see
+generalPlotTypeClasses.py), with propagation of the (uncorrelated) errors.
+
+Errors of a histogram are given as a second histogram of the same bins, as is
+done for the energy spectra (e.g. the "total" and "dtotal" histograms).
+
+The procedures come in two layers:
+-Array procedures (addValues, subtractValues, scaleValues, divideValues,
+\trebinValues) operate on arrays of values and errors. A 2-D array holds a
+\tbatch of histograms (one per row) on the same bins, so a whole batch is
+\tcomputed at once. These procedures keep the sign of all values.
+-Histogram procedures (add, subtract, scale, divide, rebin, sumHistograms)
+\taccept a Histogram or a list of Histograms (a batch). Histograms on
+\tdifferent bins are rebinned onto a common set of bins, the batch is
+\tcomputed with the array procedures, and new Histogram objects (and their
+\terror histograms) are returned. A Histogram object cannot hold negative
+\tvalues, so subtract returns the arrays of the differences (bins, values,
+\terrors) instead, and negative values given to toHistograms are set to 0
+\t(each bin on its own; a warning is printed).
+
+Rebinning weights each old bin by its overlap with each new bin. Values are
+treated as densities (e.g. [mb/MeV]) unless specified otherwise.
+
+USAGE (example):
+   import histAlgebraModule as histAlgebra
+
+   # Sum the components of an energy spectrum:
+   theSum, theSumErr = histAlgebra.sumHistograms( [cascade, precompound, evaporation], [dCascade, dPrecompound, dEvaporation] )
+
+   # Ratio of simulated spectra to experimental data (on the experimental bins; one pass for all):
+   theRatios = histAlgebra.divide( simHistograms, expHistograms, simErrors, expErrors, bins = expBins )
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import numpy as np
+
+# MODULES:
+from generalPlotTypeClasses import Histogram
+from printClass import Print
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+# Module defaults:
+errorNotePrefix = "d"   # Prefix of the notes of error histograms
+
+
+# Array procedures:
+def _quadrature(errorsA, errorsB):
+    """Returns the errors added in quadrature (None if neither set of errors is given)"""
+    if ( errorsA is None and errorsB is None ):
+        return None
+    elif ( errorsA is None ):
+        return np.abs( np.asarray(errorsB, dtype=float) )
+    elif ( errorsB is None ):
+        return np.abs( np.asarray(errorsA, dtype=float) )
+    return np.hypot( errorsA, errorsB )
+
+def addValues(valuesA, valuesB, errorsA = None, errorsB = None):
+    """Returns the sum of two sets of values and its errors"""
+    theValues = np.add( valuesA, valuesB, dtype=float )
+    return theValues, _quadrature( errorsA, errorsB )
+
+def subtractValues(valuesA, valuesB, errorsA = None, errorsB = None):
+    """Returns the difference of two sets of values (A - B) and its errors"""
+    theValues = np.subtract( valuesA, valuesB, dtype=float )
+    return theValues, _quadrature( errorsA, errorsB )
+
+def scaleValues(values, factor, errors = None, factorError = 0.00):
+    """
+    Returns the values scaled by a factor and its errors. The factor (and its
+    error) may be an array (e.g. one factor per row of a batch).
+    """
+    values = np.asarray( values, dtype=float )
+    theValues = values * factor
+    if ( errors is None and np.all(np.asarray(factorError) == 0) ):
+        return theValues, None
+
+    theErrors = np.abs( np.asarray(factorError, dtype=float) * values )
+    if ( errors is not None ):
+        theErrors = np.hypot( np.asarray(errors, dtype=float) * factor, theErrors )
+    return theValues, theErrors
+
+def divideValues(numerators, denominators, errorsN = None, errorsD = None):
+    """
+    Returns the ratio of two sets of values and its errors. The ratio (and its
+    error) is 0 wherever the denominator is 0.
+    """
+    numerators = np.asarray( numerators, dtype=float )
+    denominators = np.asarray( denominators, dtype=float )
+    validValues = ( denominators != 0 )
+    theValues = np.divide( numerators, denominators, out=np.zeros(np.broadcast(numerators, denominators).shape), where=validValues )
+    if ( errorsN is None and errorsD is None ):
+        return theValues, None
+
+    # (Written to remain valid for zero numerators)
+    errorSum = _quadrature( errorsN, None if errorsD is None else theValues * errorsD )
+    theErrors = np.divide( errorSum, np.abs(denominators), out=np.zeros(theValues.shape), where=validValues )
+    return theValues, theErrors
+
+def intervalMatrix(bins, lowerBounds, upperBounds, density = True):
+    """
+    Returns the (bins x intervals) matrix of weights that maps values on the
+    bin bounds 'bins' to the intervals [lowerBounds, upperBounds) (which may
+    overlap or leave gaps). Each weight is the overlap of a bin and interval,
+    divided by the interval's width for densities (averaging the values) or by
+    the bin's width otherwise (splitting the values, e.g. counts).
+    """
+    bins = np.asarray( bins, dtype=float )
+    lowerBounds = np.asarray( lowerBounds, dtype=float )
+    upperBounds = np.asarray( upperBounds, dtype=float )
+    theOverlap = np.minimum( bins[1 : , None], upperBounds[None, : ] ) - np.maximum( bins[ : -1, None], lowerBounds[None, : ] )
+    theOverlap = np.maximum( theOverlap, 0.00 )
+    if ( density ):
+        theWidths = (upperBounds - lowerBounds)[None, : ]
+    else:
+        theWidths = np.diff( bins )[ : , None]
+
+    return np.divide( theOverlap, theWidths, out=np.zeros(theOverlap.shape), where=(theWidths > 0) )
+
+def rebinMatrix(bins, newBins, density = True):
+    """
+    Returns the (old bins x new bins) matrix of weights that maps values on
+    the bin bounds 'bins' to the bin bounds 'newBins' (see intervalMatrix).
+    """
+    newBins = np.asarray( newBins, dtype=float )
+    return intervalMatrix( bins, newBins[ : -1], newBins[1 : ], density )
+
+def rebinValues(bins, values, newBins, errors = None, density = True):
+    """
+    Returns the values (and errors) on the bin bounds 'bins' rebinned onto the
+    bin bounds 'newBins'. The values may be a batch (one histogram per row).
+    """
+    bins = np.asarray( bins, dtype=float )
+    newBins = np.asarray( newBins, dtype=float )
+    values = np.asarray( values, dtype=float )
+    numBins = len(bins) - 1
+
+    # Bins that are the start of the new bins only need zeros appended (e.g. trimmed histograms):
+    if ( len(bins) <= len(newBins) and np.array_equal(bins, newBins[ : len(bins)]) ):
+        padWidth = [(0, 0)] * (values.ndim - 1) + [(0, len(newBins) - len(bins))]
+        theValues = np.pad( values[..., : numBins], padWidth )
+        theErrors = None
+        if ( errors is not None ):
+            theErrors = np.pad( np.asarray(errors, dtype=float)[..., : numBins], padWidth )
+        return theValues, theErrors
+
+    theWeights = rebinMatrix( bins, newBins, density )
+    theValues = values[..., : numBins] @ theWeights
+    theErrors = None
+    if ( errors is not None ):
+        theErrors = np.sqrt( np.square(np.asarray(errors, dtype=float)[..., : numBins]) @ np.square(theWeights) )
+    return theValues, theErrors
+
+
+# Histogram procedures:
+def histogramData(theHistogram, errorHistogram = None):
+    """
+    Returns the bin bounds, values, and errors (None without an error
+    histogram) of a histogram. The value and error histograms may be trimmed to
+    different lengths; both are extended to the longer set of bins.
+    """
+    theBins = theHistogram.queryBinBounds()
+    theValues = theHistogram.queryYValues()
+    if ( errorHistogram is None ):
+        return theBins, theValues, None
+
+    errorBins = errorHistogram.queryBinBounds()
+    theErrors = errorHistogram.queryYValues()
+    if ( len(errorBins) > len(theBins) ):
+        theBins = errorBins
+    numBins = len(theBins) - 1
+    theValues = np.pad( theValues, (0, numBins - len(theValues)) )
+    theErrors = np.pad( theErrors, (0, numBins - len(theErrors)) )
+
+    return theBins, theValues, theErrors
+
+def _asBatch(histograms):
+    """Returns the histogram(s) as a list, and whether a batch (list or tuple) was given"""
+    if ( histograms is None ):
+        return None, False
+    if ( isinstance(histograms, (list, tuple)) ):
+        return list(histograms), True
+    return [histograms], False
+
+def stackHistograms(histograms, errorHistograms = None, bins = None, density = True):
+    """
+    Returns common bin bounds and the (histograms x bins) arrays of values and
+    errors (None without error histograms) of a batch of histograms. The bins
+    of the histogram with the most bins are used unless bins are given;
+    histograms on other bins are rebinned.
+    """
+    errorHistograms = _asBatch( errorHistograms )[0]
+    if ( errorHistograms is None ):
+        errorHistograms = [None] * len(histograms)
+    useErrors = any( errorHist is not None for errorHist in errorHistograms )
+
+    # Obtain each histogram's data and the common bins:
+    histData = [ histogramData(histograms[histIndx], errorHistograms[histIndx]) for histIndx in range(0, len(histograms), 1) ]
+    if ( bins is None ):
+        bins = max( (theData[0] for theData in histData), key=len )
+    bins = np.asarray( bins, dtype=float )
+
+    # Place each histogram on the common bins:
+    theValues = np.zeros( (len(histograms), len(bins)-1) )
+    theErrors = None
+    if ( useErrors ):
+        theErrors = np.zeros( theValues.shape )
+    for histIndx in range(0, len(histData), 1):
+        histBins, histValues, histErrors = histData[histIndx]
+        if ( np.array_equal(histBins, bins) ):
+            newValues, newErrors = histValues, histErrors
+        else:
+            newValues, newErrors = rebinValues( histBins, histValues, bins, histErrors, density )
+        theValues[histIndx] = newValues
+        if ( newErrors is not None ):
+            theErrors[histIndx] = newErrors
+
+    return bins, theValues, theErrors
+
+def toHistograms(bins, values, errors = None, notes = None, newPrint = Print() ):
+    """
+    Creates a Histogram (and its error histogram, or None without errors) from
+    the bin bounds and values. A batch of values (one histogram per row) returns
+    a list of (histogram, error histogram) pairs. Negative values are set to 0.
+    """
+    values = np.asarray( values, dtype=float )
+    isBatch = ( values.ndim > 1 )
+    values = values.reshape( (-1, values.shape[-1]) )
+    negativeValues = ( values < 0 )
+    if ( negativeValues.any() ):
+        # (The Histogram object would otherwise shift all values up by the most negative value)
+        newPrint.message = "%d negative values were set to 0 when creating the histograms." % (negativeValues.sum())
+        newPrint.print(1, 2)
+        values = np.where( negativeValues, 0.00, values )
+    if ( errors is not None ):
+        errors = np.broadcast_to( errors, values.shape )
+    if ( notes is None or isinstance(notes, str) ):
+        notes = [notes] * values.shape[0]
+
+    theHistograms = []
+    for histIndx in range(0, values.shape[0], 1):
+        theHistogram = Histogram( bins, values[histIndx], notes[histIndx], newPrint )
+        errorHistogram = None
+        if ( errors is not None ):
+            errorHistogram = Histogram( bins, errors[histIndx], errorNotePrefix + theHistogram.queryNote(), newPrint )
+        theHistograms.append( (theHistogram, errorHistogram) )
+
+    if ( isBatch ):
+        return theHistograms
+    return theHistograms[0]
+
+def _binaryArrays(theOperation, histA, histB, errorsA, errorsB, bins, density, newPrint):
+    """
+    Applies an array procedure to (batches of) histograms A and B; returns the
+    bins, values, errors, notes of A, and if A is a batch (None on failure)
+    """
+    batchA, isBatch = _asBatch( histA )
+    batchB = _asBatch( histB )[0]
+    errorsA = _asBatch( errorsA )[0]
+    errorsB = _asBatch( errorsB )[0]
+
+    # A single histogram B is applied to every histogram of A:
+    if ( len(batchB) == 1 and len(batchA) > 1 ):
+        batchB = batchB * len(batchA)
+        if ( errorsB is not None ):
+            errorsB = errorsB * len(batchA)
+    if ( not len(batchA) == len(batchB) ):
+        newPrint.message = "Unable to combine %d histograms with %d histograms. The histograms must be paired." % (len(batchA), len(batchB))
+        newPrint.print(1, 2)
+        return None, None, None, None, isBatch
+
+    # Place all histograms on the same bins:
+    allErrors = None
+    if ( errorsA is not None or errorsB is not None ):
+        allErrors = (errorsA or [None]*len(batchA)) + (errorsB or [None]*len(batchB))
+    bins, allValues, allErrors = stackHistograms( batchA + batchB, allErrors, bins, density )
+
+    # Compute all histograms at once:
+    numHistograms = len(batchA)
+    errorsA = None
+    errorsB = None
+    if ( allErrors is not None ):
+        errorsA = allErrors[ : numHistograms]
+        errorsB = allErrors[numHistograms : ]
+    theValues, theErrors = theOperation( allValues[ : numHistograms], allValues[numHistograms : ], errorsA, errorsB )
+
+    return bins, theValues, theErrors, [theHist.queryNote() for theHist in batchA], isBatch
+
+def _binaryOperation(theOperation, histA, histB, errorsA, errorsB, bins, density, newPrint):
+    """Applies an array procedure to (batches of) histograms A and B; returns the new histograms"""
+    bins, theValues, theErrors, theNotes, isBatch = _binaryArrays( theOperation, histA, histB, errorsA, errorsB, bins, density, newPrint )
+    if ( theValues is None ):
+        return None
+
+    theHistograms = toHistograms( bins, theValues, theErrors, theNotes, newPrint )
+    if ( isBatch ):
+        return theHistograms
+    return theHistograms[0]
+
+def add(histA, histB, errorsA = None, errorsB = None, bins = None, density = True, newPrint = Print() ):
+    """Returns the sum (histogram and error histogram) of two histograms (or of each pair of two batches)"""
+    return _binaryOperation( addValues, histA, histB, errorsA, errorsB, bins, density, newPrint )
+
+def subtract(histA, histB, errorsA = None, errorsB = None, bins = None, density = True, newPrint = Print() ):
+    """
+    Returns the difference, A - B, of two histograms (or of each pair of two
+    batches) as the arrays (bins, values, errors), keeping the sign of each
+    value. A batch returns a value (and error) row for each pair.
+    """
+    bins, theValues, theErrors, theNotes, isBatch = _binaryArrays( subtractValues, histA, histB, errorsA, errorsB, bins, density, newPrint )
+    if ( theValues is None ):
+        return None
+    if ( not isBatch ):
+        theValues = theValues[0]
+        if ( theErrors is not None ):
+            theErrors = theErrors[0]
+
+    return bins, theValues, theErrors
+
+def divide(histA, histB, errorsA = None, errorsB = None, bins = None, density = True, newPrint = Print() ):
+    """
+    Returns the ratio, A / B, (histogram and error histogram) of two histograms
+    (or of each pair of two batches). The bins of A are used unless given.
+    """
+    if ( bins is None ):
+        bins = _asBatch( histA )[0][0].queryBinBounds()
+    return _binaryOperation( divideValues, histA, histB, errorsA, errorsB, bins, density, newPrint )
+
+def scale(histograms, factor, errorHistograms = None, factorError = 0.00, newPrint = Print() ):
+    """Returns the histogram(s) scaled by a factor (a factor may be given for each histogram of a batch)"""
+    batch, isBatch = _asBatch( histograms )
+    bins, theValues, theErrors = stackHistograms( batch, errorHistograms )
+    factor = np.reshape( np.asarray(factor, dtype=float), (-1, 1) )
+    factorError = np.reshape( np.asarray(factorError, dtype=float), (-1, 1) )
+    theValues, theErrors = scaleValues( theValues, factor, theErrors, factorError )
+
+    theHistograms = toHistograms( bins, theValues, theErrors, [theHist.queryNote() for theHist in batch], newPrint )
+    if ( isBatch ):
+        return theHistograms
+    return theHistograms[0]
+
+def rebin(histograms, newBins, errorHistograms = None, density = True, newPrint = Print() ):
+    """Returns the histogram(s) rebinned onto the bin bounds given"""
+    batch, isBatch = _asBatch( histograms )
+    bins, theValues, theErrors = stackHistograms( batch, errorHistograms, newBins, density )
+
+    theHistograms = toHistograms( bins, theValues, theErrors, [theHist.queryNote() for theHist in batch], newPrint )
+    if ( isBatch ):
+        return theHistograms
+    return theHistograms[0]
+
+def sumHistograms(histograms, errorHistograms = None, bins = None, density = True, newPrint = Print() ):
+    """Returns the sum (histogram and error histogram) of all histograms given (e.g. the components of a spectrum)"""
+    bins, theValues, theErrors = stackHistograms( list(histograms), errorHistograms, bins, density )
+    sumErrors = None
+    if ( theErrors is not None ):
+        sumErrors = np.sqrt( np.square(theErrors).sum(axis=0) )
+
+    return toHistograms( bins, theValues.sum(axis=0), sumErrors, "sum", newPrint )
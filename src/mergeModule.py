@@ -0,0 +1,561 @@
+
+################################################################################
+# File documentation:
+"""
+This module merges the output files of many independent GSM (CEM, LAQGSM) runs
+of the same problem into a single output file. The double differential (PISA)
+spectra, the energy spectra of each particle (by origin), and the channel,
+nuclide, mass, and charge yields of all runs are combined, with each run
+weighted by its number of events:
+
+   merged value = sum( w_i * v_i ) / sum( w_i )
+   merged error = sqrt( sum( (w_i * dv_i)^2 ) ) / sum( w_i )
+
+The mean kinetic energies of the mass and charge yields are weighted by each
+run's yield as well. Values missing from a run (e.g. suppressed yields) count
+as zero.
+
+The output files are streamed: each file is parsed (in lean memory mode), its
+data is added to the accumulators of the merger, and the parsed file is
+discarded before the next file is read, so only a single output is held in
+memory at any time. The accumulators are arrays allocated when a histogram
+(keyed by particle and angle, or by particle and origin) or yield table is
+first seen; they only grow when a later run contains more bins (or
+nuclides). Histograms of a run with different bins are rebinned onto the
+accumulator's bins (see histAlgebraModule.rebinValues).
+
+The merged data is written in the format of a GSM output file, so that the
+merged file can be read (see outputClass.GSMOutput) and plotted as any other
+simulation output file.
+
+USAGE (example):
+   import mergeModule
+
+   # Merge three runs (of 1E5, 2E5, and 1E5 events):
+   mergeModule.mergeOutputs( ["run1.out", "run2.out", "run3.out"], "merged.out", weights = [1E5, 2E5, 1E5] )
+
+   # Or stream the runs one at a time:
+   theMerger = mergeModule.OutputMerger()
+   for fileName, numEvents in theRuns:
+      theMerger.addOutput( fileName, numEvents )
+   theMerger.writeOutput( "merged.out" )
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import numpy as np
+
+# MODULES:
+from printClass import Print
+from fileModule import fileExists
+from outputClass import GSMOutput
+import gsmDataClasses as gsmData
+import histAlgebraModule as histAlgebra
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+# Module defaults:
+_starLine = 34*"*"   # Particle data headers (see fileModule.outputMarkers)
+_maxCharge = 120     # Initial size of the yield arrays (grown as needed)
+_maxMass = 300
+
+
+def _formatValue(theValue):
+    """Returns the text of a (non-negative) value of a merged table"""
+    return "%.6e" % (theValue)
+
+def _formatBins(lowerBound, upperBound):
+    """Returns the text of a bin of a merged table (\"lower- upper\")"""
+    return "%10.4f- %10.4f" % (lowerBound, upperBound)
+
+
+class _HistogramAccumulator:
+    """
+    The \"_HistogramAccumulator\" object stores the weighted sums of the values
+    (and of the squared errors) of a single histogram over many runs.
+    """
+    __slots__ = ("__bins", "__values", "__squaredErrors")
+
+    def __init__(self, bins):
+        """Constructor (the bin bounds of the first run)"""
+        self.__bins = np.array( bins, dtype=float )
+        numBins = len(self.__bins) - 1
+        self.__values = np.zeros( numBins )
+        self.__squaredErrors = np.zeros( numBins )
+
+        return
+
+    def add(self, bins, values, errors, weight):
+        """Adds the (weighted) values and errors (may be None) of a run"""
+        bins = np.asarray( bins, dtype=float )
+
+        # Grow the accumulator when the run extends its bins:
+        numBins = len(self.__bins)
+        if ( len(bins) > numBins and np.array_equal(self.__bins, bins[ : numBins]) ):
+            numExtraBins = len(bins) - numBins
+            self.__values = np.pad( self.__values, (0, numExtraBins) )
+            self.__squaredErrors = np.pad( self.__squaredErrors, (0, numExtraBins) )
+            self.__bins = bins.copy()
+
+        # Now add the run's values (rebinned if needed):
+        theValues, theErrors = histAlgebra.rebinValues( bins, values, self.__bins, errors )
+        self.__values += weight * theValues
+        if ( theErrors is not None ):
+            self.__squaredErrors += np.square( weight * theErrors )
+
+        return
+
+    def queryResult(self, totalWeight):
+        """Returns the bins, values, and errors of the merged histogram"""
+        return self.__bins, self.__values / totalWeight, np.sqrt( self.__squaredErrors ) / totalWeight
+
+
+def _commonTable(theAccumulators, totalWeight):
+    """
+    Returns the bins, and the (bins x histograms) arrays of values and errors,
+    of several merged histograms on their longest set of bins
+    """
+    theResults = [ theAccumulator.queryResult(totalWeight) for theAccumulator in theAccumulators ]
+    theBins = theResults[0][0]
+    for theResult in theResults:
+        if ( len(theResult[0]) > len(theBins) ):
+            theBins = theResult[0]
+
+    numBins = len(theBins) - 1
+    theValues = np.zeros( (numBins, len(theResults)) )
+    theErrors = np.zeros( (numBins, len(theResults)) )
+    for resultIndx in range(0, len(theResults), 1):
+        theValues[:, resultIndx], theErrors[:, resultIndx] = histAlgebra.rebinValues( theResults[resultIndx][0], theResults[resultIndx][1], theBins, theResults[resultIndx][2] )
+
+    return theBins, theValues, theErrors
+
+
+class _YieldAccumulator:
+    """
+    The \"_YieldAccumulator\" object stores the weighted sums of a mass (or
+    charge) yield table, indexed by mass (or charge) number: the yields, their
+    squared errors, and the yield-weighted mean kinetic energies (and their
+    squared errors).
+    """
+    __slots__ = ("__found", "__yields", "__yieldErrors", "__energies", "__energyErrors")
+
+    def __init__(self, numEntries):
+        """Constructor (the initial number of mass or charge numbers)"""
+        self.__found = np.zeros( numEntries, dtype=bool )
+        self.__yields = np.zeros( numEntries )
+        self.__yieldErrors = np.zeros( numEntries )
+        self.__energies = np.zeros( numEntries )
+        self.__energyErrors = np.zeros( numEntries )
+
+        return
+
+    def __grow(self, numEntries):
+        """Grows the arrays to (at least) the given number of entries"""
+        numExtra = numEntries - len(self.__found)
+        if ( numExtra <= 0 ):
+            return
+        self.__found = np.pad( self.__found, (0, numExtra) )
+        self.__yields = np.pad( self.__yields, (0, numExtra) )
+        self.__yieldErrors = np.pad( self.__yieldErrors, (0, numExtra) )
+        self.__energies = np.pad( self.__energies, (0, numExtra) )
+        self.__energyErrors = np.pad( self.__energyErrors, (0, numExtra) )
+
+        return
+
+    def add(self, theYields, theEnergies, weight):
+        """Adds the yield and kinetic energy scatter objects of a run"""
+        xValues = theYields.getXValues()
+        if ( xValues is None ):
+            return
+        theIndices = np.rint( xValues ).astype(int)
+        self.__grow( theIndices.max() + 1 )
+
+        yieldValues = theYields.getYValues()
+        yieldErrors = theYields.getYError()
+        if ( yieldErrors is None ):
+            yieldErrors = np.zeros( len(yieldValues) )
+        energyValues = theEnergies.getYValues()
+        energyErrors = theEnergies.getYError()
+        if ( energyErrors is None ):
+            energyErrors = np.zeros( len(energyValues) )
+
+        # (Entries are unique within a table)
+        self.__found[ theIndices ] = True
+        self.__yields[ theIndices ] += weight * yieldValues
+        self.__yieldErrors[ theIndices ] += np.square( weight * yieldErrors )
+        self.__energies[ theIndices ] += weight * yieldValues * energyValues
+        self.__energyErrors[ theIndices ] += np.square( weight * yieldValues * energyErrors )
+
+        return
+
+    def queryResult(self, totalWeight):
+        """Returns the mass (or charge) numbers, yields, yield errors, kinetic energies, and kinetic energy errors"""
+        theIndices = np.flatnonzero( self.__found )
+        weightedYields = self.__yields[ theIndices ]
+        theYields = weightedYields / totalWeight
+        yieldErrors = np.sqrt( self.__yieldErrors[ theIndices ] ) / totalWeight
+        theEnergies = np.divide( self.__energies[ theIndices ], weightedYields, out=np.zeros(len(theIndices)), where=(weightedYields > 0) )
+        energyErrors = np.divide( np.sqrt(self.__energyErrors[ theIndices ]), weightedYields, out=np.zeros(len(theIndices)), where=(weightedYields > 0) )
+
+        return theIndices, theYields, yieldErrors, theEnergies, energyErrors
+
+
+class OutputMerger:
+    """
+    The \"OutputMerger\" object combines the output files of independent runs,
+    one file at a time (see the module documentation), and writes the merged
+    data as a GSM output file.
+    -numProcessors (1): Number of processes used to parse the PISA tables of
+    \teach output file (see outputClass.GSMOutput).
+    """
+    __slots__ = ("__write", "__numProcessors", "__numOutputs", "__totalWeight",
+    "__pisaData", "__pisaAngles", "__spectra", "__ejectiles", "__channelYields",
+    "__channelResiduals", "__nuclideFound", "__nuclideYields", "__nuclideErrors",
+    "__massYields", "__chargeYields")
+
+    def __init__(self, newPrint = Print(), numProcessors = 1 ):
+        """Constructor for the merger"""
+        self.__write = newPrint
+        self.__numProcessors = numProcessors
+
+        self.__numOutputs = 0
+        self.__totalWeight = 0.00
+        # (PISA histograms, keyed by particle and angle key; and the angle of each key)
+        self.__pisaData = {}
+        self.__pisaAngles = {}
+        # (Energy spectra, keyed by particle and origin)
+        self.__spectra = {}
+        # (Yields)
+        self.__ejectiles = None
+        self.__channelYields = {}
+        self.__channelResiduals = {}
+        self.__nuclideFound = np.zeros( (_maxCharge+1, _maxMass+1), dtype=bool )
+        self.__nuclideYields = np.zeros( (_maxCharge+1, _maxMass+1) )
+        self.__nuclideErrors = np.zeros( (_maxCharge+1, _maxMass+1) )
+        self.__massYields = _YieldAccumulator( _maxMass+1 )
+        self.__chargeYields = _YieldAccumulator( _maxCharge+1 )
+
+        return
+
+    # For adding outputs:
+    def addOutput(self, fileName, weight = 1.00):
+        """
+        Parses an output file and adds its data (weighted, e.g. by the run's
+        number of events) to the merged data. Returns True if the file was added.
+        """
+        if ( not fileExists(fileName) ):
+            self.__write.message = "The output file \"%s\" does not exist and will not be merged." % (fileName)
+            self.__write.print(1, 2)
+            return False
+        try:
+            weight = float(weight)
+        except:
+            weight = -1.00
+        if ( weight <= 0 ):
+            self.__write.message = "Invalid weight (%s) given for the output file \"%s\". The file will not be merged." % (str(weight), fileName)
+            self.__write.print(1, 2)
+            return False
+
+        self.__write.message = "Merging output file \"%s\" (weight %.4e)..." % (fileName, weight)
+        self.__write.print(2, 2)
+
+        theOutput = GSMOutput( fileName, self.__write, numProcessors = self.__numProcessors, leanMemory = True )
+        self.__addPISA( theOutput, weight )
+        self.__addSpectra( theOutput, weight )
+        self.__addYields( theOutput, weight )
+        del theOutput
+
+        self.__numOutputs += 1
+        self.__totalWeight += weight
+
+        return True
+
+    def __addPISA(self, theOutput, weight):
+        """Adds the PISA histograms of an output"""
+        pisaData = theOutput.getPISAData()
+        for particleIndx in range(0, pisaData.getNumParticles(), 1):
+            theParticle = pisaData.getParticle( particleIndx )
+            particleName = theParticle.getParticleName()
+            for theHistogram in theParticle.getHistograms():
+                theAngle = theHistogram.getAngle()
+                theKey = ( particleName, gsmData.angleToKey(theAngle) )
+                if ( not theKey in self.__pisaData ):
+                    self.__pisaData[ theKey ] = _HistogramAccumulator( theHistogram.getBinValues() )
+                    self.__pisaAngles[ theKey ] = theAngle
+                self.__pisaData[ theKey ].add( theHistogram.getBinValues(), theHistogram.getDataPoints(), None, weight )
+
+        return
+
+    def __addSpectra(self, theOutput, weight):
+        """Adds the energy spectra (and their errors) of an output"""
+        for particleID in theOutput.queryParticleIDs():
+            theSpectra = theOutput.getParticleEnergySpectra( particleID )
+            if ( theSpectra is None ):
+                continue
+            for theOrigin in gsmData.spectrumOrigins( particleID ):
+                if ( not theSpectra.histExists(theOrigin) ):
+                    continue
+                errorHistogram = None
+                if ( theSpectra.histExists(histAlgebra.errorNotePrefix + theOrigin) ):
+                    errorHistogram = theSpectra.queryHistogram( histAlgebra.errorNotePrefix + theOrigin )
+                theBins, theValues, theErrors = histAlgebra.histogramData( theSpectra.queryHistogram(theOrigin), errorHistogram )
+
+                theKey = ( particleID, theOrigin )
+                if ( not theKey in self.__spectra ):
+                    self.__spectra[ theKey ] = _HistogramAccumulator( theBins )
+                self.__spectra[ theKey ].add( theBins, theValues, theErrors, weight )
+
+        return
+
+    def __addYields(self, theOutput, weight):
+        """Adds the channel, nuclide, mass, and charge yields of an output"""
+        yieldData = theOutput.queryYieldData()
+        if ( yieldData is None ):
+            return
+
+        # Channel yields:
+        channelYields = yieldData.queryChannelYields()
+        if ( channelYields is not None ):
+            self.__addChannelYields( channelYields, weight )
+
+        # Nuclide yields:
+        nuclideYields = yieldData.queryNuclideYields()
+        if ( nuclideYields is not None and nuclideYields.queryNumNuclides() > 0 ):
+            zVals = nuclideYields.queryZ()
+            aVals = nuclideYields.queryA()
+            self.__growNuclides( zVals.max()+1, aVals.max()+1 )
+            np.add.at( self.__nuclideYields, (zVals, aVals), weight * nuclideYields.queryYields() )
+            np.add.at( self.__nuclideErrors, (zVals, aVals), np.square(weight * nuclideYields.queryErrors()) )
+            self.__nuclideFound[ zVals, aVals ] = True
+
+        # Mass and charge yields:
+        massYields = yieldData.queryMassYields()
+        if ( massYields is not None ):
+            self.__massYields.add( massYields, yieldData.queryMassKEDist(), weight )
+        chargeYields = yieldData.queryChargeYields()
+        if ( chargeYields is not None ):
+            self.__chargeYields.add( chargeYields, yieldData.queryChargeKEDist(), weight )
+
+        return
+
+    def __addChannelYields(self, channelYields, weight):
+        """Adds the channel yields of an output (channels are keyed by their ejectile counts)"""
+        theEjectiles = channelYields.queryEjectiles()
+        if ( self.__ejectiles is None ):
+            self.__ejectiles = theEjectiles
+        elif ( not theEjectiles == self.__ejectiles ):
+            self.__write.message = "The ejectiles of the channel yields (%s) differ from those of previous outputs (%s). The channel yields will not be merged." % (" ".join(theEjectiles), " ".join(self.__ejectiles))
+            self.__write.print(1, 2)
+            return
+
+        theCounts = channelYields.queryCounts()
+        theResiduals = channelYields.queryResiduals()
+        theYields = channelYields.queryYields()
+        for channelIndx in range(0, channelYields.queryNumChannels(), 1):
+            theKey = tuple( theCounts[channelIndx].tolist() )
+            self.__channelYields[ theKey ] = self.__channelYields.get( theKey, 0.00 ) + weight * theYields[ channelIndx ]
+            self.__channelResiduals.setdefault( theKey, theResiduals[ channelIndx ] )
+
+        return
+
+    def __growNuclides(self, numCharges, numMasses):
+        """Grows the nuclide arrays to (at least) the given number of charge and mass numbers"""
+        extraCharges = max( numCharges - self.__nuclideFound.shape[0], 0 )
+        extraMasses = max( numMasses - self.__nuclideFound.shape[1], 0 )
+        if ( extraCharges == 0 and extraMasses == 0 ):
+            return
+        padWidth = ( (0, extraCharges), (0, extraMasses) )
+        self.__nuclideFound = np.pad( self.__nuclideFound, padWidth )
+        self.__nuclideYields = np.pad( self.__nuclideYields, padWidth )
+        self.__nuclideErrors = np.pad( self.__nuclideErrors, padWidth )
+
+        return
+
+    # For querying the merger:
+    def queryNumOutputs(self):
+        """Returns the number of output files merged"""
+        return self.__numOutputs
+
+    def queryTotalWeight(self):
+        """Returns the total weight (e.g. number of events) of the merged output files"""
+        return self.__totalWeight
+
+    # For writing the merged output:
+    def writeOutput(self, fileName):
+        """Writes the merged data to a file (in the format of a GSM output file)"""
+        if ( self.__numOutputs == 0 ):
+            self.__write.message = "No output files were merged. The merged output \"%s\" will not be written." % (fileName)
+            self.__write.print(1, 2)
+            return False
+
+        self.__write.message = "Writing the merged output (%d output files) to \"%s\"..." % (self.__numOutputs, fileName)
+        self.__write.print(2, 2)
+
+        outLines = [" Merged output of %d runs (total weight %.6e)" % (self.__numOutputs, self.__totalWeight), ""]
+        outLines.extend( self.__spectraLines() )
+        outLines.extend( self.__yieldLines() )
+        outLines.extend( self.__doubleDiffLines() )
+        outLines.extend( self.__energyIntLines() )
+        outLines.append( " End of merged output" )
+
+        with open(fileName, "w") as outFile:
+            outFile.write( "\n".join(outLines) + "\n" )
+
+        return True
+
+    def __spectraLines(self):
+        """Returns the lines of the particle data (energy spectra) sections"""
+        outLines = []
+        theParticles = []
+        for (particleID, theOrigin) in self.__spectra.keys():
+            if ( not particleID in theParticles ):
+                theParticles.append( particleID )
+
+        for particleID in theParticles:
+            # (The columns of each particle's table are fixed; see gsmDataClasses.spectrumOrigins)
+            theOrigins = gsmData.spectrumOrigins( particleID )
+            theAccumulators = []
+            for theOrigin in theOrigins:
+                theAccumulator = self.__spectra.get( (particleID, theOrigin), None )
+                if ( theAccumulator is None ):
+                    theAccumulator = _HistogramAccumulator( [0.00, 0.00] )
+                theAccumulators.append( theAccumulator )
+            theBins, theValues, theErrors = _commonTable( theAccumulators, self.__totalWeight )
+            theWidths = np.diff( theBins )
+
+            outLines.append( " %s  %s  %s" % (_starLine, particleID, _starLine) )
+            outLines.append( "" )
+            outLines.append( "   Energy spectrum [mb/MeV]" )
+            outLines.append( "   " + 24*"-" )
+            outLines.append( ("   T(MeV)      " + "  ".join("%-28s" % (theOrigin.capitalize()) for theOrigin in theOrigins)).rstrip() )
+            outLines.append( "   " + 13*"-" + len(theOrigins)*(2*" " + 28*"-") )
+            for binIndx in range(0, len(theWidths), 1):
+                binValues = "  ".join( "%s +/- %s" % (_formatValue(theValues[binIndx, j]), _formatValue(theErrors[binIndx, j])) for j in range(0, len(theOrigins), 1) )
+                outLines.append( "  %s  %s" % (_formatBins(theBins[binIndx], theBins[binIndx+1]), binValues) )
+            outLines.append( "" )
+            outLines.append( "   Integrated:  " + "  ".join(_formatValue(theValue) for theValue in theWidths @ theValues) )
+            outLines.append( "" )
+            outLines.append( "" )
+
+        return outLines
+
+    def __yieldLines(self):
+        """Returns the lines of the yield section"""
+        outLines = []
+
+        # Channel yields:
+        if ( len(self.__channelYields) > 0 ):
+            outLines.append( " Yields of different channels (with > 1 mb):" )
+            outLines.append( "  " + "  ".join("%4s" % (theEjectile) for theEjectile in self.__ejectiles) + "      Residual      Yield(mb)" )
+            for theKey, theYield in self.__channelYields.items():
+                theCounts = "  ".join( "%4d" % (theCount) for theCount in theKey )
+                outLines.append( "  %s   %12s   %s" % (theCounts, self.__channelResiduals[ theKey ], _formatValue(theYield / self.__totalWeight)) )
+
+        # Nuclide yields:
+        zVals, aVals = np.nonzero( self.__nuclideFound )
+        if ( len(zVals) > 0 ):
+            theYields = self.__nuclideYields[ zVals, aVals ] / self.__totalWeight
+            theErrors = np.sqrt( self.__nuclideErrors[ zVals, aVals ] ) / self.__totalWeight
+            outLines.append( " *************** Nuclide yields [mb]  (zero values suppressed) *****************" )
+            for nuclideIndx in range(0, len(zVals), 1):
+                outLines.append( "  Z = %3d  A = %3d   %s +/- %s" % (zVals[nuclideIndx], aVals[nuclideIndx], _formatValue(theYields[nuclideIndx]), _formatValue(theErrors[nuclideIndx])) )
+
+        # Mass and charge yields:
+        outLines.extend( self.__yieldTableLines(self.__massYields, "A", " Mass yield [mb] and the mean and variance of the kinetic energy [MeV]") )
+        outLines.extend( self.__yieldTableLines(self.__chargeYields, "Z", " Charge yield [mb] and the mean and variance of the  kinetic energy [MeV]") )
+
+        if ( len(outLines) > 0 ):
+            outLines.append( " " + 80*"*" )
+            outLines.append( "" )
+
+        return outLines
+
+    def __yieldTableLines(self, theAccumulator, theFlag, theHeader):
+        """Returns the lines of a mass (or charge) yield table"""
+        theIndices, theYields, yieldErrors, theEnergies, energyErrors = theAccumulator.queryResult( self.__totalWeight )
+        if ( len(theIndices) == 0 ):
+            return []
+
+        outLines = [theHeader]
+        outLines.append( "    %s      Yield           dYield          KE              dKE" % (theFlag) )
+        for entryIndx in range(0, len(theIndices), 1):
+            outLines.append( " %s = %3d  %s +/- %s   %s +/- %s" % (theFlag, theIndices[entryIndx], _formatValue(theYields[entryIndx]), _formatValue(yieldErrors[entryIndx]), _formatValue(theEnergies[entryIndx]), _formatValue(energyErrors[entryIndx])) )
+        outLines.append( "" )
+        outLines.append( " Sum    %s" % (_formatValue(theYields.sum())) )
+
+        return outLines
+
+    def __doubleDiffLines(self):
+        """Returns the lines of the PISA double differential tables (one per particle)"""
+        outLines = []
+        angleIntKey = gsmData.angleIntKey
+        theParticles = []
+        for (particleName, angleKey) in self.__pisaData.keys():
+            if ( angleKey < angleIntKey and not particleName in theParticles ):
+                theParticles.append( particleName )
+
+        for particleName in theParticles:
+            # (Columns are ordered by angle; the last column is angle integrated)
+            angleKeys = sorted( angleKey for (theName, angleKey) in self.__pisaData.keys() if (theName == particleName and angleKey < angleIntKey) )
+            theAccumulators = [ self.__pisaData[ (particleName, angleKey) ] for angleKey in angleKeys ]
+            theAccumulators.append( self.__pisaData.get( (particleName, angleIntKey), _HistogramAccumulator([0.00, 0.00]) ) )
+            theBins, theValues, theErrors = _commonTable( theAccumulators, self.__totalWeight )
+
+            outLines.append( " Double differential cross-section d2S/dTdO (mb/MeV/sr) of %s" % (particleName) )
+            outLines.append( "" )
+            outLines.append( " T(MeV)/angle:  " + "  ".join("%12.2f" % (self.__pisaAngles[ (particleName, angleKey) ]) for angleKey in angleKeys) + "      ang.int." )
+            for binIndx in range(0, len(theBins)-1, 1):
+                outLines.append( "  %s  %s" % (_formatBins(theBins[binIndx], theBins[binIndx+1]), "  ".join(_formatValue(theValue) for theValue in theValues[binIndx])) )
+            outLines.append( " Energ. int.  " + "  ".join(_formatValue(theValue) for theValue in np.diff(theBins) @ theValues) )
+            outLines.append( "" )
+
+        return outLines
+
+    def __energyIntLines(self):
+        """Returns the lines of the PISA energy integrated table"""
+        energyIntKey = gsmData.energyIntKey
+        theParticles = [ particleName for (particleName, angleKey) in self.__pisaData.keys() if (angleKey == energyIntKey) ]
+        if ( len(theParticles) == 0 ):
+            return []
+
+        theAccumulators = [ self.__pisaData[ (particleName, energyIntKey) ] for particleName in theParticles ]
+        theBins, theValues, theErrors = _commonTable( theAccumulators, self.__totalWeight )
+        # (Integrate over the solid angle of each angle bin)
+        solidAngles = 2 * np.pi * -np.diff( np.cos(np.radians(theBins)) )
+
+        outLines = [" Angular distribution of produced fragments dS/dOm [mb/sr] for energy range(MeV)", ""]
+        outLines.append( " theta                    " + "  ".join("%12s" % (particleName) for particleName in theParticles) )
+        for binIndx in range(0, len(theBins)-1, 1):
+            outLines.append( "  %s  %s" % (_formatBins(theBins[binIndx], theBins[binIndx+1]), "  ".join(_formatValue(theValue) for theValue in theValues[binIndx])) )
+        outLines.append( " Int. x sec  " + "  ".join(_formatValue(theValue) for theValue in solidAngles @ theValues) )
+        outLines.append( "" )
+
+        return outLines
+
+
+def mergeOutputs(fileNames, mergedName, weights = None, newPrint = Print(), numProcessors = 1 ):
+    """
+    Merges the output files of independent runs (weighted, e.g. by each run's
+    number of events; equal weights by default) and writes the merged output.
+    Returns True if the merged output was written.
+    """
+    if ( weights is None ):
+        weights = len(fileNames)*[1.00]
+    elif ( not len(weights) == len(fileNames) ):
+        newPrint.message = "The number of weights (%d) does not match the number of output files (%d). The outputs will not be merged." % (len(weights), len(fileNames))
+        newPrint.print(0, 1)
+        return False
+
+    theMerger = OutputMerger( newPrint, numProcessors )
+    for fileIndx in range(0, len(fileNames), 1):
+        theMerger.addOutput( fileNames[fileIndx], weights[fileIndx] )
+
+    return theMerger.writeOutput( mergedName )
@@ -14,11 +14,16 @@ Each output type has separate sub-classes for each data type, each with a print
 ################################################################################
 # IMPORTS:
 import sys
+import multiprocessing
+import numpy as np
 
 # MODULES:
 from printClass import Print
-from fileModule import readFile, parseLine, fileExists
+from fileModule import readFile, iterateFile, parseLine, parseBinnedTable, conversionMessage, textSize, fileExists, mapFile, compressionType
+from fileModule import outputMarkers, yieldMarkers, particleMarkers
 import gsmDataClasses as gsmData
+import cacheModule
+import exportModule
 
 # VERSION Number:
 __version__ = "1.0.0"
@@ -30,18 +35,289 @@ particleTypes = ("n", "p", "d", "t", "he3", "he4", "he6", "li6", "li7", "li8",
 "li9", "be7", "be9", "be10", "b9", "b10", "b11", "b12", "c11", "c12", "c13",
 "c14", "z=7", "z=8", "z=9", "z=10", "z=11", "z=12", "z=13", "z=14")
 numParticleTypes = len( particleTypes )
+# (Angles used to flag the angle and energy integrated PISA histograms)
+pisaAngleIntFlag = gsmData.angleIntFlag
+pisaEnergyIntFlag = gsmData.energyIntFlag
+
+
+class _Section:
+    """Stores the location (and lines) of a single data section in an output file"""
+
+    def __init__(self, kind, key, start, dataStart):
+        """Constructor for the section"""
+        self.kind = kind
+        self.key = key
+        self.start = start          # Line of the section's header
+        self.dataStart = dataStart  # First line belonging to the section's data
+        self.end = None             # Line after the last line of the section
+        self.startByte = None       # Byte offsets of the lines above (when known)
+        self.dataStartByte = None
+        self.endByte = None
+        self.lines = []
+        self.numBlanks = 0
+        self.parsed = False
 
+        return
 
-class GSMOutput:
-    """GSM Output Class"""
-    __pisaAngleIntFlag = 361
-    __pisaEnergyIntFlag = 362
 
-    def __init__(self, fileName = None, newPrint = Print() ):
+class _SectionScanner:
+    """
+    The \"_SectionScanner\" object walks the lines of an output file a single
+    time. Each line is checked once against the markers of every data section
+    (particle data, yields, and the PISA tables; see fileModule.outputMarkers)
+    and fed to all sections that are currently open. Once the end of a
+    section is found the section, with
+    all of its lines, is returned to the client for parsing.
+    -retainLines (True): Stores the lines of each section. When False, only
+    \tthe boundaries of each section are recorded.
+    The byte offset of each line may be given to the scanner as well, in which
+    case the byte offsets of each section's boundaries are also recorded.
+    \tNOTE: Lines given to the scanner must already be stripped. Lines are not
+    \t      converted to lower case (markers are matched regardless of case).
+    """
+    # Section types:
+    particleKind = "particle"
+    yieldKind = "yield"
+    doubleDiffKind = "double differential"
+    energyIntKind = "energy integrated"
+    __tableStartOffset = 3   # Data in PISA tables begins 3 lines after the header
+
+    def __init__(self, newPrint = Print(), retainLines = True ):
+        """Constructor for the scanner"""
+        self.__write = newPrint
+        self.__retainLines = retainLines
+        self.__numLines = 0
+        self.__openSections = []
+        self.__foundYields = False
+        self.__markerStarts = outputMarkers.queryStartChars()
+
+        return
+
+    def __newSection(self, marker, remainder, dataLine, lineIndx):
+        """Returns a new section if the line's marker is a section header"""
+        if ( marker == "stars" ):
+            # Particle data (data begins on the next line):
+            theParticle = particleMarkers.find( dataLine )
+            if ( theParticle is None ):
+                return None
+            return _Section(self.particleKind, theParticle, lineIndx, lineIndx+1)
+
+        elif ( marker in yieldMarkers ):
+            # Only the first yield section is used:
+            if ( self.__foundYields ):
+                return None
+            self.__foundYields = True
+            return _Section(self.yieldKind, None, lineIndx, lineIndx)
+
+        elif ( marker == "doubleDiff" ):
+            return _Section(self.doubleDiffKind, remainder.lower(), lineIndx, lineIndx)
+
+        elif ( marker == "energyInt" ):
+            return _Section(self.energyIntKind, None, lineIndx, lineIndx)
+
+        return None
+
+    def __sectionEnds(self, section, dataLine, marker, lineIndx):
+        """Determines if the line (with the given marker) ends the given (open) section"""
+        if ( section.kind == self.particleKind ):
+            # Particle data ends at the next flag or after two consecutive blank lines
+            if ( dataLine == "" ):
+                section.numBlanks += 1
+            else:
+                section.numBlanks = 0
+            return ( marker == "stars" or (section.numBlanks > 1) )
+
+        elif ( section.kind == self.yieldKind ):
+            return ( marker == "stars" )
+
+        elif ( section.kind == self.doubleDiffKind ):
+            if ( lineIndx - section.start < self.__tableStartOffset ):
+                return False
+            return ( dataLine == "" or marker == "doubleDiffEnd" )
+
+        elif ( section.kind == self.energyIntKind ):
+            if ( lineIndx - section.start < self.__tableStartOffset ):
+                return False
+            return ( marker == "energyIntEnd" )
+
+        return True
+
+    def addLine(self, dataLine, lineOffset = None):
+        """Feeds a single line (starting at byte 'lineOffset') to the scanner; returns all sections closed by the line"""
+        lineIndx = self.__numLines
+        self.__numLines += 1
+        marker = None
+        if ( dataLine[:1] in self.__markerStarts ):
+            marker, remainder = outputMarkers.match( dataLine )
+
+        # Feed the line to (or close) each open section:
+        closedSections = []
+        stillOpen = []
+        for section in self.__openSections:
+            if ( section.dataStart == lineIndx ):
+                section.dataStartByte = lineOffset
+            if ( self.__sectionEnds(section, dataLine, marker, lineIndx) ):
+                section.end = lineIndx
+                section.endByte = lineOffset
+                if ( section.dataStartByte is None ):
+                    section.dataStartByte = lineOffset
+                closedSections.append( section )
+            else:
+                if ( self.__retainLines ):
+                    section.lines.append( dataLine )
+                stillOpen.append( section )
+        self.__openSections = stillOpen
+
+        # Check for the start of a new section (a closing line may also start a section):
+        if ( marker is not None ):
+            newSection = self.__newSection(marker, remainder, dataLine, lineIndx)
+            if ( newSection is not None ):
+                newSection.startByte = lineOffset
+                if ( newSection.dataStart == lineIndx ):
+                    newSection.dataStartByte = lineOffset
+                    if ( self.__retainLines ):
+                        newSection.lines.append( dataLine )
+                self.__openSections.append( newSection )
+
+        return closedSections
+
+    def finish(self, endOffset = None):
+        """Closes (and returns) all sections still open at the end of the file (of 'endOffset' bytes)"""
+        closedSections = self.__openSections
+        for section in closedSections:
+            section.end = self.__numLines
+            section.endByte = endOffset
+            if ( section.dataStartByte is None ):
+                section.dataStartByte = endOffset
+        self.__openSections = []
+
+        return closedSections
+
+    def queryNumLines(self):
+        """Returns the number of lines scanned"""
+        return self.__numLines
+
+
+def _readBinnedTable(tableRows, numSets, tableName, newPrint = Print() ):
+    """
+    Converts the rows of a PISA table (\"lower-upper value value ...\") in bulk
+    to bin bounds and a 2-D array of bin values (one column per data set).
+    """
+    theBins, theValues, badValues = parseBinnedTable( tableRows, numSets )
+    if ( len(badValues) > 0 ):
+        newPrint.message = conversionMessage( badValues, tableName + " table" )
+        newPrint.print(1, 2)
+
+    return theBins, theValues
+
+def _readDoubleDiff(thisParticleType, tableData, newPrint = Print() ):
+    """
+    Reads the histograms (double differential and angle integrated) of a PISA
+    double differential table. Returns the particle and its histograms (the
+    particle is None if the table can't be read).
+    """
+    __tableStart = 3   # Table rows start 3 lines after the header
+
+    # Print message:
+    newPrint.message = "\t\tObtaining PISA double differential data..."
+    newPrint.print(2, 3)
+
+    # Search through particle types:
+    particleIndx = None
+    for j in range(0, numParticleTypes, 1):
+        if ( thisParticleType == particleTypes[j] ):
+            particleIndx = j
+            break
+    if ( particleIndx is None ):
+        newPrint.message = "Unrecognized particle (%s) found for PISA double differential data." % (thisParticleType)
+        newPrint.print(1, 2)
+        return None, []
+    particleID = particleTypes[ particleIndx ]
+
+    # Obtain angles now (the last column is angle integrated):
+    newLine = tableData[ __tableStart-1 ]
+    newLine = newLine[ len("T(MeV)/angle:") : ].strip()
+    myParticleAngles = parseLine( newLine )
+    for j in range(0, len(myParticleAngles)-1, 1):
+        myParticleAngles[j] = float(myParticleAngles[j])
+    myParticleAngles[-1] = pisaAngleIntFlag
+    myParticleTypes = (len(myParticleAngles)-1)*["Double Differential"]
+    myParticleTypes.append( "Angle Integrated" )
+    numSets = len(myParticleTypes)
+
+    # Now obtain bin bounds and data:
+    tableRows = tableData[ __tableStart : ]
+    if ( len(tableRows) == 0 ):
+        newPrint.message = "No PISA double differential data exists for particle \"%s\"." % (particleID)
+        newPrint.print(1, 2)
+        return None, []
+    myBins, myValues = _readBinnedTable( tableRows, numSets, "PISA double differential", newPrint )
+
+    # Create histogram data (all histograms share the table's bins):
+    theHistograms = []
+    for j in range(0, numSets, 1):
+        theHistograms.append( gsmData.Histogram(myParticleTypes[j], myParticleAngles[j], myBins, myValues[:, j], newPrint) )
+
+    return particleID, theHistograms
+
+def _parseDoubleDiffSection(sectionArgs):
+    """
+    Parses a PISA double differential table, given as (particle, lines, verbosity
+    limit), in a worker process; returns the packed particle and histograms
+    """
+    thisParticleType, tableData, verboseLimit = sectionArgs
+    return cacheModule.packData( _readDoubleDiff(thisParticleType, tableData, Print(verboseLimit)) )
+
+
+class GSMOutput:
+    """
+    GSM Output Class
+
+    The output object has some options that can be used:
+    -lazyParse (False): Only locates the sections of the output file during
+    \tconstruction. Each section is then parsed the first time its data is
+    \trequested (and remembered thereafter).
+    -cacheDir (None): Directory in which parsed data is cached. When a valid
+    \tcache entry exists for the file no text parsing is done; otherwise the
+    \tfile is fully parsed and the parsed data is stored in the cache.
+    -memoryMap (False): Memory-maps the file instead of reading it into memory.
+    \tThe byte offsets of every section are recorded while scanning and only
+    \tthe bytes of a section are read when the section is parsed.
+    -follow (False): Follows a file that is still being written. Only complete
+    \tsections are parsed; the scanner's state is kept so that each call to
+    \t\"update\" scans only the bytes appended since the last call. Neither
+    \tcaching, memory-mapping, nor lazy parsing is used when following a file.
+    -numProcessors (1): Number of processes used to parse the PISA double
+    \tdifferential tables. When larger than 1 the tables are collected while
+    \tscanning the file and parsed in a worker pool; their histograms are then
+    \tmerged in file order (as if the file were parsed serially). Not used when
+    \tparsing lazily or following a file.
+    -leanMemory (False): Discards all raw text of the file (the file's lines,
+    \tits mapping, and the lines kept by each data object) once the file is
+    \tparsed, keeping only the parsed data. All sections are parsed during
+    \tconstruction (lazy parsing is not used). The memory released is reported.
+    The parsed data may be exported to a columnar directory of arrays (see
+    exportModule and "exportData"). When the file name given is such an export,
+    the exported arrays are memory-mapped and no parsing is done.
+    Compressed (gzip, xz, bzip2) output files are read directly. These files are
+    always decompressed as they are parsed, so neither memory-mapping nor lazy
+    parsing (nor following) is used for them.
+    """
+    __pisaAngleIntFlag = pisaAngleIntFlag
+    __pisaEnergyIntFlag = pisaEnergyIntFlag
+
+    def __init__(self, fileName = None, newPrint = Print(), lazyParse = False, cacheDir = None, memoryMap = False, follow = False, numProcessors = 1, leanMemory = False ):
         """Constructor for the GSM Output class"""
 
         # Reset all values:
         self.__write = newPrint
+        self.__lazyParse = lazyParse
+        self.__cacheDir = cacheDir
+        self.__memoryMap = memoryMap
+        self.__follow = follow
+        self.__numProcessors = max( 1, numProcessors )
+        self.__leanMemory = leanMemory
+        self.__mappedData = None
 
         # Set values from constructor:
         if ( fileName == None ):
@@ -52,20 +328,66 @@ class GSMOutput:
         self.__resetMembers()
 
         self.__fileName = fileName
+
+        # Exported data is loaded without any parsing:
+        if ( exportModule.isExport(self.__fileName) ):
+            self.__loadExport()
+            return
+
         doesFileExist = fileExists( self.__fileName )
         if ( not doesFileExist ):
             self.__write.message = "File \"%s\" does not exist in this directory. Cannot obtain data." % ( self.__fileName )
             self.__write.print(1, 2)
             return
 
-        # Read file:
-        self.__fileData = readFile( self.__fileName )
-        self.__fileLen  = len( self.__fileData )
+        # Stream compressed files through the parser (instead of expanding them in memory):
+        theCompression = compressionType( self.__fileName )
+        if ( theCompression is not None and (self.__lazyParse or self.__memoryMap or self.__follow) ):
+            self.__write.message = "File \"%s\" is %s compressed; all sections will be parsed while decompressing." % (self.__fileName, theCompression)
+            self.__write.print(2, 3)
+            self.__lazyParse = False
+            self.__memoryMap = False
+            self.__follow = False
+
+        # Every section is parsed before discarding the file's text:
+        if ( self.__leanMemory ):
+            self.__lazyParse = False
+
+        # Parse the complete sections of a file that is still being written:
+        if ( self.__follow ):
+            self.__lazyParse = False
+            self.__memoryMap = False
+            self.__cacheDir = None
+            self.__fileRead = True
+            self.__scanner = _SectionScanner( self.__write )
+            self.update()
+            return
+
+        # Use previously parsed data when possible:
+        if ( self.__cacheDir is not None ):
+            if ( self.__loadCache() ):
+                return
+
+        # Read (or map) file (only lazily parsed files keep every line; otherwise
+        # the lines are streamed from the file while parsing):
+        if ( self.__memoryMap ):
+            self.__mappedData = mapFile( self.__fileName )
+        elif ( self.__lazyParse ):
+            self.__fileData = readFile( self.__fileName )
+            self.__fileLen  = len( self.__fileData )
         self.__fileRead = True
 
         # Parse file data:
         self.__parseData()
 
+        # Store parsed data for next time:
+        if ( self.__cacheDir is not None ):
+            self.__saveCache()
+
+        # Keep only the parsed data:
+        if ( self.__leanMemory ):
+            self.releaseRawData()
+
         return
 
     def __resetMembers(self):
@@ -81,12 +403,31 @@ class GSMOutput:
         self.__numParticleData = 0
         # Yield data:
         self.__yieldData = gsmData.ParticleYields( self.__write )
+        # Sections found in the file (by section type):
+        self.__sections = {
+            _SectionScanner.particleKind: [],
+            _SectionScanner.yieldKind: [],
+            _SectionScanner.doubleDiffKind: [],
+            _SectionScanner.energyIntKind: []
+        }
+        # Sections requested by the client, as (kind, key):
+        self.__accessedSections = set()
+        # PISA sections waiting to be parsed in a worker pool:
+        self.__pendingSections = []
+        # Scanner state of a followed file:
+        self.__scanner = None
+        self.__readOffset = 0
+        # Raw text discarded after parsing (in bytes):
+        self.__releasedBytes = 0
 
         # Read file:
         self.__fileName = ""
         self.__fileData = []
         self.__fileLen  = 0
         self.__fileRead = False
+        if ( self.__mappedData is not None ):
+            self.__mappedData.close()
+        self.__mappedData = None
 
         return
 
@@ -96,6 +437,61 @@ class GSMOutput:
 
         return
 
+    def __getstate__(self):
+        """Returns the state of the object for pickling (all sections are parsed; file data is not stored)"""
+        for kind in self.__sections:
+            self.__loadSections( kind )
+
+        theState = self.__dict__.copy()
+        theState["_GSMOutput__fileData"] = []
+        theState["_GSMOutput__fileLen"] = 0
+        theState["_GSMOutput__mappedData"] = None
+        theState["_GSMOutput__follow"] = False
+        theState["_GSMOutput__scanner"] = None
+        theState["_GSMOutput__pendingSections"] = []
+        return theState
+
+    def __loadCache(self):
+        """Obtains the parsed data from the cache; returns if the cache was used"""
+        cachedData = cacheModule.loadCachedData( self.__cacheDir, self.__fileName, self.__write )
+        if ( cachedData is None ):
+            return False
+
+        self.__pisaData = cachedData["pisa"]
+        self.__particleData = cachedData["particleData"]
+        self.__numParticleData = len( self.__particleData )
+        self.__yieldData = cachedData["yields"]
+
+        return True
+
+    def __loadExport(self):
+        """Obtains the parsed data from an export; returns if the export was used"""
+        exportedData = exportModule.loadExportedData( self.__fileName, self.__write )
+        if ( exportedData is None ):
+            return False
+
+        self.__pisaData = exportedData["pisa"]
+        self.__particleData = exportedData["particleData"]
+        self.__numParticleData = len( self.__particleData )
+        self.__yieldData = exportedData["yields"]
+
+        return True
+
+    def __saveCache(self):
+        """Stores all parsed data in the cache"""
+        # All sections must be parsed before caching:
+        for kind in self.__sections:
+            self.__loadSections( kind )
+
+        cachedData = {
+            "pisa": self.__pisaData,
+            "particleData": self.__particleData,
+            "yields": self.__yieldData
+        }
+        cacheModule.saveCachedData( self.__cacheDir, self.__fileName, cachedData, self.__write )
+
+        return
+
     def __parseData(self):
         """Interface for parsing out all data from the read file"""
 
@@ -103,77 +499,182 @@ class GSMOutput:
         self.__write.message = "\tParsing data..."
         self.__write.print(2, 3)
 
-        # Reduce file data:
-        for lineIndx in range(0, self.__fileLen, 1):
-            self.__fileData[lineIndx] = self.__fileData[lineIndx].lower().strip()
+        # Walk the file once; each section is parsed as soon as its end is
+        # found (or only located when parsing lazily):
+        scanner = _SectionScanner( self.__write, not self.__lazyParse )
+        if ( self.__memoryMap ):
+            self.__scanMappedData( scanner )
+        elif ( self.__lazyParse ):
+            self.__scanLines( scanner, self.__fileData )
+        else:
+            self.__scanLines( scanner, iterateFile(self.__fileName) )
 
-        self.__parseParticleData()
-        self.__parseYieldData()
-        self.__parseDoubleDiff()
+        # Parse the PISA tables collected while scanning:
+        if ( len(self.__pendingSections) > 0 ):
+            self.__parsePendingSections()
 
         return
 
-    def __parseParticleData(self):
-        """
-        Parses out particle data for each particle in output file
-        """
-        __particleIDs = ("neutrons", "protons", "deuterons", "tritons",
-        "helium-3", "alphas", "neg. pions", "neut pions", "pos. pions")
-        __numParticleIDs = len(__particleIDs)
-        __particleFlags = ("**********************************",
-        "*********************************")
-
-        # Look through data and find the particle flag; then, create object
-        #    containing all the particles data:
-        self.__write.message = "\t\tObtaining particle data..."
-        self.__write.print(2, 3)
-        for lineIndx in range(0, self.__fileLen, 1):
+    def __scanLines(self, scanner, theLines):
+        """Feeds each line (from a list or generator) to the scanner"""
+        for dataLine in theLines:
+            for section in scanner.addLine( dataLine.strip() ):
+                self.__addSection( section )
+        for section in scanner.finish():
+            self.__addSection( section )
+        self.__fileLen = scanner.queryNumLines()
 
-            # Skip all lines that don't start with ***'s
-            if ( not self.__fileData[lineIndx].startswith(__particleFlags[0]) ):
-                continue
+        return
+
+    def __scanMappedData(self, scanner):
+        """Feeds each line of the mapped file (and its byte offset) to the scanner"""
+        lineOffset = 0
+        if ( self.__mappedData is not None ):
+            self.__mappedData.seek( 0 )
+            while ( True ):
+                dataLine = self.__mappedData.readline()
+                if ( not dataLine ):
+                    break
+                for section in scanner.addLine( dataLine.decode('ascii', errors='ignore').strip(), lineOffset ):
+                    self.__addSection( section )
+                lineOffset += len( dataLine )
+
+        for section in scanner.finish( lineOffset ):
+            self.__addSection( section )
+        self.__fileLen = scanner.queryNumLines()
+
+        return
+
+    def __addSection(self, section):
+        """Stores a located section, parsing it now unless parsing lazily (or in a worker pool)"""
+        self.__sections[ section.kind ].append( section )
+        if ( self.__lazyParse ):
+            return
+        if ( self.__numProcessors > 1 and not self.__follow and section.kind in (_SectionScanner.doubleDiffKind, _SectionScanner.energyIntKind) ):
+            self.__pendingSections.append( section )
+        else:
+            self.__parseSection( section )
+
+        return
+
+    def __parsePendingSections(self):
+        """Parses the collected PISA sections, parsing the double differential tables in a worker pool"""
+        pendingSections = self.__pendingSections
+        self.__pendingSections = []
+        doubleDiffSections = []
+        for section in pendingSections:
+            if ( section.kind == _SectionScanner.doubleDiffKind ):
+                doubleDiffSections.append( section )
+        numProcesses = min( self.__numProcessors, len(doubleDiffSections) )
+
+        # Processes used to parse several files can't create processes themselves:
+        if ( numProcesses > 1 and multiprocessing.current_process().daemon ):
+            self.__write.message = "Unable to parse the PISA tables of \"%s\" in parallel from within a worker process. Parsing tables serially..." % (self.__fileName)
+            self.__write.print(1, 2)
+            numProcesses = 1
+
+        packedTables = []
+        if ( numProcesses > 1 ):
+            self.__write.message = "\tParsing %d PISA tables using %d processes..." % (len(doubleDiffSections), numProcesses)
+            self.__write.print(2, 3)
+            sectionArgs = []
+            for section in doubleDiffSections:
+                sectionArgs.append( (section.key, self.__querySectionLines(section), self.__write.queryVerboseLimit()) )
+            with multiprocessing.Pool( processes=numProcesses ) as pool:
+                packedTables = pool.map( _parseDoubleDiffSection, sectionArgs )
+
+        # Merge the tables in file order (attaching this object's Print object):
+        tableIndx = 0
+        for section in pendingSections:
+            if ( len(packedTables) > 0 and section.kind == _SectionScanner.doubleDiffKind ):
+                particleID, theHistograms = cacheModule.unpackData( packedTables[tableIndx], self.__write )
+                tableIndx += 1
+                section.parsed = True
+                section.lines = []
+                self.__storePISAHistograms( particleID, theHistograms )
+            else:
+                self.__parseSection( section )
 
-            # Look for particle flag now and skip lines without the flag:
-            validPart = False
-            theParticle = None
-            for parIndx in range(0, __numParticleIDs, 1):
-                if ( __particleIDs[parIndx] in self.__fileData[lineIndx] ):
-                    validPart = True
-                    theParticle = __particleIDs[parIndx]
-            if ( not validPart ):
+        return
+
+    def __querySectionLines(self, section):
+        """Returns the (reduced) lines of a section"""
+        if ( len(section.lines) > 0 ):
+            return section.lines
+
+        # Decode only the section's bytes when the file is mapped:
+        if ( self.__mappedData is not None ):
+            sectionText = self.__mappedData[ section.dataStartByte : section.endByte ].decode('ascii', errors='ignore')
+            sectionLines = sectionText.split("\n")
+            if ( sectionText.endswith("\n") ):
+                del sectionLines[-1]
+            for lineIndx in range(0, len(sectionLines), 1):
+                sectionLines[lineIndx] = sectionLines[lineIndx].strip()
+            return sectionLines
+
+        sectionLines = []
+        for lineIndx in range(section.dataStart, section.end, 1):
+            sectionLines.append( self.__fileData[lineIndx].strip() )
+        return sectionLines
+
+    def __loadSections(self, kind, key = None):
+        """Parses all not-yet-parsed sections of a type (and key, if given)"""
+        self.__accessedSections.add( (kind, key) )
+        for section in self.__sections[ kind ]:
+            if ( section.parsed ):
+                continue
+            if ( key is not None and not section.key == key ):
                 continue
+            self.__parseSection( section )
 
-            # Found a particle data's next flag; create new data lines and create particle
-            parData = []
-            numConsBlanks = 0
-            findEnd = True
-            while ( True ):
-                lineIndx += 1
-                parLine = self.__fileData[lineIndx].lower().strip()
+        return
+
+    def __loadPISA(self, particleID = None):
+        """Parses the PISA sections needed for a particle (or all particles)"""
+        if ( isinstance(particleID, str) ):
+            particleID = particleID.lower().strip()
+        else:
+            particleID = None
+        self.__loadSections( _SectionScanner.doubleDiffKind, particleID )
+        self.__loadSections( _SectionScanner.energyIntKind )
 
-                # Look for end of particle data:
-                if ( findEnd ):
-                    # Two blanks are present at end of the last particles information:
-                    if ( parLine == "" ):
-                        numConsBlanks += 1
-                    else:
-                        numConsBlanks = 0
+        return
 
-                    if ( parLine.startswith(__particleFlags[0]) or (numConsBlanks > 1) ):
-                        break
+    def __parseSection(self, section):
+        """Sends a section's lines to the appropriate parser"""
+        sectionLines = self.__querySectionLines( section )
+        section.parsed = True
+        section.lines = []
+
+        if ( section.kind == _SectionScanner.particleKind ):
+            self.__parseParticleData( section.key, sectionLines )
+        elif ( section.kind == _SectionScanner.yieldKind ):
+            self.__parseYieldData( sectionLines )
+        elif ( section.kind == _SectionScanner.doubleDiffKind ):
+            self.__parseDoubleDiff( section.key, sectionLines )
+        elif ( section.kind == _SectionScanner.energyIntKind ):
+            self.__parseEnergyIntegrated( sectionLines )
+        else:
+            self.__write.message = "Unrecognized section type (%s) found in the output file." % (section.kind)
+            self.__write.print(1, 2)
 
-                # Add data to the set:
-                parData.append( parLine )
+        return
 
+    def __parseParticleData(self, theParticle, parData):
+        """
+        Parses out particle data for a particle in the output file
+        """
+        self.__write.message = "\t\tObtaining particle data for \"%s\"..." % (theParticle)
+        self.__write.print(2, 3)
 
-            # The data relating to the particle was obtained; create object:
-            self.__particleData.append( gsmData.ParticleData(theParticle, self.__write) )
-            self.__particleData[ self.__numParticleData ].addFileData( parData )
-            self.__numParticleData += 1
+        # The data relating to the particle was obtained; create object:
+        self.__particleData.append( gsmData.ParticleData(theParticle, self.__write) )
+        self.__particleData[ self.__numParticleData ].addFileData( parData )
+        self.__numParticleData += 1
 
         return
 
-    def __parseYieldData(self):
+    def __parseYieldData(self, yieldData):
         """
         Parses out particle yield data:
 
@@ -182,267 +683,233 @@ class GSMOutput:
            Charge yields (mb)
            More can be added easily
         """
-        __yieldFlags = ("yields of different channels (with > 1 mb):",
-        "*************** nuclide yields [mb]  (zero values suppressed) *****************",
-        "mass yield [mb] and the mean and variance of the kinetic energy [mev]",
-        "charge yield [mb] and the mean and variance of the  kinetic energy [mev]")
-        __numYieldFlags = len(__yieldFlags)
-        __yieldEndFlag = "**********************************"
-
         self.__write.message = "\t\tObtaining yield data..."
         self.__write.print(2, 3)
 
-        # Look through file data for the start/end flags:
-        for lineIndx in range(0, self.__fileLen, 1):
-
-            # Skip all lines that don't flag yield data
-            dataFlagged = False
-            for flagIndx in range(0, __numYieldFlags, 1):
-                if ( self.__fileData[lineIndx].startswith(__yieldFlags[flagIndx]) ):
-                    dataFlagged = True
-                    break
-            if ( not dataFlagged ):
-                continue
-
-            # Found the start of the yield section; obtain data:
-            yieldData = []
-            yieldData.append( self.__fileData[lineIndx].lower().strip() )
-            while ( True ):
-                lineIndx += 1
-                if ( lineIndx >= self.__fileLen ):
-                    break
-                dataLine = self.__fileData[lineIndx].lower().strip()
-
-                # Look for end of yield data:
-                if ( dataLine.startswith(__yieldEndFlag) ):
-                    break
-
-                # Add data to the set:
-                yieldData.append( dataLine )
-
-            # The data relating to the particle was obtained; create object:
-            self.__yieldData.addFileData( yieldData )
-            break
+        self.__yieldData.addFileData( yieldData )
 
         return
 
-    def __parseDoubleDiff(self):
+    def __parseDoubleDiff(self, thisParticleType, tableData):
         """
         Parse out double differential cross section data from PISA usage:
 
         Parses out data for:
             Double differential cross sections
             Angle  integrated distributions
-            Energy integrated distributions
         """
-        __dataFlags = ("Double differential cross-section d2S/dTdO (mb/MeV/sr) of".strip().lower(),
-        "Angular distribution of produced fragments dS/dOm [mb/sr] for energy range(MeV)".strip().lower())
-        __dataLen = ( len(__dataFlags[0]), len(__dataFlags[1]) )
+        particleID, theHistograms = _readDoubleDiff( thisParticleType, tableData, self.__write )
+        self.__storePISAHistograms( particleID, theHistograms )
+
+        return
+
+    def __storePISAHistograms(self, particleID, theHistograms):
+        """Adds the histograms of a PISA double differential table to the PISA data"""
+        if ( particleID is None ):
+            return
+
+        # Reached end of data table; no more data (construct particle histograms)
+        self.__write.message = "\t\t\tStoring PISA histogram data for particle \"%s\"..." % (particleID)
+        self.__write.print(2, 5)
+
+        # Append histogram data (sections may be parsed in any order when
+        # parsing lazily, so the histograms are added to any existing particle data):
+        for newHistogram in theHistograms:
+            self.__pisaData.addParticleHistogram( particleID, newHistogram )
+
+        return
+
+    def __parseEnergyIntegrated(self, tableData):
+        """
+        Parse out energy integrated distributions from PISA usage
+        """
+        __tableStart = 3   # Table rows start 3 lines after the header
 
         # Print message:
-        self.__write.message = "\t\tObtaining PISA double differential data..."
+        self.__write.message = "\t\tObtaining PISA energy integrated data..."
         self.__write.print(2, 3)
 
-        # Sections: Double differential and energy integrated are in the same table (angle integrated in separate table)
-        # Search through data for double differential and energy integrated data:
-        for i in range(0, self.__fileLen, 1):
-            dataLine = self.__fileData[i].strip().lower()
-            if ( dataLine.startswith(__dataFlags[0]) ):
-                # Found the flag
-                thisParticleType = dataLine[ __dataLen[0] : ].strip()
-
-                # Search through particle types:
-                for j in range(0, numParticleTypes, 1):
-                    if ( thisParticleType == particleTypes[j] ):
-                        particleIndx = j
-                        break
-
-                # Have the particle ID; obtain bins and associated values:
-                particleID = particleTypes[ particleIndx ]
-                # Skip a line:
-                i += 2
-                # Obtain angles now (parse line)
-                newLine = self.__fileData[ i ]
-                newLine = newLine[ len("T(MeV)/angle:") : ].strip()
-                parsedData = parseLine( newLine )
-                myParticleAngles = parsedData
-                for j in range(0, len(myParticleAngles)-1, 1):
-                    myParticleAngles[j] = float(myParticleAngles[j])
-                myParticleAngles[ j+1 ] = self.__pisaAngleIntFlag
-                myParticleTypes = (len(myParticleAngles)-1)*["Double Differential"]
-                myParticleTypes.append( "Angle Integrated" )
-
-                # Now obtain bin bounds and data (the particleID, types, and labels are created)
-                numSets = len(myParticleTypes)
-                myBins = []
-                numBins = 0
-                myValues = [ [] for j in range(0, numSets, 1) ]
-                numValues = 0
-                while True:
-                    # Obtain bin bounds:
-                    # (obtain new line)
-                    i += 1
-                    parsedLine = parseLine ( self.__fileData [ i ] )
-
-                    # Check for exit:
-                    if ( len(parsedLine) == 0 or parsedLine[0] == "energ." ):
-                        break
-
-                    # Remove the "-" from the first entry:
-                    firstEntry = parsedLine[0]
-                    if ( numSets <= len(parsedLine)-2 ):
-                        # Space between bin start and end
-                        parsedLine[0] = firstEntry[ : firstEntry.find("-") ]
-                    else:
-                        # No space between bin start end end; append bin end to middle of list
-                        parsedLine = parseLine( firstEntry, "-") + parsedLine[1 : ]
-
-                    # Convert parsed line to floats:
-                    for j in range(0, len(parsedLine), 1):
-                        try:
-                            parsedLine[j] = float(parsedLine[j])
-                        except:
-                            self.__write.message = "Failed to convert line element to float (" + parsedLine[j] + ")"
-                            self.__write.print(1, 2)
-                            parsedLine[j] = 0.0
-
-                    # Bin bounds are now contained in "parsedLine[0]" and "parsedLine[1]"
-                    if ( numBins == 0 ):
-                        # Set base bin:
-                        myBins.append( parsedLine[0] )
-                    else:
-                        # Verify bin start matches last bin's end, if not then create empty bin here
-                        if ( not parsedLine[0] == myBins[ numBins ] ):
-                            myBins.append( parsedLine[0] )
-                            numBins += 1
-                            # Set bin value to 0 for all bins:
-                            for j in range(0, numSets, 1):
-                                myValues[j].append( 0.00 )   # Set bin value to 0
-                            numValues += 1
-
-                    # Set end of bin:
-                    myBins.append( parsedLine[1] )
-                    numBins += 1
-
-                    # Set value for each of the bins:
-                    for j in range(0, numSets, 1):
-                        myValues[j].append( parsedLine[j+2] )
-
-                # Reached end of data table; no more data (construct particle histograms)
-                # Create particle object:
-                self.__write.message = "\t\t\tStoring PISA histogram data for particle \"%s\"..." % (particleID)
-                self.__write.print(2, 5)
-                thisParticle = gsmData.ParticlePISAData(particleID, self.__write)
-
-                # Create and append histogram data:
-                for j in range(0, numSets, 1):
-                    newHistogram = gsmData.Histogram(myParticleTypes[j], myParticleAngles[j], myBins, myValues[j], self.__write)
-                    thisParticle.addHistogram( newHistogram )
-
-                # Add particle to the list:
-                self.__pisaData.addParticle(thisParticle)
-
-            elif ( dataLine.startswith(__dataFlags[1]) ):
-                # Advance 2 lines to where the data is:
-                i += 2
-                dataLine = self.__fileData[i].strip().lower()
-
-                # Obtain particle identifiers:
-                parsedLine = parseLine( dataLine )
-                particleID = []
-                for j in range(1, len(parsedLine), 1):
-                    particleID.append( parsedLine[j] )
-
-                # Obtain data:
-                numSets = len(particleID)
-                myBins = []
-                numBins = 0
-                myValues = [ [] for j in range(0, numSets, 1) ]
-                numValues = 0
-                while( True ):
-
-                    # Obtain line's data:
-                    i += 1
-                    dataLine = self.__fileData[i].strip().lower()
-
-                    # Exit if end of set was found:
-                    if ( dataLine.startswith("int. x sec") or dataLine.startswith("int. xsec") ):
-                        break
-
-                    # Get bin bounds:
-                    lowerBin = dataLine[ : dataLine.find("-") ]
-                    parsedLine = parseLine( dataLine[ dataLine.find("-") + 1 : ] )
-                    upperBin = parsedLine[0]
-                    del parsedLine[0]
-
-                    # Convert all values to floats:
-                    try:
-                        lowerBin = float(lowerBin)
-                    except:
-                        self.__write.message = "Unable to convert lower bin (%s) to a float for angular distributions." % lowerBin
-                        self.__write.print(1, 2)
-                        lowerBin = 0
-                    try:
-                        upperBin = float(upperBin)
-                    except:
-                        self.__write.message = "Unable to convert upper bin (%s) to a float for angular distributions." % upperBin
-                        self.__write.print(1, 2)
-                        upperBin = lowerBin
-                    for j in range(0, len(parsedLine), 1):
-                        try:
-                            parsedLine[j] = float( parsedLine[j] )
-                        except:
-                            self.__write.message = "Unable to convert histogram value (%s) to a float for angular distributions." % (parsedLine[j])
-                            self.__write.print(1, 2)
-
-                    # Add a bin:
-                    if ( numBins == 0 ):
-                        # Set base bin:
-                        myBins.append( lowerBin )
-                    else:
-                        # Verify bin start matches last bin's end, if not then create empty bin here
-                        if ( not lowerBin == myBins[ numBins ] ):
-                            myBins.append( lowerBin )
-                            numBins += 1
-                            # Set bin value to 0 for all bins:
-                            for j in range(0, numSets, 1):
-                                myValues[j].append( 0.00 )   # Set bin value to 0
-                            numValues += 1
-                    myBins.append( upperBin )
-                    numBins += 1
-
-                    # Set the value for the bin:
-                    for j in range(0, min(numSets, len(parsedLine)), 1):
-                        myValues[j].append( parsedLine[j] )
-                    numValues += 1
-
-                # Now apply histograms and add to existing particles:
-                for j in range(0, numSets, 1):
-                    self.__write.message = "\t\t\tStoring PISA energy integrated data for particle \"%s\"..." % (particleID[j])
-                    self.__write.print(2, 5)
-
-                    # Create histogram object, add to PISA data object:
-                    theHistogram = gsmData.Histogram("energy integrated", self.__pisaEnergyIntFlag, myBins, myValues[j], self.__write)
-                    self.__pisaData.addParticleHistogram(particleID[j], theHistogram)
+        # Obtain particle identifiers (first column is the angle):
+        particleID = parseLine( tableData[ __tableStart-1 ].lower() )[1 : ]
+        numSets = len(particleID)
+
+        # Obtain data:
+        tableRows = tableData[ __tableStart : ]
+        if ( len(tableRows) == 0 or numSets == 0 ):
+            self.__write.message = "No PISA energy integrated data exists in the table."
+            self.__write.print(1, 2)
+            return
+        myBins, myValues = _readBinnedTable( tableRows, numSets, "PISA energy integrated", self.__write )
+
+        # Now apply histograms and add to existing particles (all histograms share the table's bins):
+        for j in range(0, numSets, 1):
+            self.__write.message = "\t\t\tStoring PISA energy integrated data for particle \"%s\"..." % (particleID[j])
+            self.__write.print(2, 5)
 
+            # Create histogram object, add to PISA data object:
+            theHistogram = gsmData.Histogram("energy integrated", self.__pisaEnergyIntFlag, myBins, myValues[:, j], self.__write)
+            self.__pisaData.addParticleHistogram(particleID[j], theHistogram)
 
         return
 
+    def update(self, endOfFile = False):
+        """
+        Scans the bytes appended to a followed file since the last update,
+        parsing every section completed by them. Returns the sections, as
+        (kind, key), parsed by this update.
+        -endOfFile (False): Treats the file as complete, closing all sections
+        \tthat are still open (the file is no longer followed afterwards).
+        """
+        changedSections = []
+        if ( not self.__follow ):
+            self.__write.message = "File \"%s\" is not being followed; cannot update its data." % (self.__fileName)
+            self.__write.print(1, 2)
+            return changedSections
+
+        if ( not fileExists( self.__fileName ) ):
+            self.__write.message = "File \"%s\" no longer exists. Cannot update data." % (self.__fileName)
+            self.__write.print(1, 2)
+            return changedSections
+        with open(self.__fileName, 'rb') as theFile:
+            # Start over if the file was rewritten:
+            theFile.seek( 0, 2 )
+            if ( theFile.tell() < self.__readOffset ):
+                self.__write.message = "File \"%s\" was truncated; parsing the file again." % (self.__fileName)
+                self.__write.print(1, 2)
+                fileName = self.__fileName
+                self.__resetMembers()
+                self.__fileName = fileName
+                self.__fileRead = True
+                self.__scanner = _SectionScanner( self.__write )
+            theFile.seek( self.__readOffset )
+            newData = theFile.read()
+
+        # Only complete lines are scanned (a partially written line is read again next update):
+        if ( not endOfFile ):
+            newData = newData[ : newData.rfind(b"\n")+1 ]
+        newLines = newData.split(b"\n")
+        if ( newData.endswith(b"\n") or len(newData) == 0 ):
+            del newLines[-1]
+
+        # Feed the new lines to the scanner, parsing each completed section:
+        lineOffset = self.__readOffset
+        for dataLine in newLines:
+            for section in self.__scanner.addLine( dataLine.decode('ascii', errors='ignore').strip(), lineOffset ):
+                self.__addSection( section )
+                changedSections.append( (section.kind, section.key) )
+            lineOffset += len( dataLine ) + 1
+        lineOffset = min( lineOffset, self.__readOffset + len(newData) )
+        self.__readOffset = lineOffset
+
+        if ( endOfFile ):
+            for section in self.__scanner.finish( lineOffset ):
+                self.__addSection( section )
+                changedSections.append( (section.kind, section.key) )
+            self.__follow = False
+        self.__fileLen = self.__scanner.queryNumLines()
+
+        if ( len(changedSections) > 0 ):
+            self.__write.message = "Parsed %d new section(s) of \"%s\"." % (len(changedSections), self.__fileName)
+            self.__write.print(2, 3)
+            if ( self.__leanMemory ):
+                self.releaseRawData()
+
+        return changedSections
+
+    def releaseRawData(self):
+        """
+        Parses any remaining sections, then discards all raw text of the file
+        (the file's lines, its mapping, and the lines kept by the data objects).
+        Returns the number of bytes released.
+        \tNOTE: The lines of sections still being written to a followed file
+        \t      are kept.
+        """
+        # Parse all located sections:
+        for kind in self.__sections:
+            for section in self.__sections[ kind ]:
+                if ( not section.parsed ):
+                    self.__parseSection( section )
+        self.__lazyParse = False
+
+        # Discard the file's text:
+        releasedBytes = textSize( self.__fileData )
+        self.__fileData = []
+        if ( self.__mappedData is not None ):
+            releasedBytes += len( self.__mappedData )
+            self.__mappedData.close()
+            self.__mappedData = None
+
+        # Discard the lines kept by each data object:
+        for parIndx in range(0, self.__numParticleData, 1):
+            releasedBytes += self.__particleData[parIndx].releaseFileData()
+        if ( self.__yieldData is not None ):
+            releasedBytes += self.__yieldData.releaseFileData()
+
+        self.__releasedBytes += releasedBytes
+        self.__write.message = "Released %.3f MB of raw text from \"%s\" (%.3f MB in total)." % (releasedBytes/1.0E6, self.__fileName, self.__releasedBytes/1.0E6)
+        self.__write.print(2, 2)
+
+        return releasedBytes
+
+    def queryReleasedBytes(self):
+        """Returns the number of bytes of raw text discarded after parsing"""
+        return self.__releasedBytes
+
+    def isFollowed(self):
+        """Returns if the file is being followed"""
+        return self.__follow
+
+    def queryAccessedSections(self):
+        """Returns the sections, as (kind, key), requested by the client (a key of None includes all keys)"""
+        return set( self.__accessedSections )
+
+    def clearAccessedSections(self):
+        """Clears the record of the sections requested by the client"""
+        self.__accessedSections = set()
+
+        return
+
+    def exportData(self, exportDir):
+        """Exports all parsed data to a columnar directory of arrays (see exportModule); returns if the data was exported"""
+        for kind in self.__sections:
+            self.__loadSections( kind )
+
+        parsedData = {
+            "pisa": self.__pisaData,
+            "particleData": self.__particleData,
+            "yields": self.__yieldData
+        }
+        return exportModule.exportData( exportDir, self.__fileName, parsedData, self.__write )
+
     # For retrieving data:
     def getPISAData(self):
         """Returns the PISA object to the user"""
+        self.__loadPISA()
         return self.__pisaData
 
     def getPISAParticle(self, particleID):
         """Returns the particle's PISA data"""
+        self.__loadPISA( particleID )
         return ( self.__pisaData.getParticle(particleID) )
 
-    def getPISAParticleHistogram(self, particleID, someAngle):
+    def getPISAParticleHistogram(self, particleID, someAngle, tolerance = gsmData.angleTolerance):
         """Returns the specific histogram associated with the particle's PISA data"""
-        return ( self.__pisaData.getParticleHistogram(particleID, someAngle) )
+        self.__loadPISA( particleID )
+        return ( self.__pisaData.getParticleHistogram(particleID, someAngle, tolerance) )
+
+    def getPISAParticleHistograms(self, particleID):
+        """Returns all histograms (ordered by angle) of the particle's PISA data"""
+        self.__loadPISA( particleID )
+        return ( self.__pisaData.getParticleHistograms(particleID) )
+
+    def queryParticleIDs(self):
+        """Returns the particles with particle data (energy spectra) in the output file"""
+        self.__loadSections( _SectionScanner.particleKind )
+        return [ self.__particleData[parIndx].queryParticleID() for parIndx in range(0, self.__numParticleData, 1) ]
 
     def getParticleData(self, particleID):
         """Returns the particle data requested, if exists"""
+        self.__loadSections( _SectionScanner.particleKind, particleID )
         theParData = None
         for parIndx in range(0, self.__numParticleData, 1):
             if ( particleID == self.__particleData[parIndx].queryParticleID() ):
@@ -481,6 +948,7 @@ class GSMOutput:
 
     def queryYieldData(self):
         """Returns the yield data to the user/client"""
+        self.__loadSections( _SectionScanner.yieldKind )
         yieldData = self.__yieldData
         if ( yieldData is None ):
             self.__write.message = "Cannot query: no yield data was present in the file."
@@ -0,0 +1,137 @@
+
+################################################################################
+# File documentation:
+"""
+This module contains the parse service class, which parses each simulation
+output file once and provides the parsed data to any number of clients.
+
+The service is run in a manager process (see "ParseServiceManager") so that
+all worker processes of the driver share one set of parsed outputs. Parsed
+outputs are stored as packed (pickled) data; each client unpacks its own copy,
+leaving the stored data unchanged.
+"""
+################################################################################
+# EDIT LOG
+# ------------------------------------------------------------------------------
+# CMJ, XCP-3 (02/2019)
+#
+#
+################################################################################
+# IMPORTS:
+import sys
+import os.path as path
+import threading
+from multiprocessing.managers import BaseManager
+
+# Modules:
+from printClass import Print
+from outputClass import GSMOutput
+import cacheModule
+
+# VERSION Number:
+__version__ = "1.0.0"
+
+
+def parseSimulation(simArgs):
+    """Parses a simulation file, given as (fileName, cacheDir); returns the packed output object"""
+    fileName, cacheDir = simArgs
+    return cacheModule.packData( GSMOutput(fileName, Print(), False, cacheDir, False) )
+
+
+class ParseService:
+    """
+    The \"ParseService\" object stores the packed output of every simulation
+    file it has parsed. Requests for a file that was already parsed are
+    \"hits\"; all other requests are \"misses\" and cause the file to be parsed.
+    """
+
+    def __init__(self):
+        """Constructor for the parse service"""
+        self.__outputs = {}
+        self.__numHits = 0
+        self.__numMisses = 0
+        # (The manager serves each client from its own thread)
+        self.__lock = threading.Lock()
+
+        return
+
+    def __outputKey(self, fileName, cacheDir):
+        """Returns the key of a simulation file"""
+        return ( path.abspath(fileName), cacheDir )
+
+    def storeOutput(self, fileName, cacheDir, packedOutput):
+        """Stores the packed output of a file parsed by a client (counted as a miss)"""
+        with self.__lock:
+            theEntry = self.__outputs.get( self.__outputKey(fileName, cacheDir), None )
+            self.__outputs[ self.__outputKey(fileName, cacheDir) ] = packedOutput
+            self.__numMisses += 1
+
+        # (Release any requests waiting for the file)
+        if ( isinstance(theEntry, threading.Event) ):
+            theEntry.set()
+
+        return
+
+    def queryOutput(self, fileName, cacheDir = None):
+        """
+        Returns the packed output of a file, parsing the file if needed. The
+        lock is only held to look up or store an output; while a file is parsed
+        its entry is an event, so that other requests for the same file wait for
+        it (and only it) to be parsed.
+        """
+        theKey = self.__outputKey( fileName, cacheDir )
+        while ( True ):
+            parseEvent = None
+            with self.__lock:
+                theEntry = self.__outputs.get( theKey, None )
+                if ( theEntry is None ):
+                    parseEvent = threading.Event()
+                    self.__outputs[ theKey ] = parseEvent
+                    self.__numMisses += 1
+                elif ( not isinstance(theEntry, threading.Event) ):
+                    self.__numHits += 1
+                    return theEntry
+
+            if ( parseEvent is None ):
+                # (The file is being parsed for another request; a failed parse is retried)
+                theEntry.wait()
+                continue
+
+            # Parse the file (without holding the lock):
+            try:
+                packedOutput = parseSimulation( (fileName, cacheDir) )
+            except:
+                with self.__lock:
+                    del self.__outputs[ theKey ]
+                parseEvent.set()
+                raise
+            with self.__lock:
+                self.__outputs[ theKey ] = packedOutput
+            parseEvent.set()
+
+            return packedOutput
+
+    def hasOutput(self, fileName, cacheDir = None):
+        """Returns if the output of a file is stored"""
+        theEntry = self.__outputs.get( self.__outputKey(fileName, cacheDir), None )
+        return ( theEntry is not None and not isinstance(theEntry, threading.Event) )
+
+    def queryNumFiles(self):
+        """Returns the number of stored outputs"""
+        with self.__lock:
+            return len( [theEntry for theEntry in self.__outputs.values() if not isinstance(theEntry, threading.Event)] )
+
+    def queryNumHits(self):
+        """Returns the number of requests served from stored outputs"""
+        return self.__numHits
+
+    def queryNumMisses(self):
+        """Returns the number of requests that required parsing a file"""
+        return self.__numMisses
+
+
+class ParseServiceManager(BaseManager):
+    """Manager process that hosts a shared \"ParseService\" object"""
+    pass
+
+ParseServiceManager.register("ParseService", ParseService)
@@ -22,6 +22,7 @@ import matplotlib.pyplot as plt
 from pylab import rcParams
 import sys
 import time
+import numpy as np
 
 # MODULES:
 from printClass import Print
@@ -43,6 +44,22 @@ plt.rc('font', **{'family': 'serif'})   # Which font to use
 plt.rc('axes', axisbelow=True)
 
 
+# Finds the limits of a set of values for dynamic axes
+def _dynamicLimits(theValues):
+    """Returns the lowest, second lowest unique, and highest of the values (infinite values if not present)"""
+    uniqueValues = np.unique( np.asarray(theValues, dtype=float) )
+    tempMin  = float("inf")
+    temp2Min = float("inf")
+    tempMax  = float("-inf")
+    if ( uniqueValues.size > 0 ):
+        tempMin = float(uniqueValues[0])
+        tempMax = float(uniqueValues[-1])
+    if ( uniqueValues.size > 1 ):
+        temp2Min = float(uniqueValues[1])
+
+    return tempMin, temp2Min, tempMax
+
+
 # Contains the figure and axis objects to use when plotting
 class _BaseFigure:
     """The \"_BaseFigure\" object contains the figure and axis object to be used
@@ -445,8 +462,8 @@ class _AxisLimits(_BaseFigure):
     -setYScale         ( Sets scale of the Y-axis, being linear, log, or symlog [logit not allowed] )
     -setXLims          ( Allows user to specify X-axis bounds [low, high]; dynamic X-axis is turned off )
     -setYLims          ( Allows user to specify Y-axis bounds [low, high]; dynamic Y-axis is turned off )
-    -updateDynamicX    ( Given a list of X-values, determine the lowest and largest valid values [different by scale type] )
-    -updateDynamicY    ( Given a list of X-values, determine the lowest and largest valid values [different by scale type] )
+    -updateDynamicX    ( Given a list or array of X-values, determine the lowest and largest valid values [different by scale type] )
+    -updateDynamicY    ( Given a list or array of Y-values, determine the lowest and largest valid values [different by scale type] )
     -applyAxisLimits   ( Applies the X/Y scale, X/Y axis range [based on dynamicX/Y or user specified], and the grid )
     ----------------------------------------------------------------------------
 
@@ -759,26 +776,15 @@ class _AxisLimits(_BaseFigure):
     def updateDynamicX(self, xValues):
         """Updates the min/max X values for a dynamic X-axis."""
 
-        # Ensure input parameters is a list:
-        if ( not isinstance(xValues, list) ):
-            self.__write.message = "A list of floats must be used to update dynamic X limits. Limits will not be updated."
+        # Ensure input parameters is a list or array:
+        if ( not isinstance(xValues, (list, tuple, np.ndarray)) ):
+            self.__write.message = "A list or array of floats must be used to update dynamic X limits. Limits will not be updated."
             self.__write.print(1, 3)
             return
 
-        # Find min/max:
-        tempMin  = float("inf")
-        temp2Min = float("inf")
-        for i in range(0, len(xValues), 1):
-            # Find the lowest and the second lowest unique value:
-            if ( xValues[i] < tempMin ):
-                temp2Min = tempMin
-                tempMin = xValues[i]
-            elif ( (xValues[i] < temp2Min) and (not xValues[i] == tempMin)):
-                temp2Min = xValues[i]
-
-            # Find maximum value:
-            self.__maxDynamicX = max( self.__maxDynamicX, xValues[i] )
-
+        # Find min/max (lowest and second lowest unique values):
+        tempMin, temp2Min, tempMax = _dynamicLimits( xValues )
+        self.__maxDynamicX = max( self.__maxDynamicX, tempMax )
 
         # Use lowest or second lowest value (depending on scale)
         if ( self.__xScale == self.__validScales[0] ):
@@ -794,25 +800,15 @@ class _AxisLimits(_BaseFigure):
     def updateDynamicY(self, yValues):
         """Updates the min/max Y values for a dynamic X-axis."""
 
-        # Ensure input parameters is a list:
-        if ( not isinstance(yValues, list) ):
-            self.__write.message = "A list of floats must be used to update dynamic Y limits. Limits will not be updated."
+        # Ensure input parameters is a list or array:
+        if ( not isinstance(yValues, (list, tuple, np.ndarray)) ):
+            self.__write.message = "A list or array of floats must be used to update dynamic Y limits. Limits will not be updated."
             self.__write.print(1, 3)
             return
 
-        # Find min/max:
-        tempMin  = float("inf")
-        temp2Min = float("inf")
-        for i in range(0, len(yValues), 1):
-            # Find the lowest and the second lowest unique value:
-            if ( yValues[i] < tempMin ):
-                temp2Min = tempMin
-                tempMin = yValues[i]
-            elif ( (yValues[i] < temp2Min) and (not yValues[i] == tempMin)):
-                temp2Min = yValues[i]
-
-            # Find maximum value:
-            self.__maxDynamicY = max( self.__maxDynamicY, yValues[i] )
+        # Find min/max (lowest and second lowest unique values):
+        tempMin, temp2Min, tempMax = _dynamicLimits( yValues )
+        self.__maxDynamicY = max( self.__maxDynamicY, tempMax )
 
         # Use lowest or second lowest value (depending on scale)
         if ( self.__yScale == self.__validScales[0] ):
@@ -932,21 +928,22 @@ class PlotClass(_PlotLabeling, _AxisLimits):
 
     def __findLastNonZeroValueIndex(self, someNumbers):
         """This function returns the index of the last non-zero valued entry
-        in a list or tuple."""
+        in a list, tuple, or array (the first entry is always kept)."""
         lastIndex = None
 
-        # Ensure the numbers are a list/tuple of floats or ints:
-        if ( not isinstance(someNumbers, (list, tuple)) ):
-            self.__write.message = "Cannot find the last non-zero valued entry in any type except lists or tuples."
+        # Ensure the numbers are a list/tuple/array of floats or ints:
+        if ( not isinstance(someNumbers, (list, tuple, np.ndarray)) ):
+            self.__write.message = "Cannot find the last non-zero valued entry in any type except lists, tuples, or arrays."
             self.__write.print(1, 2)
             return lastIndex
 
         # Find last non-zero valued index:
-        lastValidIndex = len(someNumbers) - 1
-        for i in range(0, lastValidIndex, 1):
-            lastIndex = lastValidIndex-i
-            if ( someNumbers[lastIndex] > 0 ):
-                break
+        if ( len(someNumbers) > 1 ):
+            positiveIndx = np.flatnonzero( np.asarray(someNumbers[1 : ]) > 0 )
+            if ( len(positiveIndx) > 0 ):
+                lastIndex = int( positiveIndx[-1] ) + 1
+            else:
+                lastIndex = 1
 
         return lastIndex
 
@@ -1090,67 +1087,66 @@ class PlotClass(_PlotLabeling, _AxisLimits):
             yScale = 1.00
 
         # Validate the types of the bins and values:
-        if ( not isinstance(myBins, list) ):
-            self.__write.message = "The passed in histogram bins must be a list."
+        if ( not isinstance(myBins, (list, tuple, np.ndarray)) ):
+            self.__write.message = "The passed in histogram bins must be a list, tuple, or array."
             self.__write.print(1, 2)
             self.__write.message = "   Unable to create histogram."
             self.__write.print(1, 2)
             return
-        if ( not isinstance(myValues, list) ):
-            self.__write.message = "The passed in histogram values must be a list."
+        if ( not isinstance(myValues, (list, tuple, np.ndarray)) ):
+            self.__write.message = "The passed in histogram values must be a list, tuple, or array."
             self.__write.print(1, 2)
             self.__write.message = "   Unable to create histogram."
             self.__write.print(1, 2)
             return
+        if ( len(myBins) < 2 or len(myValues) == 0 ):
+            self.__write.message = "The passed in histogram has no bins or values. Unable to create histogram."
+            self.__write.print(1, 2)
+            return
 
-        # Shift and scale histogram data accordingly:
+        # Shift and scale histogram data accordingly (into new arrays; the client's data is not modified):
         # (shift and scale bins)
+        myBins = np.asarray( myBins, dtype=float )
         shift = 0.00
         if ( myBins[0] < 0.00 ):
             shift = -myBins[0]
             self.__write.message = "Histogram bins values will be shifted up by (%f) to ensure physicality." % (shift)
             self.__write.print(2, 2)
-        for i in range(0, len(myBins), 1):
-            myBins[i] += shift
-            myBins[i] *= xScale
+        myBins = (myBins + shift) * xScale
         # (shift and scale values)
-        shift = 0.00
-        for i in range(0, len(myValues), 1):
-            shift = min(shift, myValues[i] )
+        myValues = np.asarray( myValues, dtype=float )
+        shift = min( 0.00, myValues.min() )
         if (shift < 0.00 ):
             shift = abs(shift)
             self.__write.message = "Histogram bins values will be shifted up by (%f) to ensure physicality." % (shift)
             self.__write.print(2, 2)
-        else:
-            shift = 0.00
-        for i in range(0, len(myValues), 1):
-            myValues[i] += shift
-            myValues[i] *= yScale
+        myValues = (myValues + shift) * yScale
 
         # Determine the last value that has non-zero entry:
         lastValueIndx = self.__findLastNonZeroValueIndex( myValues )
+        if ( lastValueIndx is None ):
+            lastValueIndx = len(myValues) - 1
 
         # Use the minimum number of applicable data points (base off num. bins/num. values):
         numValidData = min( lastValueIndx+1, len(myBins)-1 )
 
         # Obtain bin bounds and associated values:
-        plottedBins   = []
-        plottedValues = []
-        plottedBins.append( myBins[0] )
-        for i in range(0, numValidData, 1):
-            # Ensure positive (or non-zero) bin widths:
-            if ( myBins[i+1] < myBins[i] ):
-                self.__write.message = "Negative bin-width is not valid (range=[%.2f, %.2f). Using bin width of 0." % (myBins[i], myBins[i+1])
-                self.__write.print(1, 2)
-                myBins[i+1] = myBins[i]
-            plottedBins.append( myBins[i+1] )
-
-            # Ensure positive values:
-            if ( myValues[i] < 0 ):
-                myValues[i] = 0
-                self.__write.message = "Values for histogram bins cannot be negative. Using value of (%f)." % (myValues[i])
-                self.__write.print(1, 2)
-            plottedValues.append( myValues[i] )
+        # (ensure positive (or non-zero) bin widths)
+        plottedBins = myBins[ : numValidData+1]
+        decreasingBins = np.flatnonzero( plottedBins[1 : ] < plottedBins[ : -1] )
+        if ( len(decreasingBins) > 0 ):
+            theIndx = decreasingBins[0]
+            self.__write.message = "Negative bin-width is not valid for %d bin(s) (e.g. range=[%.2f, %.2f)). Using bin width of 0." % (len(decreasingBins), plottedBins[theIndx], plottedBins[theIndx+1])
+            self.__write.print(1, 2)
+            plottedBins = np.maximum.accumulate( plottedBins )
+        plottedBins = plottedBins.tolist()
+        # (ensure positive values)
+        plottedValues = myValues[ : numValidData]
+        if ( (plottedValues < 0).any() ):
+            plottedValues = np.maximum( plottedValues, 0.00 )
+            self.__write.message = "Values for histogram bins cannot be negative. Using value of (%f)." % (0.00)
+            self.__write.print(1, 2)
+        plottedValues = plottedValues.tolist()
 
         # Obtain min/max X/Y:
         self.updateDynamicX( plottedBins )
@@ -1292,12 +1288,12 @@ class PlotClass(_PlotLabeling, _AxisLimits):
 
         # Verify inputs are valid:
         invalidInput = False
-        if ( not isinstance(xVals, list) ):
-            self.__write.message = "Scatter plot requires a list of numbers for its X values."
+        if ( not isinstance(xVals, (list, tuple, np.ndarray)) ):
+            self.__write.message = "Scatter plot requires a list or array of numbers for its X values."
             self.__write.print(1, 2)
             invalidInput = True
-        if ( not isinstance(yVals, list) ):
-            self.__write.message = "Scatter plot requires a list of numbers for its Y values."
+        if ( not isinstance(yVals, (list, tuple, np.ndarray)) ):
+            self.__write.message = "Scatter plot requires a list or array of numbers for its Y values."
             self.__write.print(1, 2)
             invalidInput = True
         if ( invalidInput ):
@@ -1320,10 +1316,8 @@ class PlotClass(_PlotLabeling, _AxisLimits):
         if ( self.__numPlotTypes > 0 ):
             self.__write.message = "Data for \"%s\" is being scaled by 10^(%.1f) for clarity." % (myLabel, yScaleFactor)
             self.__write.print(2, 2)
-        for i in range(0, len(xVals), 1):
-            xVals[i] = xVals[i] * xScale
-        for i in range(0, len(yVals), 1):
-            yVals[i] = yVals[i] * yScale
+        xVals = np.asarray(xVals, dtype=float) * xScale
+        yVals = np.asarray(yVals, dtype=float) * yScale
 
         # Update dynamic min/max limits for X and Y:
         self.updateDynamicX( xVals )
@@ -1357,12 +1351,12 @@ class PlotClass(_PlotLabeling, _AxisLimits):
 
         # Verify inputs are valid:
         invalidInput = False
-        if ( not isinstance(xVals, list) ):
-            self.__write.message = "Error bar plot requires a list of numbers for its X values."
+        if ( not isinstance(xVals, (list, tuple, np.ndarray)) ):
+            self.__write.message = "Error bar plot requires a list or array of numbers for its X values."
             self.__write.print(1, 2)
             invalidInput = True
-        if ( not isinstance(yVals, list) ):
-            self.__write.message = "Error bar plot requires a list of numbers for its Y values."
+        if ( not isinstance(yVals, (list, tuple, np.ndarray)) ):
+            self.__write.message = "Error bar plot requires a list or array of numbers for its Y values."
             self.__write.print(1, 2)
             invalidInput = True
         if ( invalidInput ):
@@ -1385,16 +1379,12 @@ class PlotClass(_PlotLabeling, _AxisLimits):
         if ( self.__numPlotTypes > 0 ):
             self.__write.message = "Exp. data for \"%s\" is being scaled by 10^(%.1f) for clarity." % (myLabel, yScaleFactor)
             self.__write.print(2, 2)
-        for i in range(0, len(xVals), 1):
-            xVals[i] = xVals[i] * xScale
-        if( not xErr == None):
-            for i in range(0, len(xErr), 1):
-                xErr[i] = xErr[i] * xScale
-        for i in range(0, len(yVals), 1):
-            yVals[i] = yVals[i] * yScale
-        if( not yErr == None):
-            for i in range(0, len(yErr), 1):
-                yErr[i] = yErr[i] * yScale
+        xVals = np.asarray(xVals, dtype=float) * xScale
+        if( xErr is not None ):
+            xErr = np.asarray(xErr, dtype=float) * xScale
+        yVals = np.asarray(yVals, dtype=float) * yScale
+        if( yErr is not None ):
+            yErr = np.asarray(yErr, dtype=float) * yScale
 
         # Update dynamic min/max limits for X and Y:
         self.updateDynamicX( xVals )
@@ -110,3 +110,7 @@ class Print:
         """Prints out messages based on verbosity"""
         self.__print(msgType, verbFlag, self.__verboseLimit, self.message)
         self.message = ""   # Reset message
+
+    def queryVerboseLimit(self):
+        """Returns the verbosity limit of the object"""
+        return self.__verboseLimit